@@ -1,45 +1,256 @@
-from flask import Flask, render_template, request, jsonify
-import pandas as pd
+from flask import Flask, Response, g, render_template, request, jsonify, stream_with_context
 import numpy as np
-from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import accuracy_score
-from sklearn.linear_model import SGDClassifier
-import random
+import base64
+import gc
+import gzip
+import importlib
 import io
+import itertools
+import json
+import hashlib
+import multiprocessing
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
 
 app = Flask(__name__)
 
 
+def issparse(X):
+    """
+    scipy.sparse.issparse without importing scipy, which costs ~170 ms and
+    is left to the sparse code paths: until it is imported, nothing can be
+    a sparse matrix.
+    """
+    sparse = sys.modules.get("scipy.sparse")
+    return sparse is not None and sparse.issparse(X)
+
+
+# ---------- Instrumentation ----------
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+SIZE_BUCKETS = (10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+
+class MetricsRegistry:
+    """
+    Minimal thread-safe counters, gauges and histograms, rendered in the
+    Prometheus text exposition format by the /metrics endpoint.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._meta = {}
+        self._values = {}
+
+    def describe(self, name, kind, help_text, buckets=DEFAULT_BUCKETS):
+        self._meta[name] = (kind, help_text, tuple(buckets))
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def inc(self, name, value=1, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+
+    def set(self, name, value, **labels):
+        with self._lock:
+            self._values[self._key(name, labels)] = value
+
+    def observe(self, name, value, count=1, **labels):
+        """Record value count times in a histogram."""
+        buckets = self._meta[name][2]
+        key = self._key(name, labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(buckets), 0.0, 0]
+            for i, bound in enumerate(buckets):
+                if value <= bound:
+                    state[0][i] += count
+            state[1] += value * count
+            state[2] += count
+
+    def render(self):
+        def fmt(labels, extra=()):
+            pairs = list(labels) + list(extra)
+            if not pairs:
+                return ""
+            return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+        with self._lock:
+            items = sorted(self._values.items())
+        lines = []
+        for name, (kind, help_text, buckets) in sorted(self._meta.items()):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for (metric, labels), value in items:
+                if metric != name:
+                    continue
+                if kind == "histogram":
+                    counts, total, count = value
+                    for bound, bucket_count in zip(buckets, counts):
+                        lines.append(f"{name}_bucket{fmt(labels, [('le', bound)])} {bucket_count}")
+                    lines.append(f"{name}_bucket{fmt(labels, [('le', '+Inf')])} {count}")
+                    lines.append(f"{name}_sum{fmt(labels)} {total}")
+                    lines.append(f"{name}_count{fmt(labels)} {count}")
+                else:
+                    lines.append(f"{name}{fmt(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+metrics.describe("http_requests_total", "counter", "HTTP requests by endpoint, method and status.")
+metrics.describe("http_request_duration_seconds", "histogram", "HTTP request latency by endpoint.")
+metrics.describe("phase_duration_seconds", "histogram", "Time spent per processing phase occurrence.")
+metrics.describe("ga_fitness_fits_total", "counter", "Fitness model fits performed, by evaluation mode.")
+metrics.describe("ga_fitness_fit_seconds", "histogram", "Latency of one fitness fit (batch average for pools).")
+metrics.describe("dataset_rows", "histogram", "Rows of each parsed dataset.", SIZE_BUCKETS)
+metrics.describe("dataset_features", "histogram", "Feature columns of each parsed dataset.", SIZE_BUCKETS)
+metrics.describe("dataset_store_bytes", "gauge", "In-memory bytes held by the dataset store.")
+metrics.describe("dataset_store_disk_bytes", "gauge", "Bytes of memory-mapped dataset files held by the dataset store.")
+
+
+class PhaseTimer:
+    """
+    Accumulates wall-clock time per named phase for one request; every
+    occurrence is also recorded in the phase_duration_seconds histogram.
+    """
+
+    def __init__(self):
+        self.phases = {}
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name, seconds):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+        metrics.observe("phase_duration_seconds", seconds, phase=name)
+
+    def as_dict(self):
+        return {name: round(seconds, 4) for name, seconds in self.phases.items()}
+
+
 # ---------- GA Core ----------
-def create_random_chromosome(feature_count, true_ratio=0.3):
+def init_population_array(pop_size, feature_count, true_ratio=0.7, rng=None):
+    """
+    Build a (pop_size x feature_count) uint8 population in one vectorized step.
+
+    Every row has exactly int(feature_count * true_ratio) genes set, at
+    positions drawn uniformly at random. Like the other population helpers,
+    rng may be a numpy Generator, an int seed or None for fresh entropy.
+    """
+    rng = np.random.default_rng(rng)
     n_true = int(feature_count * true_ratio)
-    n_false = feature_count - n_true
-    chromosome = [1] * n_true + [0] * n_false
-    random.shuffle(chromosome)
-    return chromosome
+    ranks = rng.random((pop_size, feature_count)).argsort(axis=1)
+    return (ranks < n_true).astype(np.uint8)
+
+
+def crossover_arrays(parents_a, parents_b, rate, rng=None):
+    """
+    One-point crossover applied row-wise to two (n x feature_count) arrays.
+
+    Each pair is crossed with probability rate at a cut point in
+    [1, feature_count - 1]; uncrossed pairs are copied unchanged.
+    """
+    rng = np.random.default_rng(rng)
+    n_pairs, feature_count = parents_a.shape
+    crossed = rng.random(n_pairs) < rate
+    if feature_count < 2:
+        crossed[:] = False
+        points = np.ones(n_pairs, dtype=np.int64)
+    else:
+        points = rng.integers(1, feature_count, size=n_pairs)
+    swap = (np.arange(feature_count) >= points[:, None]) & crossed[:, None]
+    return np.where(swap, parents_b, parents_a), np.where(swap, parents_a, parents_b)
+
+
+def mutate_array(population, rate, rng=None):
+    """Flip each gene of a population array independently with probability rate."""
+    rng = np.random.default_rng(rng)
+    flips = rng.random(population.shape) < rate
+    return population ^ flips.astype(population.dtype)
+
+
+def next_generation(population, crossover_rate, mutation_rate, rng=None):
+    """
+    Breed a new population array of the same shape.
+
+    Parents are paired by sampling two distinct rows per pair, then crossed
+    over and mutated; the second child of the last pair is dropped for odd
+    population sizes.
+    """
+    rng = np.random.default_rng(rng)
+    pop_size = population.shape[0]
+    n_pairs = (pop_size + 1) // 2
+    first = rng.integers(0, pop_size, size=n_pairs)
+    second = (first + rng.integers(1, pop_size, size=n_pairs)) % pop_size
+    c1, c2 = crossover_arrays(population[first], population[second], crossover_rate, rng)
+
+    children = np.empty((2 * n_pairs, population.shape[1]), dtype=population.dtype)
+    children[0::2] = c1
+    children[1::2] = c2
+    return mutate_array(children[:pop_size], mutation_rate, rng)
+
+
+def create_random_chromosome(feature_count, true_ratio=0.3, seed=None):
+    return init_population_array(1, feature_count, true_ratio, seed)[0].tolist()
+
 
+def initialize_population(pop_size, feature_count, true_ratio=0.7, seed=None):
+    """List-of-lists population; seed is an int, a Generator or None."""
+    return init_population_array(pop_size, feature_count, true_ratio, seed).tolist()
 
 
-def initialize_population(pop_size, feature_count, true_ratio=0.7):
-    return [create_random_chromosome(feature_count, true_ratio) for _ in range(pop_size)]
+def _has_nan(X):
+    # Sparse matrices only store their nonzeros, so only those need scanning.
+    return bool(np.isnan(X.data if issparse(X) else X).any())
 
 
-def evaluate_fitness(chromosome, X_train, X_test, y_train, y_test):
+def _may_have_nan(*arrays):
+    try:
+        return any(_has_nan(X) for X in arrays)
+    except TypeError:
+        # Non-numeric data; evaluate_fitness handles (and zero-scores) it.
+        return True
+
+
+def evaluate_fitness(chromosome, X_train, X_test, y_train, y_test, check_nan=True):
     """
     Evaluate fitness of a chromosome using logistic regression.
+
+    X_train and X_test may be dense arrays or scipy CSC matrices, for which
+    selecting columns only copies the nonzeros of the selected features.
+    Pass check_nan=False for data already validated (see PreparedDataset)
+    to skip scanning the selected columns on every call.
     """
     try:
-        selected_features = [i for i, gene in enumerate(chromosome) if gene == 1]
-        if not selected_features:
+        selected_features = np.flatnonzero(np.asarray(chromosome) == 1)
+        if selected_features.size == 0:
             return 0.0
 
         X_train_selected = X_train[:, selected_features]
         X_test_selected = X_test[:, selected_features]
 
-        if np.isnan(X_train_selected).any() or np.isnan(X_test_selected).any():
+        if check_nan and (_has_nan(X_train_selected) or _has_nan(X_test_selected)):
             return 0.0
 
+        from sklearn.linear_model import SGDClassifier
+
         model = SGDClassifier(
             loss="log_loss",
             max_iter=200,
@@ -56,19 +267,681 @@ def evaluate_fitness(chromosome, X_train, X_test, y_train, y_test):
 
 
 
-def crossover(p1, p2, rate):
-    if random.random() > rate:
-        return p1[:], p2[:]
-    point = random.randint(1, len(p1) - 1)
-    return p1[:point] + p2[point:], p2[:point] + p1[point:]
+# ---------- Fitness cache ----------
+DEFAULT_FITNESS_CACHE_SIZE = 4096
+FINGERPRINT_CHUNK_ROWS = 65_536
+
+
+def chromosome_key(chromosome):
+    """Pack a 0/1 chromosome into a compact bytes key (8 genes per byte)."""
+    return np.packbits(np.asarray(chromosome, dtype=np.uint8)).tobytes()
+
+
+def split_fingerprint(X_train, X_test, y_train, y_test):
+    """
+    Hash a train/test split so cached fitness values are only reused on the
+    exact data they were computed from.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for arr in (X_train, X_test, y_train, y_test):
+        if issparse(arr):
+            arr = arr.tocsc()
+            digest.update(f"csc{arr.shape}".encode())
+            for part in (arr.data, arr.indices, arr.indptr):
+                digest.update(np.ascontiguousarray(part).tobytes())
+            continue
+        arr = np.asarray(arr)
+        digest.update(str(arr.shape).encode())
+        digest.update(str(arr.dtype).encode())
+        if arr.dtype == object:
+            import pandas as pd
+
+            digest.update(pd.util.hash_array(arr.ravel()).tobytes())
+        else:
+            # Hashed in row blocks so a memory-mapped array is never copied
+            # whole; the digest is the same as for the contiguous array.
+            for start in range(0, max(len(arr), 1), FINGERPRINT_CHUNK_ROWS):
+                digest.update(np.ascontiguousarray(arr[start:start + FINGERPRINT_CHUNK_ROWS]).tobytes())
+    return digest.hexdigest()
+
+
+class FitnessCache:
+    """
+    Bounded LRU cache of chromosome fitness values for a single dataset split.
+
+    Keys are bit-packed chromosomes; the cache is bound to a split fingerprint
+    and clears itself when bound to a different one. It is thread-safe, so
+    concurrent runs on the same split (see build_sweep_response) can share it.
+    """
+
+    def __init__(self, max_size=DEFAULT_FITNESS_CACHE_SIZE, scope=None):
+        self.max_size = max(0, int(max_size))
+        self.scope = scope
+        self._store = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._store)
+
+    def __getstate__(self):
+        # Island epochs ship their cache to worker processes; locks don't pickle.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def bind(self, scope):
+        with self._lock:
+            if scope != self.scope:
+                self._store.clear()
+                self.scope = scope
+
+    def get(self, key):
+        with self._lock:
+            if key in self._store:
+                self._store.move_to_end(key)
+                self.hits += 1
+                return self._store[key]
+            self.misses += 1
+            return None
+
+    def record_hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def put(self, key, fitness):
+        if self.max_size == 0:
+            return
+        with self._lock:
+            self._store[key] = fitness
+            self._store.move_to_end(key)
+            while len(self._store) > self.max_size:
+                self._store.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._store),
+            "maxSize": self.max_size,
+        }
+
+    def entries(self):
+        """Return (keys, fitnesses) arrays in LRU order, oldest first."""
+        with self._lock:
+            items = list(self._store.items())
+        keys = np.array([np.frombuffer(key, dtype=np.uint8) for key, _ in items], dtype=np.uint8)
+        return keys, np.array([fitness for _, fitness in items], dtype=np.float64)
+
+    def load_entries(self, keys, fitnesses):
+        """Restore entries saved by entries() into an empty, bound cache."""
+        for key, fitness in zip(keys, fitnesses):
+            self.put(key.tobytes(), float(fitness))
+
+
+def _lookup_population(population, cache):
+    """
+    Resolve cached fitness for a population.
+
+    Returns (keys, fitness_of, pending): one key per chromosome, a dict of
+    key -> fitness (None while unscored) and the (key, chromosome) pairs that
+    still need a fit, with in-population duplicates counted as cache hits.
+    """
+    fitness_of = {}
+    pending = []
+    keys = [chromosome_key(ch) for ch in population]
+    for key, ch in zip(keys, population):
+        if key in fitness_of:
+            if cache is not None:
+                cache.record_hit()
+            continue
+        fitness = cache.get(key) if cache is not None else None
+        fitness_of[key] = fitness
+        if fitness is None:
+            pending.append((key, ch))
+    return keys, fitness_of, pending
+
+
+def _score_pending(pending, fitness_of, X_train, X_test, y_train, y_test, cache, evaluator, check_nan=True):
+    chromosomes = [ch for _, ch in pending]
+    if evaluator is not None:
+        start = time.perf_counter()
+        scores = evaluator.map(chromosomes)
+        if isinstance(evaluator, BatchedLogisticFitness):
+            mode = "batched"
+        elif isinstance(evaluator, ChunkedFitness):
+            mode = "chunked"
+        else:
+            mode = "pool"
+        metrics.observe(
+            "ga_fitness_fit_seconds", (time.perf_counter() - start) / len(chromosomes),
+            count=len(chromosomes), mode=mode,
+        )
+    else:
+        mode = "serial"
+        scores = []
+        for ch in chromosomes:
+            start = time.perf_counter()
+            scores.append(evaluate_fitness(ch, X_train, X_test, y_train, y_test, check_nan))
+            metrics.observe("ga_fitness_fit_seconds", time.perf_counter() - start, mode=mode)
+    metrics.inc("ga_fitness_fits_total", len(chromosomes), mode=mode)
+    for (key, _), fitness in zip(pending, scores):
+        fitness_of[key] = fitness
+        if cache is not None:
+            cache.put(key, fitness)
+
+
+def evaluate_population(
+    population, X_train, X_test, y_train, y_test, cache=None, evaluator=None, check_nan=True,
+):
+    """
+    Score every chromosome in a population, consulting the fitness cache first.
+
+    Chromosomes that are neither cached nor duplicated earlier in the same
+    population are scored as one batch, on the ParallelEvaluator if given.
+    """
+    keys, fitness_of, pending = _lookup_population(population, cache)
+    if pending:
+        _score_pending(pending, fitness_of, X_train, X_test, y_train, y_test, cache, evaluator, check_nan)
+    return [fitness_of[key] for key in keys]
+
+
+# ---------- Parallel fitness evaluation ----------
+# Pool workers are started from a clean server process rather than forked from
+# the app: the app runs request threads, and a fork copies any lock another
+# thread holds at that moment, deadlocking the child. The split reaches the
+# workers through shared memory, so nothing else needs to be inherited.
+PROCESS_START_METHODS = ("forkserver", "spawn")
+_worker_split = None
+
+
+def process_context():
+    """Return the multiprocessing context that worker pools are started with."""
+    available = multiprocessing.get_all_start_methods()
+    method = next(method for method in PROCESS_START_METHODS if method in available)
+    return multiprocessing.get_context(method)
+
+
+def resolve_worker_count(n_workers):
+    """Map a requested worker count to a usable one (<= 0 means all cores)."""
+    cpu_count = os.cpu_count() or 1
+    n_workers = int(n_workers)
+    if n_workers <= 0:
+        return cpu_count
+    return min(n_workers, cpu_count)
+
+
+def _shareable(arr):
+    """Return arr as a numeric, contiguous (C or Fortran) array for shared memory."""
+    arr = np.asarray(arr)
+    if arr.dtype == object:
+        arr = arr.astype(np.float64)
+    if arr.flags.f_contiguous and not arr.flags.c_contiguous:
+        return arr
+    return np.ascontiguousarray(arr)
+
+
+class SharedSplit:
+    """
+    Train/test arrays copied once into shared memory so pool workers can map
+    them instead of receiving a pickled copy with every task.
+    """
+
+    def __init__(self, X_train, X_test, y_train, y_test):
+        # Labels are encoded to integer codes; np.unique keeps their sort
+        # order, so classifiers see the same classes in the same order.
+        _, y_codes = np.unique(np.concatenate([y_train, y_test]), return_inverse=True)
+        y_train_codes = y_codes[: len(y_train)]
+        y_test_codes = y_codes[len(y_train):]
+
+        self._blocks = []
+        self.specs = []
+        try:
+            for arr in (X_train, X_test, y_train_codes, y_test_codes):
+                if issparse(arr):
+                    # Sparse matrices are shared as their three CSC arrays.
+                    arr = arr.tocsc()
+                    parts = [self._share(part) for part in (arr.data, arr.indices, arr.indptr)]
+                    self.specs.append(("csc", arr.shape, parts, None))
+                else:
+                    self.specs.append(self._share(arr))
+        except Exception:
+            self.close()
+            raise
+
+    def _share(self, arr):
+        arr = _shareable(arr)
+        block = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+        self._blocks.append(block)
+        order = "C" if arr.flags.c_contiguous else "F"
+        np.ndarray(arr.shape, dtype=arr.dtype, buffer=block.buf, order=order)[...] = arr
+        return block.name, arr.shape, arr.dtype.str, order
+
+    def close(self):
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+
+def _attach_shared_split(specs, check_nan=True):
+    global _worker_split
+    blocks = []
+
+    def attach(spec):
+        name, shape, dtype, order = spec
+        if name == "csc":
+            import scipy.sparse as sp
+
+            data, indices, indptr = (attach(part) for part in dtype)
+            return sp.csc_matrix((data, indices, indptr), shape=shape, copy=False)
+        block = shared_memory.SharedMemory(name=name)
+        blocks.append(block)
+        return np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf, order=order)
+
+    arrays = [attach(spec) for spec in specs]
+    _worker_split = (blocks, arrays, check_nan)
+
+
+def _evaluate_in_worker(chromosome):
+    X_train, X_test, y_train, y_test = _worker_split[1]
+    return evaluate_fitness(chromosome, X_train, X_test, y_train, y_test, _worker_split[2])
+
+
+class ParallelEvaluator:
+    """
+    Process pool that scores whole generations against a shared-memory split.
+
+    Fitness is a pure function of the chromosome and the split, so results do
+    not depend on the number of workers.
+    """
+
+    def __init__(self, X_train, X_test, y_train, y_test, n_workers, check_nan=True):
+        self.n_workers = n_workers
+        self._split = SharedSplit(X_train, X_test, y_train, y_test)
+        try:
+            self._executor = ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=process_context(),
+                initializer=_attach_shared_split,
+                initargs=(self._split.specs, check_nan),
+            )
+        except Exception:
+            self._split.close()
+            raise
+
+    def map(self, chromosomes):
+        chunksize = max(1, len(chromosomes) // (self.n_workers * 4))
+        return list(self._executor.map(_evaluate_in_worker, chromosomes, chunksize=chunksize))
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self._split.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ---------- Batched fitness backend ----------
+FITNESS_BACKENDS = ("sgd", "batched", "chunked")
+
+
+def _spectral_norm_sq(X, n_iter=30):
+    """Estimate the largest eigenvalue of X.T @ X by power iteration."""
+    v = np.ones(X.shape[1]) / np.sqrt(max(X.shape[1], 1))
+    value = 0.0
+    for _ in range(n_iter):
+        w = X.T @ (X @ v)
+        value = float(np.linalg.norm(w))
+        if value == 0.0:
+            break
+        v = w / value
+    return value
+
+
+class BatchedLogisticFitness:
+    """
+    Fitness backend that trains a logistic-regression model for every
+    chromosome of a generation at once.
+
+    Features are standardized once; each chromosome owns one column of a
+    (features x population) weight matrix whose gradient is masked by the
+    chromosome, so all models share full-batch gradient steps over the full
+    X_train and are scored against X_test with a single matmul. Exposes the
+    same map()/close() interface as ParallelEvaluator.
+    """
+
+    def __init__(self, X_train, X_test, y_train, y_test, n_iter=100, alpha=1e-4):
+        if issparse(X_train):
+            import scipy.sparse as sp
+
+            # Centering would densify a sparse matrix, so it is only scaled;
+            # the intercept absorbs the feature means.
+            X_train = sp.csr_matrix(X_train, dtype=np.float64)
+            mean = np.asarray(X_train.mean(axis=0)).ravel()
+            mean_sq = np.asarray(X_train.multiply(X_train).mean(axis=0)).ravel()
+            std = np.sqrt(np.maximum(mean_sq - mean ** 2, 0.0))
+            std[std == 0] = 1.0
+            scale = sp.diags(1.0 / std)
+            self.X_train = sp.csr_matrix(X_train @ scale)
+            self.X_test = sp.csr_matrix(sp.csr_matrix(X_test, dtype=np.float64) @ scale)
+        else:
+            X_train = np.asarray(X_train, dtype=np.float64)
+            X_test = np.asarray(X_test, dtype=np.float64)
+            mean = X_train.mean(axis=0)
+            std = X_train.std(axis=0)
+            std[std == 0] = 1.0
+            self.X_train = (X_train - mean) / std
+            self.X_test = (X_test - mean) / std
+
+        classes, codes = np.unique(np.concatenate([y_train, y_test]), return_inverse=True)
+        self.n_classes = len(classes)
+        self.y_train = codes[: len(y_train)]
+        self.y_test = codes[len(y_train):]
+
+        self.n_iter = n_iter
+        self.alpha = alpha
+        # Step size 1/L, where L bounds the curvature of the (multinomial)
+        # logistic loss for every feature subset.
+        lipschitz = 0.5 * _spectral_norm_sq(self.X_train) / max(self.X_train.shape[0], 1) + alpha
+        self.step = 1.0 / lipschitz
+
+    def map(self, chromosomes):
+        masks = np.asarray(chromosomes, dtype=np.float64)
+        if masks.size == 0:
+            return []
+        if self.n_classes < 2:
+            return [0.0] * len(masks)
+        if self.n_classes == 2:
+            accuracy = self._fit_binary(masks)
+        else:
+            accuracy = self._fit_multiclass(masks)
+        accuracy[masks.sum(axis=1) == 0] = 0.0
+        return [float(a) for a in accuracy]
+
+    def _fit_binary(self, masks):
+        X, y, n = self.X_train, self.y_train.astype(np.float64), self.X_train.shape[0]
+        mask = masks.T
+        W = np.zeros_like(mask)
+        b = np.zeros(mask.shape[1])
+        for _ in range(self.n_iter):
+            z = X @ W + b
+            err = 0.5 * (1.0 + np.tanh(0.5 * z)) - y[:, None]
+            W -= self.step * (X.T @ err / n + self.alpha * W) * mask
+            b -= self.step * err.mean(axis=0)
+        predictions = (self.X_test @ W + b) > 0
+        return (predictions == self.y_test[:, None].astype(bool)).mean(axis=0)
+
+    def _fit_multiclass(self, masks):
+        # Weights for all chromosomes and classes live in one
+        # (features x population*classes) matrix so each step is two matmuls.
+        X, n, c = self.X_train, self.X_train.shape[0], self.n_classes
+        p = masks.shape[0]
+        onehot = np.eye(c)[self.y_train]
+        mask = np.repeat(masks.T, c, axis=1)
+        W = np.zeros_like(mask)
+        b = np.zeros(p * c)
+        for _ in range(self.n_iter):
+            z = (X @ W + b).reshape(n, p, c)
+            z -= z.max(axis=2, keepdims=True)
+            prob = np.exp(z)
+            prob /= prob.sum(axis=2, keepdims=True)
+            err = (prob - onehot[:, None, :]).reshape(n, p * c)
+            W -= self.step * (X.T @ err / n + self.alpha * W) * mask
+            b -= self.step * err.mean(axis=0)
+        z = (self.X_test @ W + b).reshape(self.X_test.shape[0], p, c)
+        return (z.argmax(axis=2) == self.y_test[:, None]).mean(axis=0)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ---------- Out-of-core fitness backend ----------
+DEFAULT_FIT_CHUNK_ROWS = 10_000
+DEFAULT_FIT_EPOCHS = 5
+
+
+def _row_ranges(n_rows, chunk_rows):
+    return [(start, min(start + chunk_rows, n_rows)) for start in range(0, n_rows, chunk_rows)]
+
+
+def evaluate_fitness_chunked(
+    chromosome, X_train, X_test, y_train, y_test,
+    chunk_rows=DEFAULT_FIT_CHUNK_ROWS, epochs=DEFAULT_FIT_EPOCHS, check_nan=True, classes=None,
+):
+    """
+    Out-of-core variant of evaluate_fitness: the same classifier is trained
+    with partial_fit on chunk_rows training rows at a time for epochs passes
+    (visiting the chunks in a fixed shuffled order each pass), and test
+    accuracy is counted chunk by chunk.
+
+    Only one chunk of the selected columns is materialized at a time, so
+    X_train and X_test may be memory-mapped arrays (or anything else sliced
+    by rows without loading it) larger than memory. classes defaults to the
+    labels in y_train.
+    """
+    try:
+        selected_features = np.flatnonzero(np.asarray(chromosome) == 1)
+        if selected_features.size == 0:
+            return 0.0
+        y_train = np.asarray(y_train)
+        y_test = np.asarray(y_test)
+        if classes is None:
+            classes = np.unique(y_train)
+        if issparse(X_train):
+            # Row slices of CSC matrices scan every nonzero; the selected
+            # columns are compact anyway, so convert them once.
+            X_train = X_train[:, selected_features].tocsr()
+            X_test = X_test[:, selected_features].tocsr()
+            selected_features = slice(None)
+
+        from sklearn.linear_model import SGDClassifier
+
+        model = SGDClassifier(loss="log_loss", random_state=42)
+        ranges = _row_ranges(X_train.shape[0], chunk_rows)
+        order_rng = np.random.default_rng(42)
+        for _ in range(epochs):
+            for i in order_rng.permutation(len(ranges)):
+                start, stop = ranges[i]
+                X_chunk = X_train[start:stop][:, selected_features]
+                if check_nan and _has_nan(X_chunk):
+                    return 0.0
+                model.partial_fit(X_chunk, y_train[start:stop], classes=classes)
+
+        correct = 0
+        for start, stop in _row_ranges(X_test.shape[0], chunk_rows):
+            X_chunk = X_test[start:stop][:, selected_features]
+            if check_nan and _has_nan(X_chunk):
+                return 0.0
+            correct += int(np.count_nonzero(model.predict(X_chunk) == y_test[start:stop]))
+        return correct / max(X_test.shape[0], 1)
+
+    except Exception:
+        return 0.0
+
+
+class ChunkedFitness:
+    """
+    Fitness backend for splits too large to copy: evaluate_fitness_chunked
+    on a pool of n_workers threads that all read the split in place (SGD's
+    inner loop releases the GIL), so peak memory stays around n_workers
+    chunks of selected columns. Exposes the same map()/close() interface as
+    ParallelEvaluator.
+    """
+
+    def __init__(self, X_train, X_test, y_train, y_test, chunk_rows=DEFAULT_FIT_CHUNK_ROWS,
+                 epochs=DEFAULT_FIT_EPOCHS, n_workers=1, check_nan=True):
+        if int(chunk_rows) < 1:
+            raise ValueError("chunk rows must be at least 1")
+        if int(epochs) < 1:
+            raise ValueError("epochs must be at least 1")
+        self.split = (X_train, X_test, y_train, y_test)
+        self.chunk_rows = int(chunk_rows)
+        self.epochs = int(epochs)
+        self.check_nan = check_nan
+        self.classes = np.unique(np.asarray(y_train))
+        self._executor = None
+        if n_workers > 1:
+            self._executor = ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="chunked-fitness")
+
+    def _evaluate(self, chromosome):
+        return evaluate_fitness_chunked(
+            chromosome, *self.split, self.chunk_rows, self.epochs, self.check_nan, self.classes
+        )
+
+    def map(self, chromosomes):
+        if self._executor is None:
+            return [self._evaluate(ch) for ch in chromosomes]
+        return list(self._executor.map(self._evaluate, chromosomes))
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ---------- Multi-fidelity racing ----------
+EVALUATION_STRATEGIES = ("full", "halving")
+DEFAULT_FIDELITY_LEVELS = 3
+DEFAULT_PROMOTION_RATIO = 1 / 3
+MIN_FIDELITY_ROWS = 50
+
+
+def stratified_order(y, rng):
+    """
+    Random permutation of row indices in which every prefix keeps roughly the
+    class proportions of y, so nested subsamples are all stratified.
+    """
+    order = rng.permutation(len(y))
+    _, inverse, counts = np.unique(np.asarray(y)[order], return_inverse=True, return_counts=True)
+    by_class = np.argsort(inverse, kind="stable")
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    rank = np.empty(len(y))
+    rank[by_class] = np.arange(len(y)) - starts[inverse[by_class]]
+    key = (rank + 0.5) / counts[inverse]
+    return order[np.argsort(key, kind="stable")]
+
+
+class SuccessiveHalving:
+    """
+    Racing evaluation: new chromosomes are first fitted on a small stratified
+    subsample of training rows, and only the top promotion_ratio of them moves
+    on to each larger subsample; survivors of the last level get a full fit.
+
+    Level sizes shrink geometrically by promotion_ratio from the full training
+    set. Only full-fidelity scores are cached or eligible as the GA's best.
+    """
+
+    def __init__(self, X_train, y_train, levels=DEFAULT_FIDELITY_LEVELS,
+                 promotion_ratio=DEFAULT_PROMOTION_RATIO, rng=None, min_rows=MIN_FIDELITY_ROWS):
+        if int(levels) < 1:
+            raise ValueError("fidelity levels must be at least 1")
+        if not 0 < promotion_ratio < 1:
+            raise ValueError("promotion ratio must be between 0 and 1")
+        rng = rng if rng is not None else np.random.default_rng()
+        self.levels = int(levels)
+        self.promotion_ratio = float(promotion_ratio)
+        self.subsamples = []
+
+        n = len(y_train)
+        order = stratified_order(y_train, rng)
+        for level in range(self.levels - 1):
+            size = max(int(np.ceil(n * promotion_ratio ** (self.levels - 1 - level))), min_rows)
+            if size >= n:
+                break
+            rows = np.sort(order[:size])
+            self.subsamples.append((X_train[rows], np.asarray(y_train)[rows]))
+
+        self.low_fidelity_fits = 0
+        self.full_fits = 0
+        self.full_fits_avoided = 0
+
+    def evaluate(self, population, X_train, X_test, y_train, y_test, cache=None, evaluator=None, check_nan=True):
+        """
+        Returns (fitnesses, full): eliminated chromosomes keep their last
+        subsample score and are flagged False in full.
+        """
+        keys, fitness_of, pending = _lookup_population(population, cache)
+        full_keys = {key for key, fitness in fitness_of.items() if fitness is not None}
+
+        for X_sub, y_sub in self.subsamples:
+            if len(pending) <= 1:
+                break
+            scores = [evaluate_fitness(ch, X_sub, X_test, y_sub, y_test, check_nan) for _, ch in pending]
+            self.low_fidelity_fits += len(pending)
+            metrics.inc("ga_fitness_fits_total", len(pending), mode="subsample")
+            ranked = np.argsort(-np.asarray(scores), kind="stable")
+            keep = max(1, int(np.ceil(len(pending) * self.promotion_ratio)))
+            for i in ranked[keep:]:
+                fitness_of[pending[i][0]] = scores[i]
+            self.full_fits_avoided += len(pending) - keep
+            pending = [pending[i] for i in ranked[:keep]]
+
+        if pending:
+            _score_pending(pending, fitness_of, X_train, X_test, y_train, y_test, cache, evaluator, check_nan)
+            self.full_fits += len(pending)
+            full_keys.update(key for key, _ in pending)
+
+        return [fitness_of[key] for key in keys], [key in full_keys for key in keys]
+
+    def stats(self):
+        return {
+            "levels": self.levels,
+            "promotionRatio": self.promotion_ratio,
+            "subsampleRows": [len(y) for _, y in self.subsamples],
+            "lowFidelityFits": self.low_fidelity_fits,
+            "fullFits": self.full_fits,
+            "fullFitsAvoided": self.full_fits_avoided,
+        }
+
+
+def crossover(p1, p2, rate, seed=None):
+    c1, c2 = crossover_arrays(
+        np.asarray([p1], dtype=np.uint8), np.asarray([p2], dtype=np.uint8), rate, seed
+    )
+    return c1[0].tolist(), c2[0].tolist()
+
+
+def mutate(chromosome, rate, seed=None):
+    return mutate_array(np.asarray(chromosome, dtype=np.uint8), rate, seed).tolist()
+
 
 
-def mutate(chromosome, rate):
-    return [1 - g if random.random() < rate else g for g in chromosome]
+def split_train_test(X, y):
+    """70/30 split, stratified whenever every class has at least 2 samples."""
+    from sklearn.model_selection import train_test_split
 
+    unique_classes, class_counts = np.unique(y, return_counts=True)
+    if np.all(class_counts >= 2):
+        return train_test_split(X, y, test_size=0.3, random_state=42, stratify=y)
+    # Not enough samples per class for stratification; fall back to non-stratified split
+    return train_test_split(X, y, test_size=0.3, random_state=42)
 
 
-def load_and_preprocess_csv(csv_content, target_column_idx, id_column_idx=None):
+def load_and_preprocess_csv(csv_content, target_column_idx, id_column_idx=None, timer=None):
     """
     Loads and preprocesses CSV data for GA feature selection.
 
@@ -76,16 +949,22 @@ def load_and_preprocess_csv(csv_content, target_column_idx, id_column_idx=None):
         csv_content: String containing CSV data.
         target_column_idx: Index of the target column.
         id_column_idx: Optional index of ID column to exclude from features.
+        timer: Optional PhaseTimer receiving csv_parse, cleaning and split times.
 
     Returns:
         tuple: (X_train, X_test, y_train, y_test, feature_headers, target_header, df)
         or (None, error_message) if an error occurs.
     """
+    import pandas as pd
+
+    timer = timer if timer is not None else PhaseTimer()
     try:
         # Parse CSV data.
-        df = pd.read_csv(io.StringIO(csv_content))
+        with timer.phase("csv_parse"):
+            df = pd.read_csv(io.StringIO(csv_content))
 
         # Remove any empty rows and columns.
+        cleaning_start = time.perf_counter()
         df = df.dropna(how='all')
         df = df.dropna(axis=1, how='all')
 
@@ -113,6 +992,7 @@ def load_and_preprocess_csv(csv_content, target_column_idx, id_column_idx=None):
         mask = ~(pd.isna(X).any(axis=1) | pd.isna(y))
         X = X[mask]
         y = y[mask]
+        timer.add("cleaning", time.perf_counter() - cleaning_start)
 
         # Check if we have enough data after cleaning.
         if len(X) < 2:
@@ -120,16 +1000,8 @@ def load_and_preprocess_csv(csv_content, target_column_idx, id_column_idx=None):
 
         # Split data into train/test sets.
         # Check that each class has at least 2 samples for stratification
-        unique_classes, class_counts = np.unique(y, return_counts=True)
-        if np.all(class_counts >= 2):
-            X_train, X_test, y_train, y_test = train_test_split(
-                X, y, test_size=0.3, random_state=42, stratify=y
-            )
-        else:
-            # Not enough samples per class for stratification; fall back to non-stratified split
-            X_train, X_test, y_train, y_test = train_test_split(
-                X, y, test_size=0.3, random_state=42
-            )
+        with timer.phase("split"):
+            X_train, X_test, y_train, y_test = split_train_test(X, y)
 
         feature_headers = list(feature_columns)
         target_header = target_column
@@ -140,6 +1012,110 @@ def load_and_preprocess_csv(csv_content, target_column_idx, id_column_idx=None):
         return None, f"Error processing CSV: {str(e)}"
 
 
+# ---------- Checkpointing ----------
+CHECKPOINT_DIR = os.path.join(tempfile.gettempdir(), "featuregene-checkpoints")
+_CHECKPOINT_ARRAYS = ("population", "best_chromosome", "history", "cache_keys", "cache_fitnesses")
+
+
+def save_checkpoint(path, state):
+    """
+    Atomically write a GA state dict to path as an .npz file. The entries
+    named in _CHECKPOINT_ARRAYS are stored as arrays; everything else must be
+    JSON-serialisable and is stored as one JSON document.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    arrays = {name: np.asarray(state[name]) for name in _CHECKPOINT_ARRAYS}
+    meta = {name: value for name, value in state.items() if name not in _CHECKPOINT_ARRAYS}
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            np.savez(f, meta=np.array(json.dumps(meta)), **arrays)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_checkpoint(path):
+    """Read a GA state dict written by save_checkpoint."""
+    with np.load(path, allow_pickle=False) as f:
+        state = json.loads(str(f["meta"]))
+        state.update({name: f[name] for name in _CHECKPOINT_ARRAYS})
+    return state
+
+
+# ---------- Run budgets ----------
+class RunBudget:
+    """
+    Wall-clock (seconds) and full fitness evaluation (evaluations) limits for
+    one GA run; either may be None. The GA polls exhausted() between
+    generations (island runs between migration epochs) and stops with its
+    best-so-far result once it returns True.
+
+    The time limit is checked against the projected end of the next
+    generation, taking it to last as long as the previous one, so a run
+    stops before overshooting rather than after.
+    """
+
+    def __init__(self, seconds=None, evaluations=None):
+        self.seconds = seconds
+        self.evaluations = evaluations
+        self.start = time.perf_counter()
+        self._last_check = self.start
+        self.exhausted_by = None
+
+    def exhausted(self, evaluations_used):
+        now = time.perf_counter()
+        step = now - self._last_check
+        self._last_check = now
+        if self.seconds is not None and now - self.start + step > self.seconds:
+            self.exhausted_by = "time"
+        elif self.evaluations is not None and evaluations_used >= self.evaluations:
+            self.exhausted_by = "evaluations"
+        return self.exhausted_by is not None
+
+    def stats(self, evaluations_used):
+        return {
+            "seconds": self.seconds,
+            "evaluations": self.evaluations,
+            "elapsedSeconds": round(time.perf_counter() - self.start, 4),
+            "evaluationsUsed": int(evaluations_used),
+            "exhaustedBy": self.exhausted_by,
+        }
+
+
+def build_fitness_evaluator(
+    X_train, X_test, y_train, y_test, fitness_backend="sgd", n_workers=1, check_nan=True,
+    fit_chunk_rows=DEFAULT_FIT_CHUNK_ROWS, fit_epochs=DEFAULT_FIT_EPOCHS,
+):
+    """
+    Build the evaluator run_ga_feature_selection scores generations with for
+    fitness_backend (None to fit each chromosome in this process).
+
+    Returns:
+        tuple: (evaluator or None, the number of workers it actually uses).
+        The caller closes the evaluator.
+    """
+    n_workers = resolve_worker_count(n_workers)
+    if fitness_backend == "batched":
+        try:
+            return BatchedLogisticFitness(X_train, X_test, y_train, y_test), 1
+        except (TypeError, ValueError):
+            # Non-numeric data; evaluate_fitness handles (and zero-scores) it.
+            return None, 1
+    if fitness_backend == "chunked":
+        return ChunkedFitness(
+            X_train, X_test, y_train, y_test, fit_chunk_rows, fit_epochs, n_workers, check_nan
+        ), n_workers
+    if n_workers > 1:
+        try:
+            return ParallelEvaluator(X_train, X_test, y_train, y_test, n_workers, check_nan), n_workers
+        except (TypeError, ValueError, OSError):
+            # Non-numeric data cannot be placed in shared memory; score serially.
+            return None, 1
+    return None, n_workers
+
+
 def run_ga_feature_selection(
     X_train,
     X_test,
@@ -151,59 +1127,525 @@ def run_ga_feature_selection(
     mutation_rate,
     max_gen,
     convergence_threshold=None,
+    fitness_cache=None,
+    n_workers=1,
+    seed=None,
+    fitness_backend="sgd",
+    on_generation=None,
+    should_stop=None,
+    evaluation_strategy="full",
+    fidelity_levels=DEFAULT_FIDELITY_LEVELS,
+    promotion_ratio=DEFAULT_PROMOTION_RATIO,
+    initial_population=None,
+    elite_size=0,
+    timer=None,
+    checkpoint_path=None,
+    checkpoint_interval=0,
+    resume_state=None,
+    check_nan=True,
+    fit_chunk_rows=DEFAULT_FIT_CHUNK_ROWS,
+    fit_epochs=DEFAULT_FIT_EPOCHS,
+    budget=None,
+    fingerprint=None,
+    evaluator=None,
 ):
     """
     Execute GA feature selection and return core results.
 
+    The population is held as a (pop_size x n_features) uint8 array and bred
+    with a numpy Generator seeded from seed. fitness_backend selects per-
+    chromosome SGDClassifier fits ("sgd"), BatchedLogisticFitness
+    ("batched"), which scores a whole generation at once and ignores n_workers,
+    or ChunkedFitness ("chunked"), which trains with partial_fit over
+    fit_chunk_rows rows at a time for fit_epochs passes, on n_workers
+    threads, for splits that should not be copied into memory.
+
+    on_generation(gen, best_fitness, elapsed_seconds) is called after each
+    generation is scored. should_stop() is polled between generations; when
+    it returns True the loop stops and the best-so-far result is returned
+    with cancelled=True.
+
+    evaluation_strategy="halving" races new chromosomes through
+    fidelity_levels stratified row subsamples (see SuccessiveHalving); it
+    requires the "sgd" backend.
+
+    A FitnessCache may be passed in to reuse scores across runs on the same
+    split; otherwise a fresh one is created for this run. With n_workers > 1
+    (or <= 0 for all cores) each generation is scored on a process pool.
+
+    initial_population continues from an existing population array instead
+    of a random one, and seed may be a Generator to continue its stream; the
+    island model uses both to run the loop in epochs.
+
+    timer (a PhaseTimer) receives fitness_evaluation and breeding times.
+
+    With checkpoint_path set, the full loop state (population, best, history,
+    RNG state and fitness cache) is saved every checkpoint_interval
+    generations and when the run is cancelled or reaches max_gen. Passing a
+    state from load_checkpoint as resume_state continues that run exactly as
+    if it had never stopped; max_gen still counts from its first generation.
+
+    The split is scanned for NaNs once; check_nan=False skips even that for
+    data validated up front, such as a PreparedDataset's.
+
+    A caller that runs the loop repeatedly on one split (the island model)
+    can pass its split_fingerprint as fingerprint and an evaluator from
+    build_fitness_evaluator, which is then reused and left open, instead of
+    having them recomputed and rebuilt by every call.
+
+    A RunBudget stops the run early, keeping at least one generation, when
+    its time or its number of full fits runs out. Full fits are fitness cache
+    misses (with a cache shared between concurrent runs, theirs count too),
+    or under halving the racing survivors' full fits, since subsample scores
+    are cheap and also miss the cache. A
+    checkpointed run stopped this way can be resumed like a cancelled one.
+
     Returns dict with:
-      - best_fitness, best_chromosome, history, converged, selected_features
+      - best_fitness, best_chromosome, history, converged, selected_features,
+        cache_stats, n_workers, fitness_backend, cancelled, racing_stats,
+        budget_stats (None without a budget), final_population (the next,
+        unscored generation) and elite (the elite_size fittest chromosomes of
+        the last scored generation)
     """
+    if fitness_backend not in FITNESS_BACKENDS:
+        raise ValueError(f"Unknown fitness backend: {fitness_backend}")
+    if evaluation_strategy not in EVALUATION_STRATEGIES:
+        raise ValueError(f"Unknown evaluation strategy: {evaluation_strategy}")
+    if evaluation_strategy == "halving" and fitness_backend != "sgd":
+        raise ValueError("Successive halving requires the sgd fitness backend")
     feature_count = len(feature_headers)
-
-    population = initialize_population(pop_size, feature_count)
+    if fitness_cache is None:
+        fitness_cache = FitnessCache()
+    if fingerprint is None:
+        fingerprint = split_fingerprint(X_train, X_test, y_train, y_test)
+    if fitness_backend == "chunked":
+        fitness_cache.bind((fingerprint, fitness_backend, int(fit_chunk_rows), int(fit_epochs)))
+    else:
+        fitness_cache.bind((fingerprint, fitness_backend))
+    # Per-evaluation NaN checks are only needed if the split has any NaNs.
+    check_nan = check_nan and _may_have_nan(X_train, X_test)
+
+    rng = np.random.default_rng(seed)
+    if resume_state is not None:
+        if resume_state["fingerprint"] != fingerprint or resume_state["fitness_backend"] != fitness_backend:
+            raise ValueError("Checkpoint was taken on a different dataset split or fitness backend")
+        population = np.array(resume_state["population"], dtype=np.uint8)
+    elif initial_population is not None:
+        population = np.array(initial_population, dtype=np.uint8)
+    else:
+        population = init_population_array(pop_size, feature_count, rng=rng)
+    scored_population, scored_fitnesses = population, []
+    # The racing subsamples are drawn from this state; a resumed run redraws
+    # the same ones before restoring the generator to where it stopped.
+    racing_rng_state = resume_state["racing_rng_state"] if resume_state is not None else rng.bit_generator.state
+    racing = None
+    if evaluation_strategy == "halving":
+        rng.bit_generator.state = racing_rng_state
+        racing = SuccessiveHalving(X_train, y_train, fidelity_levels, promotion_ratio, rng)
     best_fitness = 0.0
     best_chromosome = []
     history = []
     prev_best = 0.0
     converged = False
+    cancelled = False
+    start_gen = 0
+    if resume_state is not None:
+        rng.bit_generator.state = resume_state["rng_state"]
+        start_gen = resume_state["generation"]
+        best_fitness = resume_state["best_fitness"]
+        best_chromosome = resume_state["best_chromosome"].tolist()
+        history = resume_state["history"].tolist()
+        prev_best = resume_state["prev_best"]
+        fitness_cache.load_entries(resume_state["cache_keys"], resume_state["cache_fitnesses"])
+        if racing is not None:
+            racing.low_fidelity_fits, racing.full_fits, racing.full_fits_avoided = resume_state["racing_counts"]
+
+    def checkpoint(next_gen):
+        cache_keys, cache_fitnesses = fitness_cache.entries()
+        save_checkpoint(checkpoint_path, {
+            "generation": next_gen,
+            "population": population,
+            "best_fitness": best_fitness,
+            "best_chromosome": np.array(best_chromosome, dtype=np.uint8),
+            "history": np.array(history, dtype=np.float64),
+            "prev_best": prev_best,
+            "rng_state": rng.bit_generator.state,
+            "racing_rng_state": racing_rng_state,
+            "racing_counts": (
+                [racing.low_fidelity_fits, racing.full_fits, racing.full_fits_avoided]
+                if racing is not None else None
+            ),
+            "cache_keys": cache_keys,
+            "cache_fitnesses": cache_fitnesses,
+            "fingerprint": fingerprint,
+            "fitness_backend": fitness_backend,
+        })
+    timer = timer if timer is not None else PhaseTimer()
+    start = time.perf_counter()
+    misses_at_start = fitness_cache.misses
+    full_fits_at_start = racing.full_fits if racing is not None else 0
+
+    def full_fits_used():
+        if racing is not None:
+            return racing.full_fits - full_fits_at_start
+        return fitness_cache.misses - misses_at_start
+
+    owns_evaluator = evaluator is None
+    if owns_evaluator:
+        evaluator, n_workers = build_fitness_evaluator(
+            X_train, X_test, y_train, y_test, fitness_backend, n_workers, check_nan, fit_chunk_rows, fit_epochs
+        )
+    else:
+        n_workers = resolve_worker_count(n_workers)
+
+    try:
+        for gen in range(start_gen, max_gen):
+            if gen > 0 and should_stop is not None and should_stop():
+                cancelled = True
+                break
+            if gen > start_gen and budget is not None and budget.exhausted(full_fits_used()):
+                break
+
+            with timer.phase("fitness_evaluation"):
+                if racing is not None:
+                    fitnesses, full = racing.evaluate(
+                        population, X_train, X_test, y_train, y_test, fitness_cache, evaluator, check_nan
+                    )
+                    # Subsample scores are only estimates; the best must be fully fitted.
+                    best_idx = max((i for i, f in enumerate(full) if f), key=fitnesses.__getitem__)
+                    gen_best = fitnesses[best_idx]
+                else:
+                    fitnesses = evaluate_population(
+                        population, X_train, X_test, y_train, y_test, fitness_cache, evaluator, check_nan
+                    )
+                    gen_best = max(fitnesses)
+                    best_idx = fitnesses.index(gen_best)
+            scored_population, scored_fitnesses = population, fitnesses
+
+            if gen_best > best_fitness:
+                best_fitness = gen_best
+                best_chromosome = population[best_idx].tolist()
+
+            history.append(best_fitness)
+            if on_generation is not None:
+                on_generation(gen, best_fitness, time.perf_counter() - start)
+
+            if gen > 0 and prev_best > 0 and convergence_threshold is not None:
+                improvement = abs(best_fitness - prev_best)
+                if improvement < convergence_threshold:
+                    converged = True
+                    break
+
+            prev_best = best_fitness
+
+            with timer.phase("breeding"):
+                population = next_generation(population, crossover_rate, mutation_rate, rng)
+
+            if checkpoint_path and checkpoint_interval > 0 and (gen + 1) % checkpoint_interval == 0:
+                with timer.phase("checkpoint"):
+                    checkpoint(gen + 1)
+        else:
+            gen = max_gen
+        if checkpoint_path and not converged:
+            # Converged runs stop before breeding, so there is nothing to resume.
+            with timer.phase("checkpoint"):
+                checkpoint(gen)
+    finally:
+        if owns_evaluator and evaluator is not None:
+            evaluator.close()
+
+    elite = []
+    if elite_size > 0 and len(scored_fitnesses):
+        order = np.argsort(-np.asarray(scored_fitnesses), kind="stable")[:elite_size]
+        elite = scored_population[order]
 
-    for gen in range(max_gen):
-        fitnesses = [evaluate_fitness(ch, X_train, X_test, y_train, y_test) for ch in population]
-        gen_best = max(fitnesses)
-        best_idx = fitnesses.index(gen_best)
+    selected_features = [f for f, g in zip(feature_headers, best_chromosome) if g == 1]
+    return {
+        "best_fitness": float(best_fitness),
+        "best_chromosome": best_chromosome,
+        "history": history,
+        "converged": bool(converged),
+        "selected_features": selected_features,
+        "cache_stats": fitness_cache.stats(),
+        "n_workers": n_workers,
+        "fitness_backend": fitness_backend,
+        "cancelled": cancelled,
+        "racing_stats": racing.stats() if racing is not None else None,
+        "budget_stats": budget.stats(full_fits_used()) if budget is not None else None,
+        "final_population": population,
+        "elite": elite,
+    }
 
-        if gen_best > best_fitness:
-            best_fitness = gen_best
-            best_chromosome = population[best_idx][:]
+# ---------- Island model ----------
+TOPOLOGIES = ("ring", "random")
 
-        history.append(best_fitness)
 
-        if gen > 0 and prev_best > 0 and convergence_threshold is not None:
-            improvement = abs(best_fitness - prev_best)
-            if improvement < convergence_threshold:
-                converged = True
-                break
+def _run_island_epoch(split, island, generations, ga_kwargs):
+    """Advance one island by a number of generations with the standard GA loop."""
+    X_train, X_test, y_train, y_test = split
+    result = run_ga_feature_selection(
+        X_train,
+        X_test,
+        y_train,
+        y_test,
+        island["feature_headers"],
+        pop_size=len(island["population"]),
+        max_gen=generations,
+        fitness_cache=island["cache"],
+        seed=island["rng"],
+        initial_population=island["population"],
+        **ga_kwargs,
+    )
+    island["population"] = result["final_population"]
+    return island, result
+
+
+def _island_evaluator(split, ga_kwargs):
+    """The single-process evaluator every epoch of an island run shares."""
+    evaluator, _ = build_fitness_evaluator(
+        *split,
+        fitness_backend=ga_kwargs.get("fitness_backend", "sgd"),
+        n_workers=1,
+        check_nan=ga_kwargs.get("check_nan", True),
+        fit_chunk_rows=ga_kwargs.get("fit_chunk_rows", DEFAULT_FIT_CHUNK_ROWS),
+        fit_epochs=ga_kwargs.get("fit_epochs", DEFAULT_FIT_EPOCHS),
+    )
+    return evaluator
+
+
+# Built on a worker's first island epoch and reused for the rest of the run;
+# the pool, and so the worker, only lives as long as one run_island_ga call.
+# Nothing closes it when the pool shuts down, so only a backend whose
+# evaluator holds no threads, processes or shared memory is kept: the
+# batched one, whose close() is a no-op. Other backends build and close
+# their evaluator in every epoch.
+_worker_island_evaluator = None
+RESOURCE_FREE_BACKENDS = ("batched",)
+
+
+def _run_island_epoch_in_worker(island, generations, ga_kwargs):
+    global _worker_island_evaluator
+    if _worker_island_evaluator is None and ga_kwargs.get("fitness_backend", "sgd") in RESOURCE_FREE_BACKENDS:
+        _worker_island_evaluator = _island_evaluator(_worker_split[1], ga_kwargs)
+    if _worker_island_evaluator is not None:
+        ga_kwargs = {**ga_kwargs, "evaluator": _worker_island_evaluator}
+    island, result = _run_island_epoch(_worker_split[1], island, generations, ga_kwargs)
+    # The final population travels back inside island; drop the duplicate.
+    result.pop("final_population")
+    return island, result
+
+
+def run_island_ga(
+    X_train,
+    X_test,
+    y_train,
+    y_test,
+    feature_headers,
+    pop_size,
+    crossover_rate,
+    mutation_rate,
+    max_gen,
+    convergence_threshold=None,
+    n_islands=4,
+    migration_interval=5,
+    migration_size=2,
+    topology="ring",
+    n_workers=0,
+    seed=None,
+    fitness_cache=None,
+    on_generation=None,
+    should_stop=None,
+    budget=None,
+    **ga_kwargs,
+):
+    """
+    Island-model GA: n_islands independent populations of pop_size each run
+    the standard generation loop in separate processes, and every
+    migration_interval generations the best migration_size chromosomes of
+    each island replace random members of its neighbour ("ring") or of a
+    randomly chosen island ("random").
+
+    Islands only synchronize at migrations, and each island's trajectory
+    depends only on its own seed and its migrants, so results are identical
+    for any n_workers. convergence_threshold, should_stop and budget (a
+    RunBudget over the islands' combined fits) are checked between migration
+    epochs; the combined history is the best fitness over all islands after
+    each generation.
+
+    Returns the same dict as run_ga_feature_selection plus island_stats.
+    """
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unknown island topology: {topology}")
+    n_islands = max(1, int(n_islands))
+    migration_interval = max(1, int(migration_interval))
+    migration_size = max(0, min(int(migration_size), pop_size // 2))
+    feature_count = len(feature_headers)
+    cache_size = fitness_cache.max_size if fitness_cache is not None else DEFAULT_FITNESS_CACHE_SIZE
+
+    seeds = np.random.SeedSequence(seed).spawn(n_islands + 1)
+    migration_rng = np.random.default_rng(seeds[-1])
+    islands = []
+    for island_seed in seeds[:-1]:
+        rng = np.random.default_rng(island_seed)
+        islands.append({
+            "feature_headers": feature_headers,
+            "population": init_population_array(pop_size, feature_count, rng=rng),
+            "rng": rng,
+            "cache": FitnessCache(cache_size),
+        })
+
+    # The split's fingerprint and NaN scan are the same for every island and
+    # epoch, so they are computed once here rather than by each epoch's loop.
+    ga_kwargs = dict(
+        ga_kwargs,
+        crossover_rate=crossover_rate,
+        mutation_rate=mutation_rate,
+        elite_size=migration_size,
+        n_workers=1,
+        fingerprint=split_fingerprint(X_train, X_test, y_train, y_test),
+        check_nan=ga_kwargs.get("check_nan", True) and _may_have_nan(X_train, X_test),
+    )
+    n_workers = min(resolve_worker_count(n_workers), n_islands)
+    split = None
+    executor = None
+    if n_workers > 1:
+        try:
+            split = SharedSplit(X_train, X_test, y_train, y_test)
+            executor = ProcessPoolExecutor(
+                max_workers=n_workers, mp_context=process_context(),
+                initializer=_attach_shared_split, initargs=(split.specs,),
+            )
+        except (TypeError, ValueError, OSError):
+            if split is not None:
+                split.close()
+            split = None
+            n_workers = 1
+    # Worker processes build their own evaluator on their first epoch.
+    evaluator = _island_evaluator((X_train, X_test, y_train, y_test), ga_kwargs) if executor is None else None
+    if evaluator is not None:
+        ga_kwargs["evaluator"] = evaluator
+
+    island_best = [0.0] * n_islands
+    island_best_chromosome = [[] for _ in range(n_islands)]
+    island_history = [[] for _ in range(n_islands)]
+    history = []
+    racing_stats = []
+    converged = False
+    cancelled = False
+    migrations = 0
+    start = time.perf_counter()
 
-        prev_best = best_fitness
+    def full_fits_used():
+        if ga_kwargs.get("evaluation_strategy") == "halving":
+            return sum(stats["fullFits"] for stats in racing_stats)
+        return sum(island["cache"].misses for island in islands)
 
-        new_pop = []
-        while len(new_pop) < pop_size:
-            p1, p2 = random.sample(population, 2)
-            c1, c2 = crossover(p1, p2, crossover_rate)
-            new_pop.append(mutate(c1, mutation_rate))
-            if len(new_pop) < pop_size:
-                new_pop.append(mutate(c2, mutation_rate))
-        population = new_pop
+    try:
+        gen = 0
+        while gen < max_gen:
+            if gen > 0 and should_stop is not None and should_stop():
+                cancelled = True
+                break
+            if gen > 0 and budget is not None and budget.exhausted(full_fits_used()):
+                break
+            generations = min(migration_interval, max_gen - gen)
+            epoch_kwargs = ga_kwargs
+            if budget is not None and budget.seconds is not None:
+                # Islands also stop mid-epoch when the time runs out.
+                remaining = budget.seconds - (time.perf_counter() - budget.start)
+                epoch_kwargs = {**ga_kwargs, "budget": RunBudget(max(remaining, 0.0))}
+            if executor is not None:
+                futures = [
+                    executor.submit(_run_island_epoch_in_worker, island, generations, epoch_kwargs)
+                    for island in islands
+                ]
+                outcomes = [future.result() for future in futures]
+            else:
+                outcomes = [
+                    _run_island_epoch((X_train, X_test, y_train, y_test), island, generations, epoch_kwargs)
+                    for island in islands
+                ]
+            islands = [island for island, _ in outcomes]
+            results = [result for _, result in outcomes]
+
+            prev_best = max(island_best)
+            for i, result in enumerate(results):
+                # Each epoch's history restarts from 0, so carry the island's best forward.
+                island_history[i].extend(max(island_best[i], h) for h in result["history"])
+                if result["best_fitness"] > island_best[i]:
+                    island_best[i] = result["best_fitness"]
+                    island_best_chromosome[i] = result["best_chromosome"]
+                if result["racing_stats"] is not None:
+                    racing_stats.append(result["racing_stats"])
+            completed = min(len(result["history"]) for result in results)
+            for g in range(gen, gen + completed):
+                history.append(max(h[g] for h in island_history))
+                if on_generation is not None:
+                    on_generation(g, history[-1], time.perf_counter() - start)
+            gen += completed
+            if completed < generations:
+                budget.exhausted_by = "time"
+                break
 
+            if convergence_threshold is not None and prev_best > 0:
+                if abs(max(island_best) - prev_best) < convergence_threshold:
+                    converged = True
+                    break
+
+            if gen < max_gen and migration_size > 0 and n_islands > 1:
+                for i, island in enumerate(islands):
+                    if topology == "ring":
+                        source = (i - 1) % n_islands
+                    else:
+                        source = (i + migration_rng.integers(1, n_islands)) % n_islands
+                    migrants = results[source]["elite"]
+                    targets = migration_rng.choice(pop_size, size=len(migrants), replace=False)
+                    island["population"][targets] = migrants
+                migrations += 1
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if split is not None:
+            split.close()
+        if evaluator is not None:
+            evaluator.close()
+
+    best = int(np.argmax(island_best))
+    best_chromosome = island_best_chromosome[best]
     selected_features = [f for f, g in zip(feature_headers, best_chromosome) if g == 1]
+    cache_stats = [island["cache"].stats() for island in islands]
     return {
-        "best_fitness": float(best_fitness),
+        "best_fitness": float(island_best[best]),
         "best_chromosome": best_chromosome,
         "history": history,
         "converged": bool(converged),
         "selected_features": selected_features,
+        "cache_stats": {
+            key: sum(stats[key] for stats in cache_stats)
+            for key in ("hits", "misses", "evictions", "size", "maxSize")
+        },
+        "n_workers": n_workers,
+        "fitness_backend": ga_kwargs.get("fitness_backend", "sgd"),
+        "cancelled": cancelled,
+        "racing_stats": (
+            {
+                key: sum(stats[key] for stats in racing_stats)
+                for key in ("lowFidelityFits", "fullFits", "fullFitsAvoided")
+            }
+            if racing_stats else None
+        ),
+        "budget_stats": budget.stats(full_fits_used()) if budget is not None else None,
+        "island_stats": {
+            "islands": n_islands,
+            "migrationInterval": migration_interval,
+            "migrationSize": migration_size,
+            "topology": topology,
+            "migrations": migrations,
+            "islandBestFitness": [round(f, 4) for f in island_best],
+        },
     }
 
+
 def run_variance_threshold_selection(
     X_train,
     X_test,
@@ -211,34 +1653,30 @@ def run_variance_threshold_selection(
     y_test,
     feature_headers,
     threshold: float,
+    column_stats=None,
 ):
     """
     Execute VarianceThreshold selection and evaluate a classifier on selected features.
 
+    Precomputed column_stats (see column_statistics) are used instead of
+    fitting a VarianceThreshold when given.
+
     Returns dict with:
       - threshold, accuracy, selected_features, removed_features
     """
     try:
-        selector = VarianceThreshold(threshold=threshold)
-        selector.fit(X_train)
-        mask = selector.get_support(indices=True)
-        selected_features = [feature_headers[i] for i in mask]
-        removed_features = [f for i, f in enumerate(feature_headers) if i not in set(mask)]
-
-        if len(mask) == 0:
-            accuracy = 0.0
+        if column_stats is not None:
+            mask = np.flatnonzero(variance_threshold_masks(column_stats, [threshold])[0])
         else:
-            X_train_sel = selector.transform(X_train)
-            X_test_sel = selector.transform(X_test)
-            model = SGDClassifier(
-                loss="log_loss",
-                max_iter=200,
-                tol=1e-3,
-                n_jobs=-1,
-                random_state=42,
-            )
-            model.fit(X_train_sel, y_train)
-            accuracy = float(model.score(X_test_sel, y_test))
+            from sklearn.feature_selection import VarianceThreshold
+
+            selector = VarianceThreshold(threshold=threshold)
+            selector.fit(X_train)
+            mask = selector.get_support(indices=True)
+        selected_features = [feature_headers[i] for i in mask]
+        kept = set(mask)
+        removed_features = [f for i, f in enumerate(feature_headers) if i not in kept]
+        accuracy = _variance_threshold_accuracy(X_train, X_test, y_train, y_test, mask)
     except Exception:
         selected_features = []
         removed_features = list(feature_headers)
@@ -250,92 +1688,1795 @@ def run_variance_threshold_selection(
         "removed_features": removed_features,
     }
 
-# ---------- Flask routes ----------
-@app.route("/")
-def index():
-    return render_template("index.html")
 
-@app.route("/run_ga", methods=["POST"])
-def run_ga():
+def variance_threshold_masks(column_stats, thresholds):
     """
-    Main endpoint to run the Genetic Algorithm for feature selection.
+    Feature masks for several thresholds at once, one boolean row per
+    threshold, from precomputed column_stats (see column_statistics).
+    """
+    thresholds = np.asarray(thresholds, dtype=np.float64)
+    variances = column_stats["var"]
+    # As VarianceThreshold does, count constant columns as zero variance at threshold 0.
+    zero_variances = np.minimum(variances, column_stats["max"] - column_stats["min"])
+    return np.where((thresholds == 0)[:, None], zero_variances, variances) > thresholds[:, None]
 
-    This function is already implemented for you. Study it to understand
-    how all the GA components work together.
+
+def _variance_threshold_accuracy(X_train, X_test, y_train, y_test, mask):
+    if len(mask) == 0:
+        return 0.0
+    from sklearn.linear_model import SGDClassifier
+
+    model = SGDClassifier(
+        loss="log_loss",
+        max_iter=200,
+        tol=1e-3,
+        n_jobs=-1,
+        random_state=42,
+    )
+    model.fit(X_train[:, mask], y_train)
+    return float(model.score(X_test[:, mask], y_test))
+
+
+def run_variance_threshold_sweep(
+    X_train,
+    X_test,
+    y_train,
+    y_test,
+    thresholds,
+    column_stats=None,
+    n_workers=0,
+):
     """
-    data = request.json
-    pop_size = int(data.get("popSize", 30))
-    crossover_rate = float(data.get("crossRate", 0.7))
-    mutation_rate = float(data.get("mutRate", 0.1))
-    max_gen = int(data.get("maxGen", 20))
-    convergence_threshold = data.get("convergenceThreshold")
-    if convergence_threshold is not None:
-        convergence_threshold = float(data.get("convergenceThreshold"))
-    csv_content = data.get("csvData", "")
+    Evaluate VarianceThreshold at every one of thresholds in one pass.
 
-    # Get user-specified column indices
-    id_column_idx = data.get("idColumn")  # Can be None if no ID column
-    target_column_idx = data.get("targetColumn")  # Required
+    Column variances are computed once (or taken from column_stats) and
+    every threshold's mask comes from a single vectorized comparison.
+    Thresholds that keep the same features share one classifier fit, and
+    the distinct masks are fitted on a thread pool of n_workers threads
+    (<= 0 means all cores) that share the split.
 
-    if target_column_idx is None:
-        return jsonify({"error": "Target column must be specified"})
+    Returns dict with:
+      - thresholds, accuracies, num_selected (one entry per threshold, in order)
+      - masks (one boolean row per threshold), distinct_masks
+    """
+    if column_stats is None:
+        column_stats = column_statistics(X_train)
+    masks = variance_threshold_masks(column_stats, thresholds)
+    _, first, inverse = np.unique(np.packbits(masks, axis=1), axis=0, return_index=True, return_inverse=True)
+
+    def fit(mask):
+        try:
+            return _variance_threshold_accuracy(X_train, X_test, y_train, y_test, np.flatnonzero(mask))
+        except Exception:
+            return 0.0
 
-    # --- Load CSV ---
-    result, error = load_and_preprocess_csv(csv_content, target_column_idx, id_column_idx)
-    if error:
-        return jsonify({"error": error})
+    n_workers = min(resolve_worker_count(n_workers), len(first))
+    with ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="vt-sweep") as pool:
+        distinct_accuracies = np.array(list(pool.map(fit, masks[first])))
+    return {
+        "thresholds": [float(t) for t in thresholds],
+        "accuracies": distinct_accuracies[inverse.ravel()].tolist(),
+        "num_selected": masks.sum(axis=1).tolist(),
+        "masks": masks,
+        "distinct_masks": len(first),
+    }
 
-    X_train, X_test, y_train, y_test, feature_headers, target_header, df = result
-    feature_count = len(feature_headers)
 
-    ga = run_ga_feature_selection(
-        X_train,
-        X_test,
-        y_train,
-        y_test,
-        feature_headers,
-        pop_size,
-        crossover_rate,
-        mutation_rate,
-        max_gen,
-        convergence_threshold,
-    )
+# ---------- Baseline selectors ----------
+BASELINE_WORKERS = 4
+# name -> fn(X_train, X_test, y_train, y_test, feature_headers, params) -> result dict
+BASELINE_SELECTORS = {}
 
-    # Prepare response
-    response = {
-        "bestFitness": round(ga["best_fitness"], 4),
-        "bestChromosome": ga["best_chromosome"],
+
+def register_baseline(name):
+    """Add a selector to the methods /run_comparison can race against the GA."""
+    def decorator(fn):
+        BASELINE_SELECTORS[name] = fn
+        return fn
+    return decorator
+
+
+def run_kbest_selection(X_train, X_test, y_train, y_test, feature_headers, k, score_func=None):
+    """
+    Keep the k features with the highest univariate scores (f_classif unless
+    score_func is given) and evaluate the same classifier as the GA fitness
+    on them.
+
+    Returns dict with:
+      - k, accuracy, selected_features, removed_features
+    """
+    from sklearn.feature_selection import SelectKBest, f_classif
+
+    k = int(min(max(1, k), len(feature_headers)))
+    try:
+        selector = SelectKBest(score_func=score_func or f_classif, k=k)
+        selector.fit(X_train, y_train)
+        support = selector.get_support()
+        accuracy = evaluate_fitness(support, X_train, X_test, y_train, y_test)
+    except Exception:
+        support = np.zeros(len(feature_headers), dtype=bool)
+        accuracy = 0.0
+    return {
+        "k": k,
+        "accuracy": float(accuracy),
+        "selected_features": [f for f, keep in zip(feature_headers, support) if keep],
+        "removed_features": [f for f, keep in zip(feature_headers, support) if not keep],
+    }
+
+
+def _default_k(feature_headers, params):
+    k = params.get("k")
+    return int(k) if k is not None else max(1, len(feature_headers) // 2)
+
+
+@register_baseline("variance_threshold")
+def _variance_threshold_baseline(X_train, X_test, y_train, y_test, feature_headers, params):
+    return run_variance_threshold_selection(
+        X_train, X_test, y_train, y_test, feature_headers, params.get("threshold", 0.0),
+        params.get("column_stats"),
+    )
+
+
+@register_baseline("kbest_f_classif")
+def _kbest_f_classif_baseline(X_train, X_test, y_train, y_test, feature_headers, params):
+    return run_kbest_selection(
+        X_train, X_test, y_train, y_test, feature_headers, _default_k(feature_headers, params)
+    )
+
+
+def _mutual_info(X, y):
+    from sklearn.feature_selection import mutual_info_classif
+
+    return mutual_info_classif(X, y, random_state=42)
+
+
+@register_baseline("mutual_info")
+def _mutual_info_baseline(X_train, X_test, y_train, y_test, feature_headers, params):
+    return run_kbest_selection(
+        X_train, X_test, y_train, y_test, feature_headers, _default_k(feature_headers, params),
+        score_func=_mutual_info,
+    )
+
+
+def _timed_baseline(name, split, feature_headers, params):
+    start = time.perf_counter()
+    result = BASELINE_SELECTORS[name](*split, feature_headers, params)
+    return result, time.perf_counter() - start
+
+
+def submit_baselines(names, split, feature_headers, params, executor):
+    """
+    Start each named baseline on executor. The split arrays are shared, not
+    copied, so a thread pool is used: the fits spend most of their time in
+    NumPy and scikit-learn code that releases the GIL.
+
+    Returns:
+        dict: name -> Future of (result, seconds).
+    """
+    return {
+        name: executor.submit(_timed_baseline, name, split, feature_headers, params)
+        for name in names
+    }
+
+
+baseline_executor = ThreadPoolExecutor(max_workers=BASELINE_WORKERS, thread_name_prefix="baseline")
+
+
+# ---------- Univariate pre-screening ----------
+def _variance_scores(X, y):
+    if issparse(X):
+        mean = np.asarray(X.mean(axis=0)).ravel()
+        return np.asarray(X.multiply(X).mean(axis=0)).ravel() - mean ** 2
+    return np.var(X, axis=0)
+
+
+def _f_classif_scores(X, y):
+    from sklearn.feature_selection import f_classif
+
+    return f_classif(X, y)[0]
+
+
+SCREENING_METHODS = {
+    "f_classif": _f_classif_scores,
+    "mutual_info": _mutual_info,
+    "variance": _variance_scores,
+}
+
+
+def screen_features(X_train, y_train, method="f_classif", top_k=None, threshold=None):
+    """
+    Score every feature in one vectorized pass and keep those scoring above
+    threshold and/or the top_k best. At least the single best feature is
+    always kept.
+
+    Returns:
+        tuple: (kept column indices in original order, scores of all features)
+    """
+    scores = np.nan_to_num(np.asarray(SCREENING_METHODS[method](X_train, y_train), dtype=np.float64))
+    keep = np.ones(len(scores), dtype=bool)
+    if threshold is not None:
+        keep &= scores > threshold
+    if top_k is not None:
+        top = np.zeros(len(scores), dtype=bool)
+        top[np.argsort(-scores, kind="stable")[:top_k]] = True
+        keep &= top
+    if not keep.any():
+        keep[np.argmax(scores)] = True
+    return np.flatnonzero(keep), scores
+
+
+def biased_population(pop_size, scores, true_ratio=0.7, rng=None):
+    """
+    Initial population whose genes are switched on with a probability that
+    grows with the feature's score rank, averaging about true_ratio.
+    """
+    rng = np.random.default_rng(rng)
+    n = len(scores)
+    weight = (np.argsort(np.argsort(scores, kind="stable")) + 1) / n
+    prob = np.clip(true_ratio * weight / weight.mean(), 0.05, 0.95)
+    return (rng.random((pop_size, n)) < prob).astype(np.uint8)
+
+# ---------- Dataset registry ----------
+SPARSE_LAYOUT = "csc"
+DATASET_STORE_MAX_BYTES = 512 * 1024 * 1024
+# Separate budget for the files behind memory-mapped (streamed) datasets.
+DATASET_STORE_MAX_DISK_BYTES = 4 * 1024 * 1024 * 1024
+
+
+def _nbytes(arr):
+    if issparse(arr):
+        return arr.data.nbytes + arr.indices.nbytes + arr.indptr.nbytes
+    return np.asarray(arr).nbytes
+
+
+def _column_layout(X):
+    """Float32, column-major copy of X (memory-mapped arrays are left as written)."""
+    if issparse(X):
+        return X.tocsc().astype(np.float32, copy=False)
+    if isinstance(X, np.memmap):
+        return X
+    return np.asfortranarray(X, dtype=np.float32)
+
+
+# Rows per block are sized so a float64 copy of a block stays near this.
+STATS_CHUNK_BYTES = 16 * 1024 * 1024
+
+
+def _stats_chunk_rows(n_columns):
+    return max(1, STATS_CHUNK_BYTES // (8 * max(n_columns, 1)))
+
+
+class ColumnAccumulator:
+    """
+    Per-column mean, variance, min and max of a dense matrix fed to add()
+    in row blocks, accumulated in float64. Blocks are processed at most
+    _stats_chunk_rows rows at a time and their moments merged with Chan et
+    al.'s pairwise update, so memory stays bounded whatever the size of X
+    or of the blocks. finite turns False once a non-finite value is seen;
+    statistics stop updating from then on.
+    """
+
+    def __init__(self, n_columns):
+        self.count = 0
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+        self.min = np.full(n_columns, np.inf)
+        self.max = np.full(n_columns, -np.inf)
+        self.finite = True
+
+    def add(self, X):
+        for start, stop in _row_ranges(X.shape[0], _stats_chunk_rows(X.shape[1])):
+            self._add_block(X[start:stop])
+
+    def _add_block(self, block):
+        if not self.finite:
+            return
+        # A float64 copy that is then squared in place.
+        block = np.array(block, dtype=np.float64)
+        if not np.isfinite(block).all():
+            self.finite = False
+            return
+        n = len(block)
+        np.minimum(self.min, block.min(axis=0), out=self.min)
+        np.maximum(self.max, block.max(axis=0), out=self.max)
+        mean = block.mean(axis=0)
+        block -= mean
+        np.square(block, out=block)
+        total = self.count + n
+        delta = mean - self.mean
+        self.m2 += block.sum(axis=0) + delta ** 2 * (self.count * n / total)
+        self.mean += delta * (n / total)
+        self.count = total
+
+    def stats(self):
+        return {
+            "mean": self.mean.copy(),
+            "var": self.m2 / max(self.count, 1),
+            "min": self.min.copy(),
+            "max": self.max.copy(),
+        }
+
+
+def column_statistics(X):
+    """Per-column mean, variance, min and max of X, accumulated in float64."""
+    if issparse(X):
+        mean = np.asarray(X.mean(axis=0, dtype=np.float64)).ravel()
+        mean_sq = np.asarray(X.multiply(X).mean(axis=0, dtype=np.float64)).ravel()
+        return {
+            "mean": mean,
+            "var": np.maximum(mean_sq - mean ** 2, 0.0),
+            "min": X.min(axis=0).toarray().ravel().astype(np.float64),
+            "max": X.max(axis=0).toarray().ravel().astype(np.float64),
+        }
+    accumulator = ColumnAccumulator(X.shape[1])
+    accumulator.add(X)
+    return accumulator.stats()
+
+
+def _all_finite(X):
+    if issparse(X):
+        return bool(np.isfinite(X.data).all())
+    chunk_rows = _stats_chunk_rows(X.shape[1])
+    return all(np.isfinite(X[start:stop]).all() for start, stop in _row_ranges(X.shape[0], chunk_rows))
+
+
+NON_FINITE_FEATURES = "Feature values must be finite and fit in float32"
+
+
+class PreparedDataset:
+    """
+    A parsed, cleaned and split dataset, ready for any selection method.
+
+    Features are stored once as validated float32 in column-major order
+    (Fortran-ordered arrays or CSC matrices), so selecting a chromosome's
+    columns copies contiguous memory and fitness evaluation can skip its
+    NaN checks. Labels are encoded as integer codes into classes (sorted,
+    as np.unique orders them) and column_stats holds per-column statistics
+    of the training features.
+
+    Both checks and the statistics scan the arrays in row blocks, so
+    memory-mapped splits are never loaded whole. A caller that already
+    gathered column_stats and checked finiteness while writing the arrays
+    (see ingest_csv_stream) passes column_stats to skip both scans.
+
+    Raises ValueError if the features are not numeric or not finite. Unlike
+    the original loader, which kept such columns and scored every selection
+    that used them 0, a dataset with a non-numeric feature column is
+    rejected.
+    """
+
+    def __init__(
+        self, X_train, X_test, y_train, y_test, feature_headers, target_header, rows,
+        id_header=None, files=None, column_stats=None,
+    ):
+        self.X_train = _column_layout(X_train)
+        self.X_test = _column_layout(X_test)
+        if column_stats is None:
+            for X in (self.X_train, self.X_test):
+                if not _all_finite(X):
+                    raise ValueError(NON_FINITE_FEATURES)
+            column_stats = column_statistics(self.X_train)
+        self.classes, codes = np.unique(np.concatenate([y_train, y_test]), return_inverse=True)
+        self.y_train = codes[: len(y_train)]
+        self.y_test = codes[len(y_train):]
+        self.column_stats = column_stats
+        self.feature_headers = feature_headers
+        self.target_header = target_header
+        self.rows = rows
+        self.id_header = id_header
+        # Backing files of memory-mapped arrays, removed by release().
+        self.files = files or []
+        self.disk_bytes = sum(os.path.getsize(path) for path in self.files)
+
+    @property
+    def split(self):
+        return self.X_train, self.X_test, self.y_train, self.y_test
+
+    def columns(self, indices):
+        """
+        (X_train, X_test) restricted to the given feature indices. A
+        contiguous run of dense columns is returned as a view, not a copy.
+        """
+        indices = np.asarray(indices)
+        if (
+            not issparse(self.X_train) and len(indices)
+            and np.array_equal(indices, np.arange(indices[0], indices[0] + len(indices)))
+        ):
+            cols = slice(indices[0], indices[0] + len(indices))
+            return self.X_train[:, cols], self.X_test[:, cols]
+        return self.X_train[:, indices], self.X_test[:, indices]
+
+    @property
+    def nbytes(self):
+        """In-memory size of the split; memory-mapped arrays count in disk_bytes."""
+        return sum(_nbytes(arr) for arr in self.split if not isinstance(arr, np.memmap))
+
+    def release(self):
+        # Unlinking is safe while a run still maps the files; the data stays
+        # readable until the last mapping is closed.
+        for path in self.files:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self.files = []
+
+
+def dataset_id_for(csv_content, target_column_idx, id_column_idx=None, layout=""):
+    """
+    Content hash of a CSV together with the column roles used to split it.
+
+    csv_content may be a string or an iterable of byte chunks; layout tags
+    datasets stored in a different representation (e.g. "float32-mmap").
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(csv_content, str):
+        digest.update(csv_content.encode())
+    else:
+        for block in csv_content:
+            digest.update(block)
+    digest.update(f"|target={target_column_idx}|id={id_column_idx}|{layout}".encode())
+    return digest.hexdigest()
+
+
+def prepare_dataset(csv_content, target_column_idx, id_column_idx=None, timer=None, sparse=False):
+    """
+    Run load_and_preprocess_csv and keep only what the routes need. With
+    sparse=True the feature matrices are stored in CSC format.
+
+    Returns:
+        tuple: (PreparedDataset, None) or (None, error_message).
+    """
+    result, error = load_and_preprocess_csv(csv_content, target_column_idx, id_column_idx, timer)
+    if error:
+        return None, error
+    X_train, X_test, y_train, y_test, feature_headers, target_header, df = result
+    if sparse:
+        import scipy.sparse as sp
+
+        X_train, X_test = sp.csc_matrix(X_train), sp.csc_matrix(X_test)
+    id_header = str(df.columns[id_column_idx]) if id_column_idx is not None else None
+    try:
+        return PreparedDataset(
+            X_train, X_test, y_train, y_test, feature_headers, target_header, len(df), id_header
+        ), None
+    except (TypeError, ValueError) as e:
+        return None, f"Error processing CSV: feature columns must be numeric ({str(e)})"
+
+
+class DatasetStore:
+    """
+    Thread-safe in-process LRU store of prepared datasets, bounded by the
+    total in-memory size of their train/test arrays and, separately, by the
+    total size of the files behind memory-mapped ones. Evicted datasets are
+    released, which deletes those files.
+    """
+
+    def __init__(self, max_bytes=DATASET_STORE_MAX_BYTES, max_disk_bytes=DATASET_STORE_MAX_DISK_BYTES):
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self._datasets = OrderedDict()
+        self._bytes = 0
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, dataset_id):
+        with self._lock:
+            dataset = self._datasets.get(dataset_id)
+            if dataset is not None:
+                self._datasets.move_to_end(dataset_id)
+            return dataset
+
+    def _over_budget(self):
+        return self._bytes > self.max_bytes or self._disk_bytes > self.max_disk_bytes
+
+    def _discard(self, dataset, release):
+        self._bytes -= dataset.nbytes
+        self._disk_bytes -= dataset.disk_bytes
+        if release:
+            dataset.release()
+
+    def put(self, dataset_id, dataset):
+        with self._lock:
+            old = self._datasets.pop(dataset_id, None)
+            if old is not None:
+                self._discard(old, release=old is not dataset)
+            self._datasets[dataset_id] = dataset
+            self._bytes += dataset.nbytes
+            self._disk_bytes += dataset.disk_bytes
+            # Always keep the newest dataset, even if it alone exceeds a cap.
+            while self._over_budget() and len(self._datasets) > 1:
+                _, evicted = self._datasets.popitem(last=False)
+                self._discard(evicted, release=True)
+            metrics.set("dataset_store_bytes", self._bytes)
+            metrics.set("dataset_store_disk_bytes", self._disk_bytes)
+        metrics.observe("dataset_rows", dataset.rows)
+        metrics.observe("dataset_features", len(dataset.feature_headers))
+
+    def get_or_prepare(self, csv_content, target_column_idx, id_column_idx=None, timer=None, sparse=False):
+        """
+        Return (dataset_id, dataset, error), parsing and splitting the CSV only
+        if it is not already stored.
+        """
+        layout = SPARSE_LAYOUT if sparse else ""
+        dataset_id = dataset_id_for(csv_content, target_column_idx, id_column_idx, layout)
+        dataset = self.get(dataset_id)
+        if dataset is None:
+            dataset, error = prepare_dataset(csv_content, target_column_idx, id_column_idx, timer, sparse)
+            if error:
+                return None, None, error
+            self.put(dataset_id, dataset)
+        return dataset_id, dataset, None
+
+    def stats(self):
+        with self._lock:
+            return {
+                "datasets": len(self._datasets),
+                "bytes": self._bytes,
+                "maxBytes": self.max_bytes,
+                "diskBytes": self._disk_bytes,
+                "maxDiskBytes": self.max_disk_bytes,
+            }
+
+
+dataset_store = DatasetStore()
+
+
+# ---------- Result cache ----------
+RESULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "featuregene-results")
+RESULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Part of every key: bump it whenever a change alters the results or the
+# response format of a cached method, so results from older code are not
+# served after a deploy.
+RESULT_CACHE_VERSION = 2
+metrics.describe("result_cache_lookups_total", "counter", "Result cache lookups by method and outcome.")
+
+
+class ResultCache:
+    """
+    Persistent LRU store of JSON responses, one file per result, bounded by
+    total file size. Recency is the file mtime, so the order survives
+    restarts and is shared by every process using the same directory.
+    """
+
+    def __init__(self, directory=RESULT_CACHE_DIR, max_bytes=RESULT_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(dataset_id, method, params):
+        """
+        Key a result on RESULT_CACHE_VERSION, the dataset hash, the method and
+        its parameters (including seed).
+        """
+        payload = json.dumps([RESULT_CACHE_VERSION, dataset_id, method, params], sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key, method=""):
+        try:
+            with open(self._path(key)) as f:
+                result = json.load(f)
+            os.utime(self._path(key))
+        except (OSError, ValueError):
+            metrics.inc("result_cache_lookups_total", method=method, outcome="miss")
+            return None
+        metrics.inc("result_cache_lookups_total", method=method, outcome="hit")
+        return result
+
+    def put(self, key, result):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{self._path(key)}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(result, f)
+        os.replace(tmp_path, self._path(key))
+        self._evict()
+
+    def _entries(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self):
+        with self._lock:
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            # Always keep the newest result, even if it alone exceeds the cap.
+            for _, size, path in entries[:-1]:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                total -= size
+
+    def stats(self):
+        entries = self._entries() if os.path.isdir(self.directory) else []
+        return {
+            "results": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "maxBytes": self.max_bytes,
+        }
+
+
+result_cache = ResultCache()
+
+
+# ---------- Streaming CSV ingestion ----------
+INGEST_CHUNK_ROWS = 50_000
+INGEST_LAYOUT = "float32-mmap"
+DATASET_DIR = os.path.join(tempfile.gettempdir(), "featuregene-datasets")
+
+
+def _iter_blocks(stream, block_size=1024 * 1024):
+    while True:
+        block = stream.read(block_size)
+        if not block:
+            return
+        yield block
+
+
+def _copy_rows(source, indices, path, chunk_rows, accumulator):
+    """
+    Gather source[indices] into a new float32 memmap, chunk_rows at a time,
+    feeding each chunk to a ColumnAccumulator on the way.
+    """
+    # Column-major, like in-memory datasets, so fitness reads whole columns.
+    out = np.lib.format.open_memmap(
+        path, mode="w+", dtype=np.float32, shape=(len(indices), source.shape[1]), fortran_order=True
+    )
+    for start in range(0, len(indices), chunk_rows):
+        chunk = source[indices[start:start + chunk_rows]]
+        accumulator.add(chunk)
+        out[start:start + chunk_rows] = chunk
+    out.flush()
+    del out
+    return np.load(path, mmap_mode="r")
+
+
+def ingest_csv_stream(
+    stream, target_column_idx, id_column_idx=None, chunk_rows=INGEST_CHUNK_ROWS, storage_dir=DATASET_DIR,
+):
+    """
+    Parse a CSV file object in chunks into float32 memory-mapped train/test
+    arrays, so peak memory is bounded by chunk_rows rather than file size.
+
+    Column indices refer to the columns of the CSV header. Cleaning and the
+    split mirror prepare_dataset: empty rows and rows with missing values are
+    dropped, a non-numeric feature value is an error, then a stratified (when
+    possible) 70/30 split with random_state=42 is taken.
+
+    Returns:
+        tuple: (PreparedDataset, None) or (None, error_message).
+    """
+    import pandas as pd
+    from sklearn.model_selection import train_test_split
+
+    os.makedirs(storage_dir, exist_ok=True)
+    prefix = os.path.join(storage_dir, uuid.uuid4().hex)
+    raw_path = prefix + ".raw.f32"
+    train_path = prefix + ".X_train.npy"
+    test_path = prefix + ".X_test.npy"
+
+    try:
+        reader = pd.read_csv(stream, chunksize=chunk_rows)
+        columns = None
+        rows = 0
+        label_codes = {}
+        y_parts = []
+        with open(raw_path, "wb") as raw:
+            for chunk in reader:
+                if columns is None:
+                    columns = list(chunk.columns)
+                    if target_column_idx >= len(columns) or target_column_idx < 0:
+                        return None, f"Invalid target column index: {target_column_idx}. Dataset has {len(columns)} columns (0-{len(columns)-1})"
+                    if id_column_idx is not None and (id_column_idx >= len(columns) or id_column_idx < 0):
+                        return None, f"Invalid ID column index: {id_column_idx}. Dataset has {len(columns)} columns (0-{len(columns)-1})"
+                    excluded = {target_column_idx, id_column_idx}
+                    feature_column_indices = [i for i in range(len(columns)) if i not in excluded]
+
+                chunk = chunk.dropna(how="all")
+                rows += len(chunk)
+                try:
+                    X = chunk.iloc[:, feature_column_indices].to_numpy(dtype=np.float32)
+                except (TypeError, ValueError) as e:
+                    return None, f"Error processing CSV: feature columns must be numeric ({str(e)})"
+                y = chunk.iloc[:, target_column_idx]
+                mask = ~(np.isnan(X).any(axis=1) | y.isna().to_numpy())
+
+                codes, uniques = pd.factorize(y[mask])
+                mapping = np.array([label_codes.setdefault(u, len(label_codes)) for u in uniques], dtype=np.int32)
+                raw.write(np.ascontiguousarray(X[mask]).tobytes())
+                y_parts.append(mapping[codes] if len(codes) else np.empty(0, dtype=np.int32))
+
+        if columns is None:
+            return None, "Not enough valid data rows after cleaning"
+        y_codes = np.concatenate(y_parts) if y_parts else np.empty(0, dtype=np.int32)
+        if len(y_codes) < 2:
+            return None, "Not enough valid data rows after cleaning"
+
+        # Renumber labels in sorted order so stratification (and thus the
+        # split) matches load_and_preprocess_csv on the same file.
+        labels = pd.Index(list(label_codes))
+        order = labels.argsort()
+        rank = np.empty(len(order), dtype=np.int32)
+        rank[order] = np.arange(len(order))
+        y_codes = rank[y_codes]
+        labels = labels[order].to_numpy()
+
+        X_all = np.memmap(raw_path, dtype=np.float32, mode="r", shape=(len(y_codes), len(feature_column_indices)))
+        indices = np.arange(len(y_codes))
+        _, class_counts = np.unique(y_codes, return_counts=True)
+        stratify = y_codes if np.all(class_counts >= 2) else None
+        train_idx, test_idx = train_test_split(indices, test_size=0.3, random_state=42, stratify=stratify)
+
+        # Statistics and finiteness are gathered during the copy rather than
+        # by PreparedDataset, which would read both memmaps again.
+        train_stats = ColumnAccumulator(X_all.shape[1])
+        test_stats = ColumnAccumulator(X_all.shape[1])
+        X_train = _copy_rows(X_all, train_idx, train_path, chunk_rows, train_stats)
+        X_test = _copy_rows(X_all, test_idx, test_path, chunk_rows, test_stats)
+        del X_all
+        if not (train_stats.finite and test_stats.finite):
+            raise ValueError(NON_FINITE_FEATURES)
+
+        feature_headers = [columns[i] for i in feature_column_indices]
+        id_header = str(columns[id_column_idx]) if id_column_idx is not None else None
+        return PreparedDataset(
+            X_train, X_test, labels[y_codes[train_idx]], labels[y_codes[test_idx]],
+            feature_headers, columns[target_column_idx], rows, id_header,
+            files=[train_path, test_path], column_stats=train_stats.stats(),
+        ), None
+
+    except Exception as e:
+        for path in (train_path, test_path):
+            if os.path.exists(path):
+                os.remove(path)
+        return None, f"Error processing CSV: {str(e)}"
+    finally:
+        if os.path.exists(raw_path):
+            os.remove(raw_path)
+
+
+def ingest_uploaded_file(stream, target_column_idx, id_column_idx=None):
+    """
+    Register a seekable uploaded CSV file object in the dataset store,
+    skipping ingestion if an identical upload is already stored.
+
+    Returns:
+        tuple: (dataset_id, dataset, None) or (None, None, error_message).
+    """
+    dataset_id = dataset_id_for(_iter_blocks(stream), target_column_idx, id_column_idx, INGEST_LAYOUT)
+    dataset = dataset_store.get(dataset_id)
+    if dataset is not None:
+        return dataset_id, dataset, None
+    stream.seek(0)
+    dataset, error = ingest_csv_stream(stream, target_column_idx, id_column_idx)
+    if error:
+        return None, None, error
+    dataset_store.put(dataset_id, dataset)
+    return dataset_id, dataset, None
+
+
+def load_svmlight_dataset(stream):
+    """
+    Load an svmlight/libsvm file straight into CSC splits, so memory scales
+    with the number of nonzeros rather than rows x features. Rows with NaN
+    values are dropped, as in load_and_preprocess_csv.
+
+    Returns:
+        tuple: (PreparedDataset, None) or (None, error_message).
+    """
+    from sklearn.datasets import load_svmlight_file
+
+    try:
+        X, y = load_svmlight_file(stream, dtype=np.float64)
+    except Exception as e:
+        return None, f"Error parsing svmlight file: {str(e)}"
+
+    nan_rows = np.repeat(np.arange(X.shape[0]), np.diff(X.indptr))[np.isnan(X.data)]
+    if nan_rows.size:
+        keep = np.ones(X.shape[0], dtype=bool)
+        keep[nan_rows] = False
+        X, y = X[keep], y[keep]
+    if X.shape[0] < 2:
+        return None, "Not enough valid data rows after cleaning"
+
+    X_train, X_test, y_train, y_test = split_train_test(X, y)
+    feature_headers = [f"f{i}" for i in range(X.shape[1])]
+    try:
+        return PreparedDataset(
+            X_train.tocsc(), X_test.tocsc(), y_train, y_test, feature_headers, "label", X.shape[0]
+        ), None
+    except ValueError as e:
+        return None, f"Error parsing svmlight file: {str(e)}"
+
+
+def ingest_svmlight_file(stream):
+    """Register an uploaded svmlight file, reusing an identical stored upload."""
+    dataset_id = dataset_id_for(_iter_blocks(stream), None, None, "svmlight-" + SPARSE_LAYOUT)
+    dataset = dataset_store.get(dataset_id)
+    if dataset is not None:
+        return dataset_id, dataset, None
+    stream.seek(0)
+    dataset, error = load_svmlight_dataset(stream)
+    if error:
+        return None, None, error
+    dataset_store.put(dataset_id, dataset)
+    return dataset_id, dataset, None
+
+
+def load_dataset_file(path, fmt="csv", target_column_idx=None, id_column_idx=None, sparse=False):
+    """
+    Register a CSV or svmlight ("svmlight") file on disk in the dataset store,
+    reusing it if the same content is already stored.
+
+    Returns:
+        tuple: (dataset_id, None) or (None, error_message).
+    """
+    if fmt == "svmlight":
+        with open(path, "rb") as f:
+            dataset_id, _, error = ingest_svmlight_file(f)
+    else:
+        with open(path) as f:
+            csv_content = f.read()
+        dataset_id, _, error = dataset_store.get_or_prepare(
+            csv_content, target_column_idx, id_column_idx, sparse=sparse
+        )
+    if error:
+        return None, error
+    return dataset_id, None
+
+
+def resolve_dataset(data, timer=None):
+    """
+    Resolve a request body to a PreparedDataset, either from a datasetId
+    returned by /datasets or from inline csvData plus column indices.
+    Parsing phases are recorded on timer when the CSV is not yet stored.
+
+    Returns:
+        tuple: (dataset_id, dataset, None) or (None, None, error_message).
+    """
+    dataset_id = data.get("datasetId")
+    if dataset_id:
+        dataset = dataset_store.get(dataset_id)
+        if dataset is None:
+            return None, None, f"Unknown or expired dataset ID: {dataset_id}"
+        return dataset_id, dataset, None
+
+    target_column_idx = data.get("targetColumn")
+    if target_column_idx is None:
+        return None, None, "Target column must be specified"
+    return dataset_store.get_or_prepare(
+        data.get("csvData", ""), target_column_idx, data.get("idColumn"), timer, bool(data.get("sparse"))
+    )
+
+
+# ---------- Admission control ----------
+MAX_CONCURRENT_RUNS = 2
+MAX_QUEUED_RUNS = 8
+ADMISSION_POLL_SECONDS = 0.5
+
+metrics.describe("ga_runs_active", "gauge", "GA-based runs currently executing.")
+metrics.describe("ga_runs_queued", "gauge", "GA-based runs waiting for a slot.")
+metrics.describe("ga_runs_rejected_total", "counter", "GA-based runs turned away because the queue was full.")
+metrics.describe("ga_run_queue_wait_seconds", "histogram", "Time GA-based runs waited for a slot.")
+
+
+class QueueFull(Exception):
+    """Raised by RunAdmission.enter when neither a slot nor a queue place is free."""
+
+    def __init__(self, info):
+        super().__init__("Too many GA runs in progress; try again later")
+        self.info = info
+
+
+class AdmissionTicket:
+    __slots__ = ("admission", "admitted", "entered", "started")
+
+    def __init__(self, admission):
+        self.admission = admission
+        self.admitted = False
+        self.entered = time.perf_counter()
+        self.started = None
+
+    def position(self):
+        return self.admission.position(self)
+
+
+class RunAdmission:
+    """
+    Caps GA-based runs (GA, comparison and sweep requests, synchronous or as
+    jobs) at max_running at a time. Up to max_queued more wait for a slot in
+    arrival order; beyond that enter() fails at once, so an overloaded
+    server turns requests away quickly instead of letting latency grow
+    without bound.
+
+    The limits are per process: under gunicorn every worker has its own.
+    """
+
+    def __init__(self, max_running=MAX_CONCURRENT_RUNS, max_queued=MAX_QUEUED_RUNS):
+        self.max_running = max_running
+        self.max_queued = max_queued
+        self._cond = threading.Condition()
+        self._running = 0
+        self._queue = deque()
+        # Moving average of run durations, used to suggest when to retry.
+        self._mean_seconds = None
+
+    def enter(self):
+        """Take a ticket that holds a free slot or, failing that, a queue place."""
+        ticket = AdmissionTicket(self)
+        with self._cond:
+            if self._running < self.max_running and not self._queue:
+                self._running += 1
+                ticket.admitted = True
+            elif len(self._queue) < self.max_queued:
+                self._queue.append(ticket)
+            else:
+                metrics.inc("ga_runs_rejected_total")
+                raise QueueFull(self._status(len(self._queue) + 1))
+            self._publish()
+        return ticket
+
+    def wait(self, ticket, should_stop=None):
+        """
+        Block until ticket holds a slot. Returns False, giving up the queue
+        place, if should_stop() turns True first.
+        """
+        with self._cond:
+            while not ticket.admitted:
+                if should_stop is not None and should_stop():
+                    self._queue.remove(ticket)
+                    self._publish()
+                    return False
+                self._cond.wait(ADMISSION_POLL_SECONDS)
+        ticket.started = time.perf_counter()
+        metrics.observe("ga_run_queue_wait_seconds", ticket.started - ticket.entered)
+        return True
+
+    def leave(self, ticket):
+        """Release a ticket's slot or queue place and hand free slots on in order."""
+        with self._cond:
+            if ticket.admitted:
+                self._running -= 1
+                if ticket.started is not None:
+                    seconds = time.perf_counter() - ticket.started
+                    self._mean_seconds = (
+                        seconds if self._mean_seconds is None else 0.8 * self._mean_seconds + 0.2 * seconds
+                    )
+            elif ticket in self._queue:
+                self._queue.remove(ticket)
+            while self._queue and self._running < self.max_running:
+                self._queue.popleft().admitted = True
+                self._running += 1
+            self._cond.notify_all()
+            self._publish()
+
+    @contextmanager
+    def slot(self):
+        """Run the with block in a slot, queueing for one if needed. Raises QueueFull."""
+        ticket = self.enter()
+        try:
+            self.wait(ticket)
+            yield
+        finally:
+            self.leave(ticket)
+
+    def position(self, ticket):
+        """
+        1-based place of ticket in the queue, 0 once it holds a slot, or None
+        if it gave up its queue place without getting one.
+        """
+        with self._cond:
+            if ticket.admitted:
+                return 0
+            if ticket not in self._queue:
+                return None
+            return self._queue.index(ticket) + 1
+
+    def stats(self):
+        with self._cond:
+            return self._status(None)
+
+    def _status(self, position):
+        # Roughly when a place would free up if every run took the average time.
+        mean = self._mean_seconds if self._mean_seconds is not None else 1.0
+        return {
+            "running": self._running,
+            "queued": len(self._queue),
+            "maxRunning": self.max_running,
+            "maxQueued": self.max_queued,
+            "queuePosition": position,
+            "retryAfterSeconds": max(1, int(np.ceil(mean * (len(self._queue) + 1) / max(self.max_running, 1)))),
+        }
+
+    def _publish(self):
+        metrics.set("ga_runs_active", self._running)
+        metrics.set("ga_runs_queued", len(self._queue))
+
+
+run_admission = RunAdmission()
+
+
+def busy_response(error):
+    """429 response for a QueueFull, with the queue state and a Retry-After hint."""
+    response = jsonify({"error": str(error), **error.info})
+    response.status_code = 429
+    response.headers["Retry-After"] = str(error.info["retryAfterSeconds"])
+    return response
+
+
+def run_admitted(builder, data):
+    """Build a GA-based response inside an admission slot (or a 429 if the queue is full)."""
+    try:
+        with run_admission.slot():
+            result = builder(data)
+    except QueueFull as e:
+        return busy_response(e)
+    return json_response(result, data)
+
+
+# ---------- Flask routes ----------
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+
+
+@app.after_request
+def record_request_metrics(response):
+    start = g.pop("request_start", None)
+    if start is not None:
+        endpoint = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        metrics.observe(
+            "http_request_duration_seconds", time.perf_counter() - start,
+            endpoint=endpoint, method=request.method,
+        )
+        metrics.inc(
+            "http_requests_total", endpoint=endpoint, method=request.method, status=response.status_code
+        )
+    return response
+
+
+@app.route("/")
+def index():
+    return render_template("index.html")
+
+
+@app.route("/metrics", methods=["GET"])
+def metrics_endpoint():
+    """Expose request, fitness and dataset metrics in Prometheus text format."""
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+@app.route("/datasets", methods=["POST"])
+def upload_dataset():
+    """
+    Parse, clean and split a CSV once and return a dataset ID that the run
+    endpoints accept in place of csvData.
+
+    Accepts either a JSON body with csvData (stored as CSC sparse matrices
+    when "sparse" is true), or a multipart upload with a "file" part that is
+    ingested in chunks into float32 memory-mapped arrays. Uploads with
+    format=svmlight are loaded directly into sparse matrices instead.
+    """
+    upload = request.files.get("file")
+    if upload is not None and request.form.get("format") == "svmlight":
+        dataset_id, dataset, error = ingest_svmlight_file(upload.stream)
+    elif upload is not None:
+        target_column_idx = request.form.get("targetColumn", type=int)
+        id_column_idx = request.form.get("idColumn", type=int)
+        if target_column_idx is None:
+            return jsonify({"error": "Target column must be specified"})
+        dataset_id, dataset, error = ingest_uploaded_file(upload.stream, target_column_idx, id_column_idx)
+    else:
+        data = request.json
+        target_column_idx = data.get("targetColumn")
+        if target_column_idx is None:
+            return jsonify({"error": "Target column must be specified"})
+
+        dataset_id, dataset, error = dataset_store.get_or_prepare(
+            data.get("csvData", ""), target_column_idx, data.get("idColumn"), sparse=bool(data.get("sparse"))
+        )
+    if error:
+        return jsonify({"error": error})
+
+    response = {
+        "datasetId": dataset_id,
+        "rows": dataset.rows,
+        "target": dataset.target_header,
+        "featuresCount": len(dataset.feature_headers),
+        "featureHeaders": [str(h) for h in dataset.feature_headers],
+        "sparse": issparse(dataset.X_train),
+    }
+    if dataset.id_header is not None:
+        response["idColumn"] = dataset.id_header
+    return jsonify(response)
+
+def parse_ga_params(data):
+    """
+    Read GA keyword arguments for run_ga_feature_selection from a request body.
+
+    Returns:
+        tuple: (kwargs, None) or (None, error_message).
+    """
+    convergence_threshold = data.get("convergenceThreshold")
+    if convergence_threshold is not None:
+        convergence_threshold = float(convergence_threshold)
+    fitness_backend = data.get("fitnessBackend", "sgd")
+    if fitness_backend not in FITNESS_BACKENDS:
+        return None, f"Unknown fitness backend: {fitness_backend}"
+    evaluation_strategy = data.get("evaluationStrategy", "full")
+    if evaluation_strategy not in EVALUATION_STRATEGIES:
+        return None, f"Unknown evaluation strategy: {evaluation_strategy}"
+    if evaluation_strategy == "halving" and fitness_backend != "sgd":
+        return None, "Successive halving requires the sgd fitness backend"
+    fit_chunk_rows = DEFAULT_FIT_CHUNK_ROWS
+    fit_epochs = DEFAULT_FIT_EPOCHS
+    if fitness_backend == "chunked":
+        fit_chunk_rows = int(data.get("chunkRows", DEFAULT_FIT_CHUNK_ROWS))
+        fit_epochs = int(data.get("epochs", DEFAULT_FIT_EPOCHS))
+        if fit_chunk_rows < 1:
+            return None, "chunkRows must be at least 1"
+        if fit_epochs < 1:
+            return None, "epochs must be at least 1"
+    fidelity_levels = int(data.get("fidelityLevels", DEFAULT_FIDELITY_LEVELS))
+    promotion_ratio = float(data.get("promotionRatio", DEFAULT_PROMOTION_RATIO))
+    if fidelity_levels < 1:
+        return None, "fidelityLevels must be at least 1"
+    if not 0 < promotion_ratio < 1:
+        return None, "promotionRatio must be between 0 and 1"
+    screening, error = parse_screening(data.get("screening"), int(data.get("islands", 1)))
+    if error:
+        return None, error
+    seed = data.get("seed")
+    if seed is not None:
+        try:
+            seed = int(seed)
+        except (TypeError, ValueError):
+            return None, "seed must be a non-negative integer"
+        if seed < 0:
+            return None, "seed must be a non-negative integer"
+    budget_seconds = data.get("timeBudgetSeconds")
+    if budget_seconds is not None:
+        budget_seconds = float(budget_seconds)
+        if budget_seconds <= 0:
+            return None, "timeBudgetSeconds must be positive"
+    budget_evaluations = data.get("evaluationBudget")
+    if budget_evaluations is not None:
+        budget_evaluations = int(budget_evaluations)
+        if budget_evaluations < 1:
+            return None, "evaluationBudget must be at least 1"
+    n_islands = int(data.get("islands", 1))
+    checkpoint_interval = int(data.get("checkpointInterval", 0))
+    if checkpoint_interval and n_islands > 1:
+        return None, "Checkpointing is not supported for island runs"
+    islands = None
+    if n_islands > 1:
+        topology = data.get("topology", "ring")
+        if topology not in TOPOLOGIES:
+            return None, f"Unknown island topology: {topology}"
+        islands = {
+            "n_islands": n_islands,
+            "migration_interval": int(data.get("migrationInterval", 5)),
+            "migration_size": int(data.get("migrationSize", 2)),
+            "topology": topology,
+        }
+    return {
+        "pop_size": int(data.get("popSize", 30)),
+        "crossover_rate": float(data.get("crossRate", 0.7)),
+        "mutation_rate": float(data.get("mutRate", 0.1)),
+        "max_gen": int(data.get("maxGen", 20)),
+        "convergence_threshold": convergence_threshold,
+        "fitness_cache": FitnessCache(int(data.get("fitnessCacheSize", DEFAULT_FITNESS_CACHE_SIZE))),
+        # Island runs spread over all cores unless told otherwise.
+        "n_workers": int(data.get("workers", 0 if islands else 1)),
+        "fitness_backend": fitness_backend,
+        "fit_chunk_rows": fit_chunk_rows,
+        "fit_epochs": fit_epochs,
+        "evaluation_strategy": evaluation_strategy,
+        "fidelity_levels": fidelity_levels,
+        "promotion_ratio": promotion_ratio,
+        "seed": seed,
+        "checkpoint_interval": checkpoint_interval,
+        "budget_seconds": budget_seconds,
+        "budget_evaluations": budget_evaluations,
+        "islands": islands,
+        "screening": screening,
+    }, None
+
+
+def parse_screening(screening, n_islands):
+    """
+    Read the optional "screening" block of a request, e.g.
+    {"method": "f_classif", "topK": 20} or {"method": "variance", "bias": true}.
+
+    Returns:
+        tuple: (screening dict or None, None) or (None, error_message).
+    """
+    if not screening:
+        return None, None
+    method = screening.get("method", "f_classif")
+    if method not in SCREENING_METHODS:
+        return None, f"Unknown screening method: {method}"
+    top_k = screening.get("topK")
+    threshold = screening.get("threshold")
+    bias = bool(screening.get("bias", False))
+    if top_k is None and threshold is None and not bias:
+        return None, "screening needs topK, threshold or bias"
+    if top_k is not None and int(top_k) < 1:
+        return None, "screening topK must be at least 1"
+    if bias and n_islands > 1:
+        return None, "Biased initial populations are not supported for island runs"
+    return {
+        "method": method,
+        "top_k": int(top_k) if top_k is not None else None,
+        "threshold": float(threshold) if threshold is not None else None,
+        "bias": bias,
+    }, None
+
+
+def result_cache_key(dataset_id, method, params, **extra):
+    """
+    Result cache key for a seeded GA-based request, or None when the run is
+    not reproducible (no seed or a time budget) or continues a checkpoint.
+    """
+    if params["seed"] is None or params["checkpoint_interval"] > 0 or params["budget_seconds"] is not None:
+        return None
+    # The worker count changes how fast a run is, not its result.
+    key_params = {name: value for name, value in params.items() if name not in ("fitness_cache", "n_workers")}
+    key_params["fitness_cache_size"] = params["fitness_cache"].max_size
+    return result_cache.key_for(dataset_id, method, {**key_params, **extra})
+
+
+def cached_response(cached, data, timer):
+    response = {**cached, "cached": True}
+    if data.get("timings"):
+        response["timings"] = timer.as_dict()
+    return response
+
+
+def store_response(cache_key, response):
+    """Persist a response (minus per-request timings) and mark it uncached."""
+    if cache_key is not None:
+        result_cache.put(cache_key, {k: v for k, v in response.items() if k != "timings"})
+    response["cached"] = False
+    return response
+
+
+# ---------- Compact responses ----------
+# A body with "compact": true gets its GA, comparison or VarianceThreshold
+# response in this encoding (decoded by decodeCompactResponse in
+# static/js/api-client.js), gzipped if the client accepts it:
+#   - featureHeaders lists every feature, unless the body's
+#     featureHeadersDigest shows the client already has them; the
+#     featureHeadersDigest of the response identifies them either way;
+#   - selectedFeatures (and keptFeatures of a screening block) are indices
+#     into them, and removedFeatures is dropped as their complement;
+#   - bestChromosome is the base64 of its np.packbits bytes, and the GA's
+#     own selectedFeatures is dropped as its set bits;
+#   - a comparison's varianceThreshold block is dropped, being
+#     baselines.variance_threshold.
+COMPACT_ENCODING = "packed-v1"
+GZIP_MIN_BYTES = 1024
+GZIP_LEVEL = 6
+
+
+def pack_chromosome(chromosome):
+    return base64.b64encode(chromosome_key(chromosome)).decode("ascii")
+
+
+def unpack_chromosome(packed, length):
+    bits = np.frombuffer(base64.b64decode(packed), dtype=np.uint8)
+    return np.unpackbits(bits, count=length).tolist()
+
+
+def headers_digest(feature_headers):
+    digest = hashlib.blake2b(digest_size=8)
+    for header in feature_headers:
+        digest.update(str(header).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def compact_response(response, feature_headers, known_digest=None):
+    """Re-encode a GA, comparison or VarianceThreshold response compactly."""
+    positions = {}
+
+    def indices(names):
+        if not positions:
+            positions.update((name, i) for i, name in enumerate(feature_headers))
+        return [positions[name] for name in names]
+
+    def screened(block):
+        if block.get("screening"):
+            block["screening"] = {**block["screening"], "keptFeatures": indices(block["screening"]["keptFeatures"])}
+        return block
+
+    def selection(block):
+        block = {k: v for k, v in block.items() if k != "removedFeatures"}
+        block["selectedFeatures"] = indices(block["selectedFeatures"])
+        return screened(block)
+
+    if "bestChromosome" in response:
+        compact = screened({k: v for k, v in response.items() if k != "selectedFeatures"})
+        compact["bestChromosome"] = pack_chromosome(response["bestChromosome"])
+    elif "ga" in response:
+        compact = dict(response)
+        compact["ga"] = selection(response["ga"])
+        compact["baselines"] = {name: selection(block) for name, block in response["baselines"].items()}
+        compact.pop("varianceThreshold", None)
+    else:
+        compact = selection(response)
+
+    digest = headers_digest(feature_headers)
+    compact["encoding"] = COMPACT_ENCODING
+    compact["featureHeadersDigest"] = digest
+    if known_digest != digest:
+        compact["featureHeaders"] = list(feature_headers)
+    return compact
+
+
+def finish_response(data, dataset, response):
+    """Apply the encoding a request body asked for to its response."""
+    if data.get("compact"):
+        return compact_response(response, dataset.feature_headers, data.get("featureHeadersDigest"))
+    return response
+
+
+def json_response(payload, data):
+    """
+    jsonify payload, gzipped when the body asked for a compact response, the
+    client accepts gzip and the payload is large enough to be worth it.
+    """
+    response = jsonify(payload)
+    if (
+        data.get("compact")
+        and "gzip" in request.accept_encodings
+        and response.content_length >= GZIP_MIN_BYTES
+    ):
+        response.set_data(gzip.compress(response.get_data(), compresslevel=GZIP_LEVEL))
+        response.headers["Content-Encoding"] = "gzip"
+        response.vary.add("Accept-Encoding")
+    return response
+
+
+def run_ga_search(dataset, params, on_generation=None, should_stop=None, timer=None):
+    """
+    Run the single-population or island GA described by parse_ga_params.
+    Island runs evolve in worker processes, so they are timed as one phase.
+    The run's RunBudget, if any, starts counting here.
+
+    With screening set, the GA searches only the features kept by
+    screen_features; best_chromosome is mapped back to the full feature list
+    and the result gains screening_stats.
+    """
+    params = dict(params)
+    islands = params.pop("islands")
+    screening = params.pop("screening")
+    budget_seconds = params.pop("budget_seconds")
+    budget_evaluations = params.pop("budget_evaluations")
+    if budget_seconds is not None or budget_evaluations is not None:
+        params["budget"] = RunBudget(budget_seconds, budget_evaluations)
+    # PreparedDataset validated its features when it was built.
+    params["check_nan"] = False
+    timer = timer if timer is not None else PhaseTimer()
+    X_train, X_test, y_train, y_test = dataset.split
+    feature_headers = dataset.feature_headers
+
+    kept = None
+    if screening is not None:
+        with timer.phase("screening"):
+            kept, scores = screen_features(
+                X_train, y_train, screening["method"], screening["top_k"], screening["threshold"]
+            )
+            if len(kept) < len(feature_headers):
+                X_train, X_test = dataset.columns(kept)
+                feature_headers = [feature_headers[i] for i in kept]
+        if screening["bias"]:
+            # Draw the biased population from the run's own seeded stream.
+            rng = np.random.default_rng(params["seed"])
+            params["initial_population"] = biased_population(params["pop_size"], scores[kept], rng=rng)
+            params["seed"] = rng
+
+    if islands is None:
+        ga = run_ga_feature_selection(
+            X_train, X_test, y_train, y_test, feature_headers,
+            on_generation=on_generation, should_stop=should_stop, timer=timer, **params,
+        )
+    else:
+        with timer.phase("island_evolution"):
+            ga = run_island_ga(
+                X_train, X_test, y_train, y_test, feature_headers,
+                on_generation=on_generation, should_stop=should_stop, **islands, **params,
+            )
+
+    if kept is not None:
+        full = np.zeros(len(dataset.feature_headers), dtype=np.uint8)
+        if ga["best_chromosome"]:
+            full[kept] = ga["best_chromosome"]
+        ga["best_chromosome"] = full.tolist()
+        ga["screening_stats"] = {
+            "method": screening["method"],
+            "featuresBefore": len(dataset.feature_headers),
+            "featuresAfter": len(kept),
+            "keptFeatures": [str(h) for h in feature_headers],
+            "biasedInitialPopulation": screening["bias"],
+        }
+    return ga
+
+
+# Request fields a resumed run may change; everything else is replayed from
+# the checkpointed request so the continuation is exact.
+RESUME_OVERRIDES = (
+    "maxGen", "workers", "checkpointInterval", "timings", "compact", "timeBudgetSeconds", "evaluationBudget",
+    "csvData", "targetColumn", "idColumn",
+)
+
+
+def checkpoint_file(checkpoint_id):
+    return os.path.join(CHECKPOINT_DIR, f"{checkpoint_id}.npz")
+
+
+def save_checkpoint_request(checkpoint_id, data, dataset_id):
+    """Record the request a checkpointed run was started with."""
+    request_data = {k: v for k, v in data.items() if k not in ("csvData", "resumeFrom")}
+    request_data["datasetId"] = dataset_id
+    os.makedirs(CHECKPOINT_DIR, exist_ok=True)
+    with open(os.path.join(CHECKPOINT_DIR, f"{checkpoint_id}.json"), "w") as f:
+        json.dump(request_data, f)
+
+
+def load_checkpoint_request(checkpoint_id):
+    """
+    Returns:
+        tuple: (request_data, state, None) or (None, None, error_message).
+    """
+    if not re.fullmatch(r"[0-9a-f]{32}", str(checkpoint_id)):
+        return None, None, f"Invalid checkpoint ID: {checkpoint_id}"
+    try:
+        with open(os.path.join(CHECKPOINT_DIR, f"{checkpoint_id}.json")) as f:
+            request_data = json.load(f)
+        state = load_checkpoint(checkpoint_file(checkpoint_id))
+    except (OSError, ValueError, KeyError):
+        return None, None, f"Unknown or unreadable checkpoint: {checkpoint_id}"
+    return request_data, state, None
+
+
+def resume_request(checkpoint_id, data):
+    """
+    Build the request body for resuming a checkpointed run: the saved request
+    with only RESUME_OVERRIDES taken from data. If the saved dataset ID has
+    expired, sending the same csvData again recreates it.
+
+    Returns:
+        tuple: (request_data, state, None) or (None, None, error_message).
+    """
+    saved, state, error = load_checkpoint_request(checkpoint_id)
+    if error:
+        return None, None, error
+    resumed = {**saved, **{k: data[k] for k in RESUME_OVERRIDES if k in data}}
+    if "csvData" in data:
+        resumed.pop("datasetId")
+    return resumed, state, None
+
+
+def build_ga_response(data, on_generation=None, should_stop=None):
+    """
+    Run the GA for a /run_ga request body and build its JSON response.
+
+    A body with checkpointInterval > 0 gets a checkpointId; a body with
+    resumeFrom set to that ID continues the checkpointed run with its saved
+    parameters (see resume_request).
+    """
+    checkpoint_id = data.get("resumeFrom")
+    resume_state = None
+    if checkpoint_id:
+        data, resume_state, error = resume_request(checkpoint_id, data)
+        if error:
+            return {"error": error}
+
+    params, error = parse_ga_params(data)
+    if error:
+        return {"error": error}
+
+    timer = PhaseTimer()
+
+    # --- Load dataset (by ID, or parse inline csvData) ---
+    dataset_id, dataset, error = resolve_dataset(data, timer)
+    if error:
+        return {"error": error}
+
+    feature_count = len(dataset.feature_headers)
+
+    cache_key = None if resume_state is not None else result_cache_key(dataset_id, "ga", params)
+    if cache_key is not None:
+        cached = result_cache.get(cache_key, "ga")
+        if cached is not None:
+            return finish_response(data, dataset, cached_response(cached, data, timer))
+
+    if params["checkpoint_interval"] > 0 or resume_state is not None:
+        if checkpoint_id is None:
+            checkpoint_id = uuid.uuid4().hex
+            save_checkpoint_request(checkpoint_id, data, dataset_id)
+        params["checkpoint_path"] = checkpoint_file(checkpoint_id)
+        params["resume_state"] = resume_state
+
+    try:
+        ga = run_ga_search(dataset, params, on_generation, should_stop, timer)
+    except ValueError as e:
+        return {"error": str(e)}
+
+    # Prepare response
+    response = {
+        "bestFitness": round(ga["best_fitness"], 4),
+        "bestChromosome": ga["best_chromosome"],
         "selectedFeatures": ga["selected_features"],
         "history": ga["history"],
         "featuresCount": feature_count,
-        "rows": len(df),
-        "target": target_header,
+        "rows": dataset.rows,
+        "target": dataset.target_header,
+        "datasetId": dataset_id,
         "generations": len(ga["history"]),
-        "converged": ga["converged"]
+        "converged": ga["converged"],
+        "cancelled": ga["cancelled"],
+        "fitnessCache": ga["cache_stats"],
+        "workers": ga["n_workers"],
+        "fitnessBackend": ga["fitness_backend"],
+        "seed": params["seed"],
     }
+    if ga["racing_stats"] is not None:
+        response["racing"] = ga["racing_stats"]
+    if ga["budget_stats"] is not None:
+        response["budget"] = ga["budget_stats"]
+    if "island_stats" in ga:
+        response["islands"] = ga["island_stats"]
+    if "screening_stats" in ga:
+        response["screening"] = ga["screening_stats"]
+    if data.get("timings"):
+        response["timings"] = timer.as_dict()
+    if "checkpoint_path" in params:
+        response["checkpointId"] = checkpoint_id
+    if resume_state is not None:
+        response["resumedFromGeneration"] = resume_state["generation"]
 
     # Add ID column name if specified
-    if id_column_idx is not None:
-        response["idColumn"] = df.columns[id_column_idx]
+    if dataset.id_header is not None:
+        response["idColumn"] = dataset.id_header
 
-    return jsonify(response)
+    return finish_response(data, dataset, store_response(None if ga["cancelled"] else cache_key, response))
 
-@app.route("/run_variance_threshold", methods=["POST"])
-def run_variance_threshold():
-    data = request.json
-    threshold = float(data.get("threshold", 0.0))
-    csv_content = data.get("csvData", "")
-    id_column_idx = data.get("idColumn")
-    target_column_idx = data.get("targetColumn")
 
-    if target_column_idx is None:
-        return jsonify({"error": "Target column must be specified"})
+def _baseline_response(result, seconds):
+    response = {
+        "accuracy": round(result["accuracy"], 4),
+        "selectedFeatures": result["selected_features"],
+        "removedFeatures": result["removed_features"],
+        "numFeaturesSelected": len(result["selected_features"]),
+        "execTimeSeconds": round(seconds, 4),
+    }
+    if "threshold" in result:
+        response["thresholdUsed"] = result["threshold"]
+    if "k" in result:
+        response["k"] = result["k"]
+    return response
+
 
-    result, error = load_and_preprocess_csv(csv_content, target_column_idx, id_column_idx)
+def build_comparison_response(data, on_generation=None, should_stop=None):
+    """
+    Run the GA and the requested baseline selectors for a /run_comparison
+    request body. Baselines run on baseline_executor while the GA runs on the
+    calling thread, so the wall time is close to the slowest method rather
+    than the sum of all of them.
+    """
+    params, error = parse_ga_params(data)
     if error:
-        return jsonify({"error": error})
+        return {"error": error}
+    vt_threshold = float(data.get("vtThreshold", 0.0))
+    # VarianceThreshold always runs: its result is the "varianceThreshold" block.
+    baseline_names = ["variance_threshold"] + [
+        name for name in data.get("baselines", list(BASELINE_SELECTORS)) if name != "variance_threshold"
+    ]
+    unknown = [name for name in baseline_names if name not in BASELINE_SELECTORS]
+    if unknown:
+        return {"error": f"Unknown baseline(s): {', '.join(unknown)}"}
+    timer = PhaseTimer()
+
+    dataset_id, dataset, error = resolve_dataset(data, timer)
+    if error:
+        return {"error": error}
 
-    X_train, X_test, y_train, y_test, feature_headers, target_header, df = result
+    feature_headers = dataset.feature_headers
+    feature_count = len(feature_headers)
+    baseline_params = {"threshold": vt_threshold, "k": data.get("k")}
+
+    cache_key = result_cache_key(
+        dataset_id, "comparison", params, baselines=sorted(baseline_names), **baseline_params
+    )
+    if cache_key is not None:
+        cached = result_cache.get(cache_key, "comparison")
+        if cached is not None:
+            return finish_response(data, dataset, cached_response(cached, data, timer))
+
+    wall_start = time.perf_counter()
+    futures = submit_baselines(
+        baseline_names, dataset.split, feature_headers,
+        {**baseline_params, "column_stats": dataset.column_stats}, baseline_executor,
+    )
+    ga_start = time.perf_counter()
+    try:
+        ga = run_ga_search(dataset, params, on_generation, should_stop, timer)
+    except ValueError as e:
+        for future in futures.values():
+            future.cancel()
+        return {"error": str(e)}
+    ga_exec = time.perf_counter() - ga_start
+
+    baselines = {}
+    for name, future in futures.items():
+        result, seconds = future.result()
+        timer.add(name, seconds)
+        baselines[name] = _baseline_response(result, seconds)
+    wall_time = time.perf_counter() - wall_start
+
+    response = {
+        "dataset": {
+            "id": dataset_id,
+            "target": dataset.target_header,
+            "numFeaturesTotal": feature_count,
+            "rows": dataset.rows,
+        },
+        "ga": {
+            "bestFitness": round(ga["best_fitness"], 4),
+            "history": ga["history"],
+            "selectedFeatures": ga["selected_features"],
+            "numFeaturesSelected": len(ga["selected_features"]),
+            "generations": len(ga["history"]),
+            "converged": ga["converged"],
+            "cancelled": ga["cancelled"],
+            "fitnessCache": ga["cache_stats"],
+            "workers": ga["n_workers"],
+            "fitnessBackend": ga["fitness_backend"],
+            "seed": params["seed"],
+            "racing": ga["racing_stats"],
+            "budget": ga["budget_stats"],
+            "islands": ga.get("island_stats"),
+            "screening": ga.get("screening_stats"),
+            "accuracy": round(ga["best_fitness"], 4),
+            "execTimeSeconds": round(ga_exec, 4),
+        },
+        "varianceThreshold": baselines["variance_threshold"],
+        "baselines": baselines,
+        "wallTimeSeconds": round(wall_time, 4),
+    }
+    if dataset.id_header is not None:
+        response["dataset"]["idColumn"] = dataset.id_header
+    if data.get("timings"):
+        response["timings"] = timer.as_dict()
+
+    return finish_response(data, dataset, store_response(None if ga["cancelled"] else cache_key, response))
+
+
+MAX_VT_THRESHOLDS = 256
+DEFAULT_VT_RANGE_POINTS = 20
+
+
+def variance_thresholds(data):
+    """
+    The thresholds a VarianceThreshold sweep asks for: a "thresholds" list,
+    or a "thresholdRange" of {"start", "stop", "num"} evenly spaced values
+    (start defaults to 0, num to DEFAULT_VT_RANGE_POINTS).
+
+    Returns:
+        tuple: (np.ndarray, None) or (None, error_message).
+    """
+    try:
+        if "thresholds" in data:
+            thresholds = np.asarray(data["thresholds"], dtype=np.float64).ravel()
+        else:
+            spec = data["thresholdRange"] or {}
+            thresholds = np.linspace(
+                float(spec.get("start", 0.0)), float(spec["stop"]),
+                int(spec.get("num", DEFAULT_VT_RANGE_POINTS)),
+            )
+    except (KeyError, TypeError, ValueError):
+        return None, "thresholds must be a list of numbers or a thresholdRange with a stop"
+    if thresholds.size == 0:
+        return None, "The sweep has no thresholds"
+    if thresholds.size > MAX_VT_THRESHOLDS:
+        return None, f"The sweep has {thresholds.size} thresholds; the limit is {MAX_VT_THRESHOLDS}"
+    if not np.all(np.isfinite(thresholds)) or np.any(thresholds < 0):
+        return None, "Thresholds must be finite and non-negative"
+    return thresholds, None
+
+
+def build_variance_threshold_sweep_response(data):
+    """
+    Run a VarianceThreshold sweep for a /run_variance_threshold request body
+    with thresholds or a thresholdRange. The response's curve has the
+    accuracy and selected-feature count at each threshold, and its top-level
+    fields describe the best one (highest accuracy, then fewest features).
+    """
+    thresholds, error = variance_thresholds(data)
+    if error:
+        return {"error": error}
+    timer = PhaseTimer()
+
+    dataset_id, dataset, error = resolve_dataset(data, timer)
+    if error:
+        return {"error": error}
+
+    cache_key = result_cache.key_for(dataset_id, "variance_threshold_sweep", {"thresholds": thresholds.tolist()})
+    cached = result_cache.get(cache_key, "variance_threshold_sweep")
+    if cached is not None:
+        return finish_response(data, dataset, cached_response(cached, data, timer))
+
+    X_train, X_test, y_train, y_test = dataset.split
+    feature_headers = dataset.feature_headers
+
+    start_exec = time.perf_counter()
+    sweep = run_variance_threshold_sweep(
+        X_train, X_test, y_train, y_test, thresholds, dataset.column_stats, data.get("workers", 0)
+    )
+    exec_time = time.perf_counter() - start_exec
+    timer.add("variance_threshold", exec_time)
+
+    curve = [
+        {"threshold": threshold, "accuracy": round(accuracy, 4), "numFeaturesSelected": count}
+        for threshold, accuracy, count in zip(sweep["thresholds"], sweep["accuracies"], sweep["num_selected"])
+    ]
+    best = min(range(len(curve)), key=lambda i: (-curve[i]["accuracy"], curve[i]["numFeaturesSelected"], i))
+    best_mask = sweep["masks"][best]
+    response = {
+        "curve": curve,
+        "distinctMasks": sweep["distinct_masks"],
+        "thresholdUsed": curve[best]["threshold"],
+        "accuracy": curve[best]["accuracy"],
+        "selectedFeatures": [f for f, keep in zip(feature_headers, best_mask) if keep],
+        "removedFeatures": [f for f, keep in zip(feature_headers, best_mask) if not keep],
+        "numFeaturesSelected": curve[best]["numFeaturesSelected"],
+        "numFeaturesTotal": len(feature_headers),
+        "rows": dataset.rows,
+        "target": dataset.target_header,
+        "datasetId": dataset_id,
+        "execTimeSeconds": round(exec_time, 4),
+    }
+    if dataset.id_header is not None:
+        response["idColumn"] = dataset.id_header
+    if data.get("timings"):
+        response["timings"] = timer.as_dict()
+
+    return finish_response(data, dataset, store_response(cache_key, response))
+
+
+def build_variance_threshold_response(data):
+    """Run VarianceThreshold for a /run_variance_threshold request body."""
+    if "thresholds" in data or "thresholdRange" in data:
+        return build_variance_threshold_sweep_response(data)
+    threshold = float(data.get("threshold", 0.0))
+    timer = PhaseTimer()
+
+    dataset_id, dataset, error = resolve_dataset(data, timer)
+    if error:
+        return {"error": error}
+
+    # VarianceThreshold is deterministic, so every result is reusable.
+    cache_key = result_cache.key_for(dataset_id, "variance_threshold", {"threshold": threshold})
+    cached = result_cache.get(cache_key, "variance_threshold")
+    if cached is not None:
+        return finish_response(data, dataset, cached_response(cached, data, timer))
+
+    X_train, X_test, y_train, y_test = dataset.split
+    feature_headers = dataset.feature_headers
 
     start_exec = time.perf_counter()
     vt = run_variance_threshold_selection(
@@ -345,8 +3486,10 @@ def run_variance_threshold():
         y_test,
         feature_headers,
         threshold,
+        dataset.column_stats,
     )
     exec_time = time.perf_counter() - start_exec
+    timer.add("variance_threshold", exec_time)
 
     response = {
         "thresholdUsed": vt["threshold"],
@@ -355,125 +3498,450 @@ def run_variance_threshold():
         "removedFeatures": vt["removed_features"],
         "numFeaturesSelected": len(vt["selected_features"]),
         "numFeaturesTotal": len(feature_headers),
-        "rows": len(df),
-        "target": target_header,
+        "rows": dataset.rows,
+        "target": dataset.target_header,
+        "datasetId": dataset_id,
         "execTimeSeconds": round(exec_time, 4),
     }
-    if id_column_idx is not None:
-        response["idColumn"] = df.columns[id_column_idx]
+    if dataset.id_header is not None:
+        response["idColumn"] = dataset.id_header
+    if data.get("timings"):
+        response["timings"] = timer.as_dict()
 
-    return jsonify(response)
+    return finish_response(data, dataset, store_response(cache_key, response))
+
+
+@app.route("/run_ga", methods=["POST"])
+def run_ga():
+    """
+    Main endpoint to run the Genetic Algorithm for feature selection.
+
+    This function is already implemented for you. Study it to understand
+    how all the GA components work together.
+    """
+    return run_admitted(build_ga_response, request.json)
+
+@app.route("/checkpoints/<checkpoint_id>", methods=["GET"])
+def checkpoint_status(checkpoint_id):
+    """Describe the last saved state of a checkpointed GA run."""
+    request_data, state, error = load_checkpoint_request(checkpoint_id)
+    if error:
+        return jsonify({"error": error}), 404
+    return jsonify({
+        "checkpointId": checkpoint_id,
+        "generation": state["generation"],
+        "bestFitness": round(state["best_fitness"], 4),
+        "history": state["history"].tolist(),
+        "request": request_data,
+    })
+
+@app.route("/run_variance_threshold", methods=["POST"])
+def run_variance_threshold():
+    data = request.json
+    if "thresholds" in data or "thresholdRange" in data:
+        # A sweep fits up to MAX_VT_THRESHOLDS classifiers, so it queues like a GA run.
+        return run_admitted(build_variance_threshold_response, data)
+    return json_response(build_variance_threshold_response(data), data)
 
 @app.route("/run_comparison", methods=["POST"])
 def run_comparison():
-    data = request.json
-    pop_size = int(data.get("popSize", 30))
-    crossover_rate = float(data.get("crossRate", 0.7))
-    mutation_rate = float(data.get("mutRate", 0.1))
-    max_gen = int(data.get("maxGen", 20))
-    convergence_threshold = data.get("convergenceThreshold")
-    if convergence_threshold is not None:
-        convergence_threshold = float(convergence_threshold)
-    vt_threshold = float(data.get("vtThreshold", 0.0))
-    csv_content = data.get("csvData", "")
-    id_column_idx = data.get("idColumn")
-    target_column_idx = data.get("targetColumn")
+    return run_admitted(build_comparison_response, request.json)
 
-    if target_column_idx is None:
-        return jsonify({"error": "Target column must be specified"})
 
-    result, error = load_and_preprocess_csv(csv_content, target_column_idx, id_column_idx)
-    if error:
-        return jsonify({"error": error})
+# ---------- Hyperparameter sweeps ----------
+MAX_SWEEP_CONFIGS = 64
+# Backends whose fits spend most of their time in NumPy code that releases
+# the GIL. Sweep runs share a thread pool, so only these gain from running
+# several at once; the sgd backend's per-fit Python overhead holds the GIL.
+SWEEP_THREADED_BACKENDS = ("batched", "chunked")
+# Request keys a sweep may vary, and how their values are drawn.
+SWEEP_PARAMS = {"popSize": int, "crossRate": float, "mutRate": float, "maxGen": int}
 
-    X_train, X_test, y_train, y_test, feature_headers, target_header, df = result
-    feature_count = len(feature_headers)
 
-    ga_start = time.perf_counter()
-    ga = run_ga_feature_selection(
-        X_train,
-        X_test,
-        y_train,
-        y_test,
-        feature_headers,
-        pop_size,
-        crossover_rate,
-        mutation_rate,
-        max_gen,
-        convergence_threshold,
-    )
-    ga_exec = time.perf_counter() - ga_start
+def sweep_configs(data):
+    """
+    Expand a sweep spec into GA parameter sets. Either
+    {"grid": {"popSize": [10, 30], "mutRate": [0.05, 0.1]}} for every
+    combination, or {"random": {"samples": 8, "seed": 0, "space":
+    {"popSize": [10, 50], "mutRate": [0.01, 0.2]}}} for samples uniform draws
+    from each [low, high] range.
 
-    vt_start = time.perf_counter()
-    vt = run_variance_threshold_selection(
-        X_train,
-        X_test,
-        y_train,
-        y_test,
-        feature_headers,
-        vt_threshold,
-    )
-    vt_exec = time.perf_counter() - vt_start
+    Returns:
+        tuple: (list of dicts of request keys, None) or (None, error_message).
+    """
+    if "grid" in data:
+        grid = data["grid"] or {}
+        unknown = [name for name in grid if name not in SWEEP_PARAMS]
+        if unknown:
+            return None, f"Cannot sweep over: {', '.join(unknown)}"
+        names = sorted(grid)
+        configs = [
+            {name: SWEEP_PARAMS[name](value) for name, value in zip(names, values)}
+            for values in itertools.product(*(grid[name] for name in names))
+        ]
+    elif "random" in data:
+        spec = data["random"] or {}
+        space = spec.get("space", {})
+        unknown = [name for name in space if name not in SWEEP_PARAMS]
+        if unknown:
+            return None, f"Cannot sweep over: {', '.join(unknown)}"
+        rng = np.random.default_rng(spec.get("seed"))
+        configs = []
+        for _ in range(int(spec.get("samples", 10))):
+            config = {}
+            for name in sorted(space):
+                low, high = space[name]
+                if SWEEP_PARAMS[name] is int:
+                    config[name] = int(rng.integers(int(low), int(high) + 1))
+                else:
+                    config[name] = float(rng.uniform(float(low), float(high)))
+            configs.append(config)
+    else:
+        return None, "A sweep needs a grid or random spec"
+    if not configs:
+        return None, "The sweep has no configurations"
+    if len(configs) > MAX_SWEEP_CONFIGS:
+        return None, f"The sweep has {len(configs)} configurations; the limit is {MAX_SWEEP_CONFIGS}"
+    return configs, None
+
+
+def build_sweep_response(data, on_generation=None, should_stop=None):
+    """
+    Run one GA per sweep configuration and rank them in a leaderboard.
+
+    Runs execute on a thread pool of "workers" threads so they all read the
+    one prepared dataset and share one FitnessCache; a chromosome scored by
+    any run is free for the rest. Each run is single-process. The GA loop
+    itself holds the GIL, so threads only overlap the fits of
+    SWEEP_THREADED_BACKENDS, and workers defaults to all cores for those
+    backends and to 1 otherwise. on_generation is ignored, since runs
+    interleave.
+    """
+    configs, error = sweep_configs(data)
+    if error:
+        return {"error": error}
+    if int(data.get("islands", 1)) > 1:
+        return {"error": "Island runs cannot be swept"}
+
+    base = {k: v for k, v in data.items() if k not in ("grid", "random", "workers", "checkpointInterval")}
+    runs = []
+    for config in configs:
+        params, error = parse_ga_params({**base, **config, "workers": 1})
+        if error:
+            return {"error": f"{error} (in configuration {config})"}
+        runs.append((config, params))
+    fitness_cache = runs[0][1]["fitness_cache"]
+    for _, params in runs:
+        params["fitness_cache"] = fitness_cache
+
+    dataset_id, dataset, error = resolve_dataset(data)
+    if error:
+        return {"error": error}
 
-    response = {
-        "dataset": {
-            "target": target_header,
-            "numFeaturesTotal": feature_count,
-            "rows": len(df),
-        },
-        "ga": {
-            "bestFitness": round(ga["best_fitness"], 4),
-            "history": ga["history"],
-            "selectedFeatures": ga["selected_features"],
+    def run(config, params):
+        if should_stop is not None and should_stop():
+            return None
+        start = time.perf_counter()
+        ga = run_ga_search(dataset, params, should_stop=should_stop)
+        return {
+            "params": config,
+            "accuracy": round(ga["best_fitness"], 4),
             "numFeaturesSelected": len(ga["selected_features"]),
+            "selectedFeatures": ga["selected_features"],
             "generations": len(ga["history"]),
             "converged": ga["converged"],
-            "accuracy": round(ga["best_fitness"], 4),
-            "execTimeSeconds": round(ga_exec, 4),
-        },
-        "varianceThreshold": {
-            "thresholdUsed": vt["threshold"],
-            "accuracy": round(vt["accuracy"], 4),
-            "selectedFeatures": vt["selected_features"],
-            "removedFeatures": vt["removed_features"],
-            "numFeaturesSelected": len(vt["selected_features"]),
-            "execTimeSeconds": round(vt_exec, 4),
-        },
+            "cancelled": ga["cancelled"],
+            "runtimeSeconds": round(time.perf_counter() - start, 4),
+        }
+
+    wall_start = time.perf_counter()
+    default_workers = 0 if runs[0][1]["fitness_backend"] in SWEEP_THREADED_BACKENDS else 1
+    n_workers = min(resolve_worker_count(data.get("workers", default_workers)), len(runs))
+    with ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="sweep") as pool:
+        entries = [entry for entry in pool.map(lambda r: run(*r), runs) if entry is not None]
+
+    # Best accuracy first; ties go to fewer features, then the faster run.
+    entries.sort(key=lambda e: (-e["accuracy"], e["numFeaturesSelected"], e["runtimeSeconds"]))
+    for rank, entry in enumerate(entries, start=1):
+        entry["rank"] = rank
+
+    response = {
+        "leaderboard": entries,
+        "configurations": len(runs),
+        "completed": sum(not entry["cancelled"] for entry in entries),
+        "cancelled": should_stop is not None and should_stop(),
+        "fitnessCache": fitness_cache.stats(),
+        "workers": n_workers,
+        "wallTimeSeconds": round(time.perf_counter() - wall_start, 4),
+        "datasetId": dataset_id,
+        "featuresCount": len(dataset.feature_headers),
+        "rows": dataset.rows,
+        "target": dataset.target_header,
     }
-    if id_column_idx is not None:
-        response["dataset"]["idColumn"] = df.columns[id_column_idx]
+    if dataset.id_header is not None:
+        response["idColumn"] = dataset.id_header
+    return response
 
-    return jsonify(response)
-from sklearn.feature_selection import SelectKBest, f_classif
 
-def compare_ga_with_statistical(csv_content, target_column_idx, id_column_idx=None):
+@app.route("/sweep", methods=["POST"])
+def run_sweep():
+    return run_admitted(build_sweep_response, request.json)
 
-    result, error = load_and_preprocess_csv(csv_content, target_column_idx, id_column_idx)
-    if error:
-        return {"error": error}
 
-    X_train, X_test, y_train, y_test, feature_headers, target_header, df = result
+# ---------- Background GA jobs ----------
+# One thread per job run_admission lets in, so queued jobs hold their place
+# in its queue while they wait.
+JOB_WORKERS = MAX_CONCURRENT_RUNS + MAX_QUEUED_RUNS
+MAX_FINISHED_JOBS = 100
+JOB_RUNNERS = {
+    "ga": build_ga_response,
+    "comparison": build_comparison_response,
+    "sweep": build_sweep_response,
+}
 
-    population = initialize_population(pop_size=10, feature_count=len(feature_headers))
-    ga_fitness_scores = [evaluate_fitness(ch, X_train, X_test, y_train, y_test) for ch in population]
-    ga_best_score = max(ga_fitness_scores)
 
-    k = max(1, len(feature_headers) // 2)
-    selector = SelectKBest(score_func=f_classif, k=k)
-    X_train_selected = selector.fit_transform(X_train, y_train)
-    X_test_selected = selector.transform(X_test)
+class Job:
+    """
+    A GA or comparison run executing on the job executor.
 
-    model = LogisticRegression(max_iter=500)
-    model.fit(X_train_selected, y_train)
-    kbest_score = accuracy_score(y_test, model.predict(X_test_selected))
+    Progress is recorded as an append-only list of (event, payload) pairs so
+    any number of Server-Sent Event streams can replay and follow it.
+    """
 
-    comparison = {
-        "GA_Best_Fitness": round(ga_best_score, 4),
-        "SelectKBest_Accuracy": round(kbest_score, 4),
-        "Winner": "Genetic Algorithm" if ga_best_score > kbest_score else "Traditional Statistical Method"
-    }
+    def __init__(self, kind, data, ticket=None):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.data = data
+        self.ticket = ticket
+        self.status = "queued"
+        self.result = None
+        self.events = []
+        self._cancel = threading.Event()
+        self._changed = threading.Condition()
+
+    @property
+    def finished(self):
+        return self.status in ("done", "cancelled", "failed")
+
+    def cancel(self):
+        self._cancel.set()
+
+    def cancel_requested(self):
+        return self._cancel.is_set()
+
+    def publish(self, event, payload):
+        with self._changed:
+            self.events.append((event, payload))
+            self._changed.notify_all()
+
+    def on_generation(self, gen, best_fitness, elapsed):
+        self.publish("generation", {
+            "generation": gen + 1,
+            "bestFitness": round(float(best_fitness), 4),
+            "elapsedSeconds": round(elapsed, 4),
+        })
+
+    def finish(self, status, result):
+        with self._changed:
+            self.status = status
+            self.result = result
+            self.events.append(("done", self.summary()))
+            self._changed.notify_all()
+
+    def wait_for_events(self, cursor, timeout):
+        """Return events after cursor, blocking up to timeout if there are none yet."""
+        with self._changed:
+            if len(self.events) <= cursor and not self.finished:
+                self._changed.wait(timeout)
+            return self.events[cursor:]
+
+    def summary(self):
+        summary = {
+            "jobId": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "generations": sum(1 for event, _ in self.events if event == "generation"),
+        }
+        if self.status == "queued" and self.ticket is not None:
+            # None once a cancelled job has left the queue but not yet finished.
+            summary["queuePosition"] = self.ticket.position()
+        if self.finished:
+            summary["result"] = self.result
+        return summary
+
+
+class JobManager:
+    """
+    Runs jobs on a bounded thread pool and keeps recently finished ones.
+    Jobs take their place with admission (a RunAdmission) when submitted, so
+    submit() raises QueueFull rather than accepting work it cannot start soon.
+    """
 
-    return comparison
+    def __init__(self, max_workers=JOB_WORKERS, max_finished=MAX_FINISHED_JOBS, admission=None):
+        self.max_finished = max_finished
+        self.admission = admission
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ga-job")
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, kind, data):
+        ticket = self.admission.enter() if self.admission is not None else None
+        job = Job(kind, data, ticket)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _prune(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+    def _run(self, job):
+        if job.ticket is None:
+            self._execute(job)
+            return
+        try:
+            if self.admission.wait(job.ticket, job.cancel_requested):
+                self._execute(job)
+            else:
+                job.finish("cancelled", None)
+        finally:
+            self.admission.leave(job.ticket)
+
+    def _execute(self, job):
+        if job.cancel_requested():
+            job.finish("cancelled", None)
+            return
+        job.status = "running"
+        job.publish("status", {"status": "running"})
+        try:
+            result = JOB_RUNNERS[job.kind](
+                job.data, on_generation=job.on_generation, should_stop=job.cancel_requested
+            )
+        except Exception as e:
+            job.finish("failed", {"error": f"Job failed: {str(e)}"})
+            return
+        if "error" in result:
+            job.finish("failed", result)
+        elif job.cancel_requested():
+            job.finish("cancelled", result)
+        else:
+            job.finish("done", result)
+
+
+job_manager = JobManager(admission=run_admission)
+
+
+@app.route("/jobs", methods=["POST"])
+def submit_job():
+    """
+    Queue a GA ("ga"), comparison ("comparison") or sweep ("sweep") run. The
+    body is the same as for /run_ga, /run_comparison or /sweep plus a "kind"
+    field.
+    """
+    data = request.json
+    kind = data.get("kind", "ga")
+    if kind not in JOB_RUNNERS:
+        return jsonify({"error": f"Unknown job kind: {kind}"})
+    try:
+        job = job_manager.submit(kind, data)
+    except QueueFull as e:
+        return busy_response(e)
+    return jsonify(job.summary())
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def job_status(job_id):
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({"error": f"Unknown job ID: {job_id}"}), 404
+    return jsonify(job.summary())
+
+@app.route("/jobs/<job_id>/cancel", methods=["POST"])
+def cancel_job(job_id):
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({"error": f"Unknown job ID: {job_id}"}), 404
+    job.cancel()
+    return jsonify({"jobId": job.id, "status": job.status, "cancelRequested": True})
+
+@app.route("/jobs/<job_id>/events", methods=["GET"])
+def job_events(job_id):
+    """Stream a job's progress as Server-Sent Events, ending with a "done" event."""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({"error": f"Unknown job ID: {job_id}"}), 404
+
+    def stream():
+        cursor = 0
+        while True:
+            events = job.wait_for_events(cursor, timeout=15)
+            if not events:
+                yield ": keep-alive\n\n"
+                continue
+            for event, payload in events:
+                yield f"event: {event}\ndata: {app.json.dumps(payload)}\n\n"
+                if event == "done":
+                    return
+            cursor += len(events)
+
+    return Response(
+        stream_with_context(stream()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# ---------- Preloading ----------
+# Imported on first use by the routes that need them, so a worker that only
+# serves the UI or /metrics never pays for them.
+HEAVY_MODULES = (
+    "pandas",
+    "scipy.sparse",
+    "sklearn.datasets",
+    "sklearn.model_selection",
+    "sklearn.linear_model",
+    "sklearn.feature_selection",
+)
+
+
+def warm_up(datasets=()):
+    """
+    Import HEAVY_MODULES and load datasets (dicts with path and optionally
+    format, targetColumn, idColumn and sparse, as in a batch manifest) into
+    dataset_store now rather than on the first request.
+
+    Meant for the master process of a pre-forking server (see
+    gunicorn.conf.py): the worker it forks, and any replacement for it,
+    inherits the imported modules and dataset arrays and so serves its first
+    request without importing or parsing anything. Objects are then moved
+    out of the garbage collector's reach with gc.freeze(), so collections in
+    the worker do not copy those pages out of the master's. Process pools
+    started by the worker (process_context) do not inherit them.
+
+    Returns:
+        list: dataset ID of each entry in datasets. Raises ValueError if one
+        cannot be loaded.
+    """
+    for name in HEAVY_MODULES:
+        importlib.import_module(name)
+    dataset_ids = []
+    for spec in datasets:
+        dataset_id, error = load_dataset_file(
+            spec["path"], spec.get("format", "csv"), spec.get("targetColumn"), spec.get("idColumn"),
+            bool(spec.get("sparse")),
+        )
+        if error:
+            raise ValueError(f"{spec['path']}: {error}")
+        dataset_ids.append(dataset_id)
+    gc.collect()
+    gc.freeze()
+    return dataset_ids
 
 
 if __name__ == "__main__":
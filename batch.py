@@ -0,0 +1,180 @@
+"""
+Headless batch runner: every dataset in a manifest crossed with every run,
+on a process pool, with one JSON line written per result as it finishes.
+
+Run with:
+    python batch.py manifest.json --output results.jsonl --workers 0
+
+The manifest is JSON. Paths are relative to the manifest's directory and
+run parameters use the same keys as the HTTP request bodies:
+
+    {
+      "datasets": [
+        {"name": "iris", "path": "data/iris.csv", "targetColumn": 4},
+        {"path": "data/text.svm", "format": "svmlight"}
+      ],
+      "runs": [
+        {"method": "ga", "params": {"popSize": 30, "maxGen": 40, "seed": 1}},
+        {"method": "variance_threshold", "params": {"threshold": 0.1}},
+        {"method": "comparison", "params": {"seed": 1, "vtThreshold": 0.1}}
+      ]
+    }
+
+Tasks already run in parallel, one per pool process, so each run uses a
+single process ("workers": 1) unless its params set "workers".
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from sklearn.exceptions import ConvergenceWarning
+
+from app import (
+    build_comparison_response,
+    build_ga_response,
+    build_variance_threshold_response,
+    dataset_store,
+    load_dataset_file,
+    resolve_worker_count,
+)
+
+METHODS = {
+    "ga": build_ga_response,
+    "variance_threshold": build_variance_threshold_response,
+    "comparison": build_comparison_response,
+}
+DATASET_FORMATS = ("csv", "svmlight")
+
+# Per-process map of dataset spec -> dataset ID in this process's dataset_store.
+_loaded = {}
+
+
+def load_manifest(path):
+    """
+    Read a manifest and expand it into tasks, one per (dataset, run) pair.
+    Raises ValueError for an invalid manifest.
+    """
+    with open(path) as f:
+        manifest = json.load(f)
+    base = os.path.dirname(os.path.abspath(path))
+
+    datasets = []
+    for i, spec in enumerate(manifest.get("datasets", [])):
+        if "path" not in spec:
+            raise ValueError(f"dataset {i} has no path")
+        fmt = spec.get("format", "csv")
+        if fmt not in DATASET_FORMATS:
+            raise ValueError(f"dataset {i} has unknown format: {fmt}")
+        if fmt == "csv" and spec.get("targetColumn") is None:
+            raise ValueError(f"dataset {i} has no targetColumn")
+        datasets.append({
+            **spec,
+            "name": spec.get("name", os.path.basename(spec["path"])),
+            "path": os.path.join(base, spec["path"]),
+            "format": fmt,
+        })
+
+    runs = []
+    for i, run in enumerate(manifest.get("runs", [])):
+        method = run.get("method", "ga")
+        if method not in METHODS:
+            raise ValueError(f"run {i} has unknown method: {method}")
+        runs.append({"name": run.get("name", f"{method}-{i}"), "method": method, "params": run.get("params", {})})
+
+    # Runs on the same dataset are adjacent so workers tend to reuse it.
+    return [{"dataset": dataset, "run": run} for dataset in datasets for run in runs]
+
+
+def _load_dataset(spec):
+    """Load a dataset into this process's store, once per file version."""
+    key = (spec["path"], os.path.getmtime(spec["path"]), spec["format"],
+           spec.get("targetColumn"), spec.get("idColumn"), bool(spec.get("sparse")))
+    dataset_id = _loaded.get(key)
+    if dataset_id is not None and dataset_store.get(dataset_id) is not None:
+        return dataset_id, None
+
+    dataset_id, error = load_dataset_file(
+        spec["path"], spec["format"], spec.get("targetColumn"), spec.get("idColumn"), bool(spec.get("sparse"))
+    )
+    if error:
+        return None, error
+    _loaded[key] = dataset_id
+    return dataset_id, None
+
+
+def run_task(task):
+    """Run one (dataset, run) pair and return its JSONL record."""
+    warnings.simplefilter("ignore", ConvergenceWarning)
+    dataset, run = task["dataset"], task["run"]
+    record = {
+        "dataset": dataset["name"],
+        "path": dataset["path"],
+        "run": run["name"],
+        "method": run["method"],
+        "params": run["params"],
+    }
+    start = time.perf_counter()
+    try:
+        dataset_id, error = _load_dataset(dataset)
+        # A run's own island or fitness pool would otherwise start one process
+        # per core inside every batch worker.
+        params = {"workers": 1, **run["params"], "datasetId": dataset_id}
+        result = {"error": error} if error else METHODS[run["method"]](params)
+    except Exception as e:
+        result = {"error": f"{type(e).__name__}: {str(e)}"}
+    record["seconds"] = round(time.perf_counter() - start, 4)
+    if "error" in result:
+        record["status"] = "error"
+        record["error"] = result["error"]
+    else:
+        record["status"] = "ok"
+        record["result"] = result
+    return record
+
+
+def run_batch(tasks, out, n_workers=0):
+    """
+    Run tasks on a process pool and write each record to out as soon as it
+    finishes. Returns the number of failed tasks.
+    """
+    failures = 0
+    with ProcessPoolExecutor(max_workers=resolve_worker_count(n_workers)) as pool:
+        futures = [pool.submit(run_task, task) for task in tasks]
+        for future in as_completed(futures):
+            record = future.result()
+            failures += record["status"] != "ok"
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("manifest")
+    parser.add_argument("--output", help="append JSONL results here instead of writing to stdout")
+    parser.add_argument("--workers", type=int, default=0, help="worker processes (<= 0 means all cores)")
+    args = parser.parse_args(argv)
+
+    try:
+        tasks = load_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"Invalid manifest: {e}", file=sys.stderr)
+        return 2
+    print(f"{len(tasks)} tasks", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "a") as out:
+            failures = run_batch(tasks, out, args.workers)
+    else:
+        failures = run_batch(tasks, sys.stdout, args.workers)
+    if failures:
+        print(f"{failures} of {len(tasks)} tasks failed", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
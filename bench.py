@@ -0,0 +1,494 @@
+"""
+Benchmarks for the GA hot path.
+
+Run with:
+    python bench.py backends --rows 5000 --features 50
+    python bench.py suite --grid quick --output bench.json
+    python bench.py compare baseline.json bench.json --tolerance 0.15
+    python bench.py startup --repeat 5
+    python bench.py payload --features 20000
+"""
+import argparse
+import gzip
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.datasets import make_classification
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.model_selection import train_test_split
+
+from app import (
+    GZIP_LEVEL,
+    BatchedLogisticFitness,
+    build_comparison_response,
+    build_ga_response,
+    compact_response,
+    dataset_store,
+    evaluate_fitness,
+    evaluate_population,
+    headers_digest,
+    init_population_array,
+    load_and_preprocess_csv,
+    run_ga_feature_selection,
+    run_variance_threshold_selection,
+)
+
+GRIDS = {
+    "quick": {"rows": [1_000, 10_000], "features": [10, 100], "pop_sizes": [10, 30]},
+    "full": {
+        "rows": [1_000, 10_000, 100_000, 1_000_000],
+        "features": [10, 100, 1_000, 10_000],
+        "pop_sizes": [30, 100],
+    },
+}
+# Cells with more values than this are skipped rather than run out of memory.
+MAX_CELLS = 50_000_000
+# Metrics where a larger value is a regression, and where a smaller one is.
+LOWER_IS_BETTER = ("seconds", "p50", "p90", "p99", "peakRssMb")
+HIGHER_IS_BETTER = ("evalsPerSec", "fitsPerSec")
+
+
+def make_split(rows, features, n_classes=2, seed=0):
+    X, y = make_classification(
+        n_samples=rows,
+        n_features=features,
+        n_informative=max(2, features // 3),
+        n_redundant=min(2, features // 5),
+        n_classes=n_classes,
+        random_state=seed,
+    )
+    return train_test_split(X, y, test_size=0.3, random_state=42)
+
+
+def _ranks(values):
+    return values.argsort().argsort()
+
+
+def compare_fitness_backends(rows, features, pop_size, n_classes=2, seed=0):
+    """
+    Score one random generation with the SGD and batched backends and report
+    throughput and how closely their accuracies agree.
+    """
+    X_train, X_test, y_train, y_test = make_split(rows, features, n_classes, seed)
+    population = init_population_array(pop_size, features, rng=np.random.default_rng(seed))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ConvergenceWarning)
+        start = time.perf_counter()
+        sgd = np.array(evaluate_population(population, X_train, X_test, y_train, y_test))
+        sgd_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with BatchedLogisticFitness(X_train, X_test, y_train, y_test) as backend:
+        batched = np.array(backend.map(population))
+    batched_time = time.perf_counter() - start
+
+    return {
+        "rows": rows,
+        "features": features,
+        "popSize": pop_size,
+        "classes": n_classes,
+        "sgd": {
+            "seconds": round(sgd_time, 4),
+            "evalsPerSec": round(pop_size / sgd_time, 2),
+            "meanAccuracy": round(float(sgd.mean()), 4),
+        },
+        "batched": {
+            "seconds": round(batched_time, 4),
+            "evalsPerSec": round(pop_size / batched_time, 2),
+            "meanAccuracy": round(float(batched.mean()), 4),
+        },
+        "speedup": round(sgd_time / batched_time, 2),
+        "maxAbsAccuracyDiff": round(float(np.abs(sgd - batched).max()), 4),
+        "rankCorrelation": round(float(np.corrcoef(_ranks(sgd), _ranks(batched))[0, 1]), 4),
+    }
+
+
+# ---------- Suite ----------
+def _percentiles(samples):
+    if not samples:
+        return {"p50": None, "p90": None, "p99": None}
+    p50, p90, p99 = np.percentile(samples, [50, 90, 99])
+    return {"p50": round(float(p50), 5), "p90": round(float(p90), 5), "p99": round(float(p99), 5)}
+
+
+def _peak_rss_mb():
+    # ru_maxrss is reported in KB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run_case(rows, features, pop_size, generations, fitness_evals, seed=0):
+    """
+    Benchmark one grid cell. Meant to run in a fresh process so that the
+    reported peak RSS belongs to this cell alone.
+    """
+    warnings.simplefilter("ignore", ConvergenceWarning)
+    result = {"rows": rows, "features": features, "popSize": pop_size}
+
+    X, y = make_classification(
+        n_samples=rows,
+        n_features=features,
+        n_informative=max(2, features // 3),
+        n_redundant=min(2, features // 5),
+        random_state=seed,
+    )
+    csv_content = pd.DataFrame(X).assign(target=y).to_csv(index=False)
+    del X, y
+
+    start = time.perf_counter()
+    loaded, error = load_and_preprocess_csv(csv_content, features)
+    result["load_and_preprocess_csv"] = {"seconds": round(time.perf_counter() - start, 4)}
+    if error:
+        result["error"] = error
+        return result
+    del csv_content
+    X_train, X_test, y_train, y_test, feature_headers, _, _ = loaded
+
+    rng = np.random.default_rng(seed)
+    chromosomes = init_population_array(fitness_evals, features, rng=rng)
+    latencies = []
+    for chromosome in chromosomes:
+        start = time.perf_counter()
+        evaluate_fitness(chromosome, X_train, X_test, y_train, y_test)
+        latencies.append(time.perf_counter() - start)
+    result["evaluate_fitness"] = {
+        "seconds": round(sum(latencies), 4),
+        "evalsPerSec": round(len(latencies) / sum(latencies), 2),
+        **_percentiles(latencies),
+    }
+
+    marks = []
+    start = time.perf_counter()
+    ga = run_ga_feature_selection(
+        X_train, X_test, y_train, y_test, feature_headers,
+        pop_size=pop_size, crossover_rate=0.7, mutation_rate=0.1, max_gen=generations,
+        seed=seed, on_generation=lambda gen, best, elapsed: marks.append(elapsed),
+    )
+    total = time.perf_counter() - start
+    per_generation = np.diff([0.0] + marks).tolist()
+    result["run_ga_feature_selection"] = {
+        "seconds": round(total, 4),
+        "generations": len(ga["history"]),
+        "evalsPerSec": round(pop_size * len(ga["history"]) / total, 2),
+        "fitsPerSec": round(ga["cache_stats"]["misses"] / total, 2),
+        **_percentiles(per_generation),
+    }
+
+    start = time.perf_counter()
+    run_variance_threshold_selection(X_train, X_test, y_train, y_test, feature_headers, 0.0)
+    result["run_variance_threshold_selection"] = {"seconds": round(time.perf_counter() - start, 4)}
+
+    result["peakRssMb"] = _peak_rss_mb()
+    return result
+
+
+def _environment():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "sklearn": sklearn.__version__,
+        "machine": platform.machine(),
+        "cpus": multiprocessing.cpu_count(),
+    }
+
+
+def run_suite(rows, features, pop_sizes, generations=5, fitness_evals=20, max_cells=MAX_CELLS, seed=0):
+    """Run every (rows, features, pop_size) cell in its own process."""
+    cases = []
+    for n_rows, n_features, pop_size in itertools.product(rows, features, pop_sizes):
+        if n_rows * n_features > max_cells:
+            cases.append({
+                "rows": n_rows, "features": n_features, "popSize": pop_size,
+                "skipped": f"rows x features exceeds {max_cells}",
+            })
+            continue
+        print(f"rows={n_rows} features={n_features} popSize={pop_size}", file=sys.stderr)
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            cases.append(pool.submit(
+                run_case, n_rows, n_features, pop_size, generations, fitness_evals, seed
+            ).result())
+    return {"environment": _environment(), "generations": generations, "cases": cases}
+
+
+def _case_key(case):
+    return case["rows"], case["features"], case["popSize"]
+
+
+def compare_results(baseline, current, tolerance=0.1):
+    """
+    Flag metrics in current that are worse than baseline by more than
+    tolerance (a fraction) for the same grid cell.
+    """
+    baseline_cases = {_case_key(case): case for case in baseline["cases"]}
+    regressions = []
+    for case in current["cases"]:
+        old = baseline_cases.get(_case_key(case))
+        if old is None or "skipped" in case or "skipped" in old:
+            continue
+        pairs = [("peakRssMb", old.get("peakRssMb"), case.get("peakRssMb"))]
+        for section, metrics in case.items():
+            if isinstance(metrics, dict) and isinstance(old.get(section), dict):
+                pairs.extend(
+                    (f"{section}.{name}", old[section].get(name), value) for name, value in metrics.items()
+                )
+        for name, before, after in pairs:
+            if not before or after is None:
+                continue
+            metric = name.rsplit(".", 1)[-1]
+            if metric in LOWER_IS_BETTER:
+                change = (after - before) / before
+            elif metric in HIGHER_IS_BETTER:
+                change = (before - after) / before
+            else:
+                continue
+            if change > tolerance:
+                regressions.append({
+                    "case": dict(zip(("rows", "features", "popSize"), _case_key(case))),
+                    "metric": name,
+                    "baseline": before,
+                    "current": after,
+                    "worseBy": round(change, 4),
+                })
+    return regressions
+
+
+# ---------- Startup ----------
+# Run in a fresh interpreter by measure_startup. In "cold" mode it times
+# importing the app and serving a first GA request, as a single-process
+# server would. In "preload" mode the process plays a gunicorn master: it
+# imports and warms up the app, then forks a worker and times the worker
+# from fork to its first response.
+STARTUP_PROBE = """
+import json, os, sys, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter()
+mode, body = sys.argv[1], json.loads(sys.argv[2])
+if mode == "cold":
+    status = app.app.test_client().post("/run_ga", json=body).status_code
+    done = time.perf_counter()
+    result = {"importSeconds": imported - start, "firstRequestSeconds": done - imported}
+else:
+    app.warm_up()
+    warmed = time.perf_counter()
+    read_end, write_end = os.pipe()
+    forked = time.perf_counter()
+    pid = os.fork()
+    if pid == 0:
+        status = app.app.test_client().post("/run_ga", json=body).status_code
+        os.write(write_end, json.dumps([status, time.perf_counter() - forked]).encode())
+        os._exit(0)
+    os.close(write_end)
+    status, worker_seconds = json.loads(os.read(read_end, 1024))
+    os.waitpid(pid, 0)
+    result = {
+        "importSeconds": imported - start,
+        "warmUpSeconds": warmed - imported,
+        "firstRequestSeconds": worker_seconds,
+    }
+result["status"] = status
+print(json.dumps(result))
+"""
+
+
+def measure_startup(repeat=5, rows=200, features=10, seed=0):
+    """
+    Time cold start (import plus first request) and preloaded start (fork to
+    first response) in fresh interpreters, repeat times each.
+    """
+    X, y = make_classification(n_samples=rows, n_features=features, random_state=seed)
+    body = json.dumps({
+        "csvData": pd.DataFrame(X).assign(target=y).to_csv(index=False),
+        "targetColumn": features,
+        "popSize": 4,
+        "maxGen": 1,
+    })
+    modes = ["cold"] + (["preload"] if hasattr(os, "fork") else [])
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    result = {"environment": _environment(), "repeat": repeat}
+    for mode in modes:
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            out = subprocess.run(
+                [sys.executable, "-c", STARTUP_PROBE, mode, body],
+                capture_output=True, text=True, check=True, cwd=cwd,
+            ).stdout
+            samples.append({**json.loads(out.strip().splitlines()[-1]), "processSeconds": time.perf_counter() - start})
+        result[mode] = {
+            metric: _percentiles([sample[metric] for sample in samples])
+            for metric in samples[0] if metric != "status"
+        }
+        result[mode]["statuses"] = sorted({sample["status"] for sample in samples})
+    return result
+
+
+# ---------- Payloads ----------
+def _encodings(response, feature_headers, repeat):
+    """
+    Seconds to produce, and bytes of, each wire format of a response. The
+    "known headers" formats are what a client that already has the feature
+    headers (from an earlier compact response) receives.
+    """
+    digest = headers_digest(feature_headers)
+
+    def plain():
+        return json.dumps(response).encode()
+
+    def compact(known_digest=None):
+        return json.dumps(compact_response(response, feature_headers, known_digest)).encode()
+
+    formats = {
+        "json": plain,
+        "json+gzip": lambda: gzip.compress(plain(), compresslevel=GZIP_LEVEL),
+        "compact": compact,
+        "compact+gzip": lambda: gzip.compress(compact(), compresslevel=GZIP_LEVEL),
+        "compact, known headers": lambda: compact(digest),
+        "compact+gzip, known headers": lambda: gzip.compress(compact(digest), compresslevel=GZIP_LEVEL),
+    }
+    result = {}
+    for name, encode in formats.items():
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            payload = encode()
+            samples.append(time.perf_counter() - start)
+        result[name] = {"bytes": len(payload), **_percentiles(samples)}
+    return result
+
+
+def measure_payloads(rows=300, features=20_000, repeat=20, seed=0):
+    """
+    Serialization time and size of /run_ga and /run_comparison responses on
+    a wide dataset, as plain JSON and in the compact encoding, each with and
+    without gzip.
+    """
+    warnings.simplefilter("ignore", ConvergenceWarning)
+    X, y = make_classification(
+        n_samples=rows, n_features=features, n_informative=10, random_state=seed
+    )
+    csv_content = pd.DataFrame(X).add_prefix("feature_").assign(target=y).to_csv(index=False)
+    del X, y
+    dataset_id, dataset, error = dataset_store.get_or_prepare(csv_content, features)
+    if error:
+        return {"error": error}
+    body = {"datasetId": dataset_id, "popSize": 4, "maxGen": 3, "seed": seed}
+    ga = build_ga_response(body)
+    comparison = build_comparison_response({**body, "baselines": ["kbest_f_classif"]})
+    return {
+        "environment": _environment(),
+        "rows": rows,
+        "features": features,
+        "ga": _encodings(ga, dataset.feature_headers, repeat),
+        "comparison": _encodings(comparison, dataset.feature_headers, repeat),
+    }
+
+
+def _int_list(value):
+    return [int(float(v)) for v in value.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    backends = sub.add_parser("backends", help="SGD vs batched fitness backend parity and throughput")
+    backends.add_argument("--rows", type=int, default=5000)
+    backends.add_argument("--features", type=int, default=50)
+    backends.add_argument("--pop-size", type=int, default=30)
+    backends.add_argument("--classes", type=int, default=2)
+    backends.add_argument("--seed", type=int, default=0)
+
+    suite = sub.add_parser("suite", help="time the GA hot path over a grid of dataset shapes")
+    suite.add_argument("--grid", choices=sorted(GRIDS), default="quick")
+    suite.add_argument("--rows", type=_int_list, help="comma-separated, overrides the grid")
+    suite.add_argument("--features", type=_int_list, help="comma-separated, overrides the grid")
+    suite.add_argument("--pop-sizes", type=_int_list, help="comma-separated, overrides the grid")
+    suite.add_argument("--generations", type=int, default=5)
+    suite.add_argument("--fitness-evals", type=int, default=20)
+    suite.add_argument("--max-cells", type=int, default=MAX_CELLS)
+    suite.add_argument("--seed", type=int, default=0)
+    suite.add_argument("--output", help="write JSON results here instead of stdout")
+
+    compare = sub.add_parser("compare", help="flag regressions between two suite result files")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--tolerance", type=float, default=0.1)
+
+    startup = sub.add_parser("startup", help="cold-start and preloaded-worker time to first response")
+    startup.add_argument("--repeat", type=int, default=5)
+    startup.add_argument("--output", help="write JSON results here instead of stdout")
+
+    payload = sub.add_parser("payload", help="response size and serialization time, plain vs compact")
+    payload.add_argument("--rows", type=int, default=300)
+    payload.add_argument("--features", type=int, default=20_000)
+    payload.add_argument("--repeat", type=int, default=20)
+    payload.add_argument("--seed", type=int, default=0)
+    payload.add_argument("--output", help="write JSON results here instead of stdout")
+
+    args = parser.parse_args(argv)
+    if args.command == "backends":
+        result = compare_fitness_backends(args.rows, args.features, args.pop_size, args.classes, args.seed)
+        print(json.dumps(result, indent=2))
+    elif args.command == "suite":
+        grid = GRIDS[args.grid]
+        result = run_suite(
+            args.rows or grid["rows"],
+            args.features or grid["features"],
+            args.pop_sizes or grid["pop_sizes"],
+            generations=args.generations,
+            fitness_evals=args.fitness_evals,
+            max_cells=args.max_cells,
+            seed=args.seed,
+        )
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(result, f, indent=2)
+        else:
+            print(json.dumps(result, indent=2))
+    elif args.command == "compare":
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+        regressions = compare_results(baseline, current, args.tolerance)
+        print(json.dumps({"regressions": regressions}, indent=2))
+        return 1 if regressions else 0
+    elif args.command in ("startup", "payload"):
+        if args.command == "startup":
+            result = measure_startup(args.repeat)
+        else:
+            result = measure_payloads(args.rows, args.features, args.repeat, args.seed)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(result, f, indent=2)
+        else:
+            print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+Gunicorn settings for serving the app with preloading:
+
+    gunicorn app:app
+
+The app keeps its state in process memory: uploaded datasets
+(dataset_store), background jobs and their event streams (job_manager),
+the GA run queue (run_admission) and checkpoints of running GAs. A request
+must therefore reach the process that handled the requests before it, so
+the app runs as ONE worker process that serves requests on threads
+(worker_class "gthread"). Do not raise workers: with several processes an
+upload and the run that uses its datasetId, or a job and its
+/jobs/<id>/events stream, land on different workers and fail with unknown
+IDs. GA, comparison and sweep runs spend most of their time in NumPy and
+scikit-learn code that releases the GIL, and heavier parallelism comes
+from their own process pools (island and parallel fitness workers). Those
+pools start their processes with forkserver rather than forking the
+threaded worker, and receive the dataset through shared memory.
+
+The master imports the app and the heavy scikit-learn/pandas/SciPy modules
+once and loads PRELOAD_DATASETS into the dataset store before forking the
+single worker, so it (and any replacement for it) boots in milliseconds
+and can serve the preloaded datasets (by the datasetId logged at startup,
+or by uploading the same file again) without parsing them.
+"""
+import os
+
+# Dataset files to load before forking, as in a batch manifest. Paths are
+# relative to this file, e.g.
+#     {"path": "data/iris.csv", "targetColumn": 4}
+#     {"path": "data/text.svm", "format": "svmlight"}
+PRELOAD_DATASETS = []
+
+bind = "127.0.0.1:5000"
+# One process (see above); concurrency comes from threads.
+workers = 1
+worker_class = "gthread"
+# Enough for app.MAX_CONCURRENT_RUNS running and app.MAX_QUEUED_RUNS queued
+# runs plus open /jobs/<id>/events streams and short requests.
+threads = 32
+# gthread does not time out individual requests, so long GA runs and event
+# streams are fine; this is how long a worker that stopped heartbeating
+# (e.g. stuck holding the GIL) is given before it is restarted.
+timeout = 300
+preload_app = True
+
+
+def when_ready(server):
+    # The app module is already imported here (preload_app), before any
+    # worker is forked.
+    from app import warm_up
+
+    base = os.path.dirname(os.path.abspath(__file__))
+    datasets = [{**spec, "path": os.path.join(base, spec["path"])} for spec in PRELOAD_DATASETS]
+    for spec, dataset_id in zip(datasets, warm_up(datasets)):
+        server.log.info("Preloaded %s as dataset %s", spec["path"], dataset_id)
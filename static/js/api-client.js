@@ -7,9 +7,15 @@ class APIClient {
     constructor(app) {
         this.app = app;
         this.baseURL = window.location.origin;
+        this.dataset = null;
+        this.activeJob = null;
+        this.featureHeaders = null;
     }
 
     async makeRequest(endpoint, data) {
+        if (data.compact && this.featureHeaders) {
+            data = { ...data, featureHeadersDigest: this.featureHeaders.digest };
+        }
         try {
             const response = await fetch(`${this.baseURL}${endpoint}`, {
                 method: 'POST',
@@ -19,6 +25,15 @@ class APIClient {
                 body: JSON.stringify(data)
             });
 
+            if (response.status === 429) {
+                // The server's GA run queue is full; say when to try again.
+                const busy = await response.json();
+                throw new Error(
+                    `${busy.error} (${busy.running} running, ${busy.queued} queued; ` +
+                    `retry in about ${busy.retryAfterSeconds}s)`
+                );
+            }
+
             if (!response.ok) {
                 throw new Error(`HTTP error! status: ${response.status}`);
             }
@@ -29,46 +44,159 @@ class APIClient {
                 throw new Error(result.error);
             }
 
-            return result;
+            return this.decodeResponse(result);
         } catch (error) {
             console.error('API request failed:', error);
             throw error;
         }
     }
 
+    // Upload the current CSV once and reuse its dataset ID until the file or
+    // the target/ID column selection changes.
+    async ensureDataset(idColumn, targetColumn) {
+        const csvData = this.app.state.csvData;
+        const streamFile = this.app.state.streamFile;
+        if (this.dataset
+            && this.dataset.csvData === csvData
+            && this.dataset.streamFile === streamFile
+            && this.dataset.idColumn === idColumn
+            && this.dataset.targetColumn === targetColumn) {
+            return this.dataset.id;
+        }
+
+        let result;
+        if (streamFile) {
+            // Large files are sent as multipart form data and ingested in chunks.
+            const form = new FormData();
+            form.append('file', streamFile);
+            form.append('targetColumn', targetColumn);
+            if (idColumn !== null) {
+                form.append('idColumn', idColumn);
+            }
+            this.app.updateStatus(`Uploading ${streamFile.name}...`, 'loading');
+            result = await this.makeFormRequest('/datasets', form);
+        } else {
+            result = await this.makeRequest('/datasets', { csvData, idColumn, targetColumn });
+        }
+        this.dataset = { id: result.datasetId, csvData, streamFile, idColumn, targetColumn };
+        return result.datasetId;
+    }
+
+    async makeFormRequest(endpoint, form) {
+        const response = await fetch(`${this.baseURL}${endpoint}`, {
+            method: 'POST',
+            body: form
+        });
+
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+
+        const result = await response.json();
+        if (result.error) {
+            throw new Error(result.error);
+        }
+        return result;
+    }
+
+    // Call send(datasetId) with the uploaded dataset's ID. The server may
+    // have evicted the dataset or restarted since the upload, so on an
+    // unknown-dataset error upload it again and retry once.
+    async withDataset(parameters, send) {
+        const datasetId = await this.ensureDataset(parameters.idColumn, parameters.targetColumn);
+        try {
+            return await send(datasetId);
+        } catch (error) {
+            if (!error.message.includes('Unknown or expired dataset')) {
+                throw error;
+            }
+            this.dataset = null;
+            const freshId = await this.ensureDataset(parameters.idColumn, parameters.targetColumn);
+            return await send(freshId);
+        }
+    }
+
+    async runWithDataset(endpoint, parameters) {
+        return await this.withDataset(parameters, (datasetId) =>
+            this.makeRequest(endpoint, { ...parameters, datasetId }));
+    }
+
+    // Submit a long-running GA/comparison as a background job and follow its
+    // per-generation progress over Server-Sent Events until it finishes.
+    async runJob(kind, parameters, onProgress) {
+        return await this.withDataset(parameters, (datasetId) =>
+            this.followJob({ ...parameters, datasetId, kind }, onProgress));
+    }
+
+    async followJob(parameters, onProgress) {
+        const job = await this.makeRequest('/jobs', parameters);
+        this.activeJob = job.jobId;
+
+        try {
+            return await new Promise((resolve, reject) => {
+                const source = new EventSource(`${this.baseURL}/jobs/${job.jobId}/events`);
+
+                source.addEventListener('generation', (event) => {
+                    if (onProgress) {
+                        onProgress(JSON.parse(event.data));
+                    }
+                });
+
+                source.addEventListener('done', (event) => {
+                    source.close();
+                    const summary = JSON.parse(event.data);
+                    if (!summary.result || summary.result.error) {
+                        reject(new Error(summary.result?.error || `Job ${summary.status}`));
+                    } else {
+                        resolve(this.decodeResponse(summary.result));
+                    }
+                });
+
+                source.onerror = () => {
+                    source.close();
+                    reject(new Error('Lost connection to job progress stream'));
+                };
+            });
+        } finally {
+            this.activeJob = null;
+        }
+    }
+
+    reportProgress(label, maxGen) {
+        return (progress) => {
+            this.app.updateStatus(
+                `${label}: generation ${progress.generation}/${maxGen}, ` +
+                `best fitness ${progress.bestFitness} (${progress.elapsedSeconds}s)`,
+                'loading'
+            );
+        };
+    }
+
     async runGA() {
         const parameters = this.getGAParameters();
-        const requestData = {
-            ...parameters,
-            csvData: this.app.state.csvData
-        };
 
-        this.app.updateStatus(['Running Genetic Algorithm...', 'loading']);
-        return await this.makeRequest('/run_ga', requestData);
+        this.app.updateStatus('Running Genetic Algorithm...', 'loading');
+        return await this.runJob('ga', parameters, this.reportProgress('Running Genetic Algorithm', parameters.maxGen));
     }
 
     async runVarianceThreshold() {
-        const parameters = this.getVarianceThresholdParameters();
-        const requestData = {
-            ...parameters,
-            csvData: this.app.state.csvData
-        };
+        const sweep = this.getVarianceThresholdSweepParameters();
+        const parameters = sweep || this.getVarianceThresholdParameters();
 
-        this.app.updateStatus('Running Variance Threshold...', 'loading');
-        return await this.makeRequest('/run_variance_threshold', requestData);
+        this.app.updateStatus(sweep ? 'Sweeping Variance Thresholds...' : 'Running Variance Threshold...', 'loading');
+        return await this.runWithDataset('/run_variance_threshold', parameters);
     }
 
     async runComparison() {
         const gaParams = this.getGAParameters();
         const vtParams = this.getVarianceThresholdParameters();
-        const requestData = {
+        const parameters = {
             ...gaParams,
-            ...vtParams,
-            csvData: this.app.state.csvData
+            ...vtParams
         };
 
         this.app.updateStatus('Running comparison (GA vs Variance Threshold)...', 'loading');
-        return await this.makeRequest('/run_comparison', requestData);
+        return await this.runJob('comparison', parameters, this.reportProgress('Running comparison', parameters.maxGen));
     }
 
     getGAParameters() {
@@ -81,6 +209,8 @@ class APIClient {
         const targetColumn = document.getElementById('targetColumn')?.value;
 
         const params = {
+            // Bit-packed chromosomes and feature indices; see decodeCompactResponse.
+            compact: true,
             popSize: parseInt(popSize),
             crossRate: parseFloat(crossRate),
             mutRate: parseFloat(mutRate),
@@ -103,12 +233,91 @@ class APIClient {
         const targetColumn = document.getElementById('targetColumn')?.value;
 
         return {
+            compact: true,
             threshold: parseFloat(vtThreshold),
             idColumn: idColumn === '' ? null : parseInt(idColumn),
             targetColumn: parseInt(targetColumn)
         };
     }
 
+    // A VarianceThreshold run over evenly spaced thresholds from the
+    // threshold input up to the sweep input, or null when that is empty.
+    getVarianceThresholdSweepParameters() {
+        const sweepStop = document.getElementById('vtSweepStop')?.value || '';
+        if (sweepStop === '') {
+            return null;
+        }
+        const { threshold, ...params } = this.getVarianceThresholdParameters();
+        return {
+            ...params,
+            thresholdRange: { start: threshold, stop: parseFloat(sweepStop), num: 20 }
+        };
+    }
+
+    // Expand a response requested with compact: true ("packed-v1", see
+    // compact_response in app.py) back into the regular shape: feature
+    // indices become names, removedFeatures is rebuilt as their complement
+    // and bestChromosome is unpacked from base64 bits. featureHeaders are
+    // only sent until the client echoes their digest, so they are kept here.
+    decodeResponse(result) {
+        if (!result || result.encoding !== 'packed-v1') {
+            return result;
+        }
+        if (result.featureHeaders) {
+            this.featureHeaders = { digest: result.featureHeadersDigest, headers: result.featureHeaders };
+        } else if (this.featureHeaders?.digest !== result.featureHeadersDigest) {
+            throw new Error('Compact response refers to unknown feature headers');
+        }
+        return APIClient.decodeCompactResponse(result, this.featureHeaders.headers);
+    }
+
+    static decodeCompactResponse(result, headers) {
+        const names = (indices) => indices.map((i) => headers[i]);
+        const expand = (block, selected) => {
+            const expanded = { ...block };
+            if (selected) {
+                const kept = new Set(selected);
+                expanded.selectedFeatures = names(selected);
+                expanded.removedFeatures = headers.filter((_, i) => !kept.has(i));
+            }
+            if (block.screening) {
+                expanded.screening = { ...block.screening, keptFeatures: names(block.screening.keptFeatures) };
+            }
+            return expanded;
+        };
+
+        let decoded = { ...result };
+        delete decoded.encoding;
+        delete decoded.featureHeaders;
+        delete decoded.featureHeadersDigest;
+        if (typeof decoded.bestChromosome === 'string') {
+            decoded = expand(decoded, null);
+            decoded.bestChromosome = APIClient.unpackChromosome(decoded.bestChromosome, headers.length);
+            decoded.selectedFeatures = headers.filter((_, i) => decoded.bestChromosome[i] === 1);
+        } else if (decoded.ga) {
+            decoded.ga = expand(decoded.ga, null);
+            decoded.ga.selectedFeatures = names(decoded.ga.selectedFeatures);
+            decoded.baselines = Object.fromEntries(
+                Object.entries(decoded.baselines).map(([name, block]) => [name, expand(block, block.selectedFeatures)])
+            );
+            decoded.varianceThreshold = decoded.baselines.variance_threshold;
+        } else {
+            decoded = expand(decoded, decoded.selectedFeatures);
+        }
+        return decoded;
+    }
+
+    // Inverse of pack_chromosome: base64 of np.packbits bytes (most
+    // significant bit first) back to a 0/1 array of the given length.
+    static unpackChromosome(packed, length) {
+        const bytes = atob(packed);
+        const genes = new Array(length);
+        for (let i = 0; i < length; i++) {
+            genes[i] = (bytes.charCodeAt(i >> 3) >> (7 - (i & 7))) & 1;
+        }
+        return genes;
+    }
+
     // Utility method to validate parameters before sending
     validateParameters() {
         const errors = [];
@@ -157,11 +366,14 @@ class APIClient {
         };
     }
 
-    // Method to cancel current request (if needed)
-    cancelRequest() {
-        // Note: This is a placeholder. Actual implementation would require
-        // AbortController for fetch requests
-        console.log('Request cancellation not implemented');
+    // Cancel the running GA job; the server stops between generations and
+    // the job resolves with its best-so-far result.
+    async cancelRequest() {
+        if (!this.activeJob) {
+            return false;
+        }
+        await this.makeRequest(`/jobs/${this.activeJob}/cancel`, {});
+        return true;
     }
 
     // Method to retry last failed request
@@ -273,6 +273,154 @@ class ChartManager {
         });
     }
 
+    // Accuracy and selected-feature count across a VarianceThreshold sweep
+    // (the curve of a /run_variance_threshold response with thresholds).
+    renderVarianceThresholdCurveChart(data) {
+        this.destroyCurrentChart();
+
+        if (!this.chartContainer) return;
+
+        // Get existing canvas
+        const canvas = this.chartContainer.querySelector('canvas');
+        if (!canvas) {
+            console.error('Canvas not found in chart container');
+            return;
+        }
+
+        const ctx = canvas.getContext('2d');
+        const curve = [...data.curve].sort((a, b) => a.threshold - b.threshold);
+
+        this.currentChart = new Chart(ctx, {
+            type: 'line',
+            data: {
+                labels: curve.map((point) => point.threshold.toFixed(3)),
+                datasets: [
+                    {
+                        label: 'Accuracy',
+                        data: curve.map((point) => point.accuracy),
+                        yAxisID: 'y',
+                        borderColor: this.getThemeColor('primary'),
+                        backgroundColor: this.getThemeColor('primary', 0.1),
+                        borderWidth: 2,
+                        fill: false,
+                        tension: 0.2,
+                        pointBackgroundColor: curve.map((point) =>
+                            point.threshold === data.thresholdUsed ? this.getThemeColor('success') : this.getThemeColor('primary')),
+                        pointRadius: curve.map((point) => point.threshold === data.thresholdUsed ? 6 : 3)
+                    },
+                    {
+                        label: 'Selected Features',
+                        data: curve.map((point) => point.numFeaturesSelected),
+                        yAxisID: 'y1',
+                        borderColor: this.getThemeColor('warning'),
+                        backgroundColor: this.getThemeColor('warning', 0.1),
+                        borderWidth: 2,
+                        borderDash: [5, 5],
+                        fill: false,
+                        stepped: true,
+                        pointRadius: 0
+                    }
+                ]
+            },
+            options: {
+                responsive: true,
+                maintainAspectRatio: false,
+                animation: {
+                    duration: 1000,
+                    easing: 'easeInOutQuart'
+                },
+                plugins: {
+                    title: {
+                        display: true,
+                        text: 'Variance Threshold Sweep',
+                        font: {
+                            size: 16,
+                            weight: 'bold'
+                        },
+                        color: this.getThemeColor('text')
+                    },
+                    legend: {
+                        display: true,
+                        position: 'top',
+                        labels: {
+                            color: this.getThemeColor('text'),
+                            usePointStyle: true
+                        }
+                    },
+                    tooltip: {
+                        backgroundColor: this.getThemeColor('background'),
+                        titleColor: this.getThemeColor('text'),
+                        bodyColor: this.getThemeColor('text'),
+                        borderColor: this.getThemeColor('border'),
+                        borderWidth: 1,
+                        cornerRadius: 8,
+                        displayColors: true
+                    }
+                },
+                scales: {
+                    x: {
+                        display: true,
+                        title: {
+                            display: true,
+                            text: 'Variance Threshold',
+                            color: this.getThemeColor('text')
+                        },
+                        grid: {
+                            color: this.getThemeColor('grid'),
+                            drawBorder: false
+                        },
+                        ticks: {
+                            color: this.getThemeColor('text')
+                        }
+                    },
+                    y: {
+                        display: true,
+                        position: 'left',
+                        title: {
+                            display: true,
+                            text: 'Accuracy',
+                            color: this.getThemeColor('text')
+                        },
+                        grid: {
+                            color: this.getThemeColor('grid'),
+                            drawBorder: false
+                        },
+                        ticks: {
+                            color: this.getThemeColor('text'),
+                            callback: function(value) {
+                                return value.toFixed(3);
+                            }
+                        },
+                        beginAtZero: true,
+                        max: 1
+                    },
+                    y1: {
+                        display: true,
+                        position: 'right',
+                        title: {
+                            display: true,
+                            text: 'Number of Features',
+                            color: this.getThemeColor('text')
+                        },
+                        grid: {
+                            drawOnChartArea: false
+                        },
+                        ticks: {
+                            color: this.getThemeColor('text'),
+                            stepSize: 1
+                        },
+                        beginAtZero: true,
+                        max: data.numFeaturesTotal
+                    }
+                },
+                interaction: {
+                    intersect: false,
+                    mode: 'index'
+                }
+            }
+        });
+    }
+
     renderComparisonChart(data) {
         this.destroyCurrentChart();
         
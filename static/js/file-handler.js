@@ -6,6 +6,11 @@
 class FileHandler {
     constructor(app) {
         this.app = app;
+        // Files above this size are streamed to the server as a multipart
+        // upload instead of being read into the page and sent as JSON.
+        this.inlineMaxSize = 10 * 1024 * 1024;
+        this.maxSize = 1024 * 1024 * 1024;
+        this.previewSize = 64 * 1024;
         this.setupFileUpload();
     }
 
@@ -84,7 +89,20 @@ class FileHandler {
 
         try {
             this.app.updateStatus('Reading file...', 'loading');
-            
+
+            if (file.size > this.inlineMaxSize) {
+                // Only read the first lines for column selection; the full
+                // file is uploaded when an analysis is first run.
+                const preview = await this.readFileAsText(file.slice(0, this.previewSize));
+                const headerPreview = preview.slice(0, preview.lastIndexOf('\n'));
+                if (!this.validateCSVContent(headerPreview)) {
+                    this.app.showToast('Invalid CSV format. Please check your file.', 'error');
+                    return;
+                }
+                this.app.onFileUploaded(file, headerPreview, { streamed: true });
+                return;
+            }
+
             const csvData = await this.readFileAsText(file);
             
             // Validate CSV content
@@ -110,10 +128,9 @@ class FileHandler {
             return false;
         }
 
-        // Check file size (max 10MB)
-        const maxSize = 10 * 1024 * 1024; // 10MB
-        if (file.size > maxSize) {
-            this.app.showToast('File size too large. Maximum size is 10MB.', 'error');
+        // Check file size (max 1GB; files over 10MB are streamed)
+        if (file.size > this.maxSize) {
+            this.app.showToast('File size too large. Maximum size is 1GB.', 'error');
             return false;
         }
 
@@ -188,6 +205,7 @@ class FileHandler {
         
         this.app.state.csvData = '';
         this.app.state.currentFile = null;
+        this.app.state.streamFile = null;
         
         // Hide column selection
         const columnSelection = document.getElementById('columnSelection');
@@ -8,6 +8,7 @@ class GAApplication {
         this.state = {
             csvData: '',
             currentFile: null,
+            streamFile: null,
             isProcessing: false,
             theme: localStorage.getItem('ga-theme') || 'light',
             results: null
@@ -100,9 +101,15 @@ class GAApplication {
             document.getElementById('csvFile').click();
         }
 
-        // Escape: Clear status
+        // Escape: Cancel the running GA job, or clear status
         if (e.key === 'Escape') {
-            this.clearStatus();
+            if (this.state.isProcessing && this.apiClient?.activeJob) {
+                this.apiClient.cancelRequest()
+                    .then(() => this.showToast('Cancelling... keeping best result so far', 'info'))
+                    .catch((error) => this.handleError(error));
+            } else {
+                this.clearStatus();
+            }
         }
     }
 
@@ -329,9 +336,13 @@ class GAApplication {
         this.state.results = { type: 'variance', data };
         
         const idInfo = data.idColumn ? `ID Column: ${data.idColumn}\n` : `No ID column\n`;
+        const sweepInfo = data.curve ?
+            `Thresholds Swept: ${data.curve.length} (${data.distinctMasks} distinct feature sets)\n` :
+            '';
         const statusMessage = 
             `✅ VarianceThreshold Complete!\n${idInfo}Target Column: ${data.target}\n` +
-            `Threshold Used: ${data.thresholdUsed}\n` +
+            sweepInfo +
+            `${data.curve ? 'Best Threshold' : 'Threshold Used'}: ${data.thresholdUsed}\n` +
             `Accuracy: ${data.accuracy}\n` +
             `Exec Time: ${data.execTimeSeconds}s\n` +
             `Selected features: ${data.numFeaturesSelected} out of ${data.numFeaturesTotal}\n` +
@@ -343,12 +354,27 @@ class GAApplication {
         
         // Update chart
         if (this.chartManager) {
-            this.chartManager.renderVarianceThresholdChart(data);
+            if (data.curve) {
+                this.chartManager.renderVarianceThresholdCurveChart(data);
+            } else {
+                this.chartManager.renderVarianceThresholdChart(data);
+            }
         }
 
         this.showToast('Variance Threshold completed successfully!', 'success');
     }
 
+    formatBaselines(baselines = {}) {
+        return Object.entries(baselines)
+            .filter(([name]) => name !== 'variance_threshold')
+            .map(([name, result]) =>
+                `📈 ${name.toUpperCase()}${result.k ? ` (k=${result.k})` : ''}:\n` +
+                `  Accuracy: ${result.accuracy}\n` +
+                `  Exec Time: ${result.execTimeSeconds}s\n` +
+                `  Features: ${result.selectedFeatures.join(', ')}\n\n`)
+            .join('');
+    }
+
     handleComparisonResult(data) {
         this.state.results = { type: 'comparison', data };
         
@@ -376,6 +402,8 @@ class GAApplication {
             `  Selected: ${data.varianceThreshold.numFeaturesSelected} features\n` +
             `  Features: ${data.varianceThreshold.selectedFeatures.join(', ')}\n` +
             `  Removed: ${data.varianceThreshold.removedFeatures.join(', ')}\n\n` +
+            this.formatBaselines(data.baselines) +
+            `⏱️ Wall Time: ${data.wallTimeSeconds}s\n\n` +
             `🏆 WINNER: ${winner} (${Math.max(data.ga.accuracy, data.varianceThreshold.accuracy)})`;
 
         this.updateStatus(statusMessage, 'success');
@@ -397,9 +425,12 @@ class GAApplication {
     }
 
     // File handling
-    onFileUploaded(file, csvData) {
+    onFileUploaded(file, csvData, options = {}) {
+        // For streamed (large) files csvData only holds the first lines and
+        // the file itself is uploaded as multipart form data on first run.
         this.state.currentFile = file;
         this.state.csvData = csvData;
+        this.state.streamFile = options.streamed ? file : null;
         
         const lines = csvData.split('\n').filter(x => x.trim());
         const headers = lines[0].split(',');
@@ -408,7 +439,7 @@ class GAApplication {
         const columnInfo = headers.map((h, i) => `[${i}] ${h.trim()}`).join(', ');
         
         // Update persistent file info in upload component
-        this.updateFileInfo(file, headers, lines.length - 1);
+        this.updateFileInfo(file, headers, options.streamed ? 'counted on upload' : lines.length - 1);
         
         // Update status
         this.updateStatus(`File "${file.name}" loaded successfully. Ready to run analysis.`, 'success');
@@ -502,6 +533,7 @@ class GAApplication {
         
         this.state.csvData = '';
         this.state.currentFile = null;
+        this.state.streamFile = null;
         
         this.updateStatus('No file selected. Please upload a CSV file.');
         this.showToast('File cleared', 'info');
@@ -1,14 +1,68 @@
 import unittest
+from unittest import mock
 import numpy as np
-from sklearn.datasets import make_classification
+from sklearn.datasets import dump_svmlight_file, make_classification
 from sklearn.model_selection import train_test_split
 from app import (
     create_random_chromosome,
     initialize_population,
     evaluate_fitness,
     crossover,
-    mutate
+    mutate,
+    FitnessCache,
+    chromosome_key,
+    run_ga_feature_selection,
+    evaluate_population,
+    ParallelEvaluator,
+    init_population_array,
+    next_generation,
+    BatchedLogisticFitness,
+    app,
+    DatasetStore,
+    PreparedDataset,
+    job_manager,
+    prepare_dataset,
+    ingest_csv_stream,
+    stratified_order,
+    run_island_ga,
+    dataset_store,
+    load_checkpoint,
+    result_cache,
+    ResultCache,
+    screen_features,
+    evaluate_fitness_chunked,
+    ChunkedFitness,
+    unpack_chromosome,
+    RunAdmission,
+    QueueFull,
+    run_admission,
+    column_statistics,
+    RunBudget,
 )
+import io
+import tempfile
+import json
+import os
+import shutil
+import time
+from sklearn.linear_model import LogisticRegression
+import scipy.sparse as sp
+
+
+def temp_dir(test):
+    """A temporary directory removed when test finishes."""
+    directory = tempfile.mkdtemp()
+    test.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+    return directory
+
+
+def use_temp_result_cache(test):
+    """Point the app's result cache at a fresh directory for the duration of test."""
+    directory = temp_dir(test)
+    patcher = mock.patch.object(result_cache, "directory", directory)
+    patcher.start()
+    test.addCleanup(patcher.stop)
+    return directory
 
 
 class TestGeneticAlgorithmFunctions(unittest.TestCase):
@@ -118,6 +172,992 @@ class TestGeneticAlgorithmFunctions(unittest.TestCase):
         self.assertTrue(all(gene in [0, 1] for gene in mutated))
 
 
+class TestPopulationArrays(unittest.TestCase):
+    """Tests for the vectorized population engine"""
+
+    def test_init_population_array(self):
+        """Test that every row gets exactly the requested number of genes"""
+        population = init_population_array(50, 20, true_ratio=0.25, rng=np.random.default_rng(0))
+        self.assertEqual(population.shape, (50, 20))
+        self.assertEqual(population.dtype, np.uint8)
+        self.assertTrue(np.all(population.sum(axis=1) == 5))
+
+    def test_next_generation(self):
+        """Test that breeding keeps the shape and is reproducible for a seed"""
+        population = init_population_array(7, 12, rng=np.random.default_rng(0))
+        a = next_generation(population, 0.7, 0.1, np.random.default_rng(1))
+        b = next_generation(population, 0.7, 0.1, np.random.default_rng(1))
+        self.assertEqual(a.shape, population.shape)
+        self.assertTrue(np.array_equal(a, b))
+        self.assertTrue(np.isin(a, [0, 1]).all())
+
+        # Without crossover or mutation, children are copies of parents
+        copies = next_generation(population, 0.0, 0.0, np.random.default_rng(2))
+        parent_rows = {row.tobytes() for row in population}
+        self.assertTrue(all(row.tobytes() in parent_rows for row in copies))
+
+
+class TestFitnessCache(unittest.TestCase):
+    """Tests for the chromosome fitness cache"""
+
+    def setUp(self):
+        X, y = make_classification(
+            n_samples=100,
+            n_features=10,
+            n_informative=5,
+            n_redundant=2,
+            random_state=42
+        )
+        self.X_train, self.X_test, self.y_train, self.y_test = train_test_split(
+            X, y, test_size=0.3, random_state=42
+        )
+        self.headers = [f"f{i}" for i in range(10)]
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first"""
+        cache = FitnessCache(max_size=2)
+        a, b, c = (chromosome_key(ch) for ch in ([1, 0, 0], [0, 1, 0], [0, 0, 1]))
+        cache.put(a, 0.1)
+        cache.put(b, 0.2)
+        self.assertEqual(cache.get(a), 0.1)
+        cache.put(c, 0.3)
+        self.assertIsNone(cache.get(b))
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_ga_reports_cache_stats(self):
+        """Test that a GA run skips fits for repeated chromosomes"""
+        result = run_ga_feature_selection(
+            self.X_train, self.X_test, self.y_train, self.y_test, self.headers,
+            pop_size=10, crossover_rate=0.0, mutation_rate=0.0, max_gen=3,
+        )
+        stats = result["cache_stats"]
+        self.assertEqual(stats["hits"] + stats["misses"], 30)
+        self.assertGreaterEqual(stats["hits"], 10)
+
+
+class TestParallelEvaluator(unittest.TestCase):
+    """Tests for process-pool fitness evaluation"""
+
+    def test_matches_serial_scores(self):
+        """Test that pool workers return the same fitness as serial evaluation"""
+        X, y = make_classification(n_samples=100, n_features=10, random_state=0)
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=0.3, random_state=42
+        )
+        population = initialize_population(8, 10, true_ratio=0.5)
+        serial = evaluate_population(population, X_train, X_test, y_train, y_test)
+        with ParallelEvaluator(X_train, X_test, y_train, y_test, n_workers=2) as evaluator:
+            parallel = evaluate_population(
+                population, X_train, X_test, y_train, y_test, evaluator=evaluator
+            )
+            # Workers must not be forked from the threaded server process
+            self.assertNotEqual(evaluator._executor._mp_context.get_start_method(), "fork")
+        self.assertEqual(serial, parallel)
+
+
+class TestBatchedLogisticFitness(unittest.TestCase):
+    """Tests for the batched population fitness backend"""
+
+    def test_matches_logistic_regression(self):
+        """Test that batched accuracy tracks a per-subset LogisticRegression fit"""
+        for n_classes in (2, 3):
+            X, y = make_classification(
+                n_samples=600, n_features=8, n_informative=5, n_classes=n_classes, random_state=0
+            )
+            X_train, X_test, y_train, y_test = train_test_split(
+                X, y, test_size=0.3, random_state=42
+            )
+            population = [[1, 1, 1, 1, 0, 0, 0, 0], [0, 1, 0, 1, 0, 1, 0, 1], [0] * 8]
+            scores = BatchedLogisticFitness(X_train, X_test, y_train, y_test).map(population)
+
+            self.assertEqual(scores[2], 0.0)
+            for chromosome, score in zip(population[:2], scores):
+                cols = [i for i, g in enumerate(chromosome) if g == 1]
+                model = LogisticRegression(max_iter=500).fit(X_train[:, cols], y_train)
+                self.assertAlmostEqual(score, model.score(X_test[:, cols], y_test), delta=0.05)
+
+    def test_ga_with_batched_backend(self):
+        """Test that the GA runs end to end on the batched backend"""
+        X, y = make_classification(n_samples=200, n_features=10, random_state=1)
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
+        result = run_ga_feature_selection(
+            X_train, X_test, y_train, y_test, [f"f{i}" for i in range(10)],
+            pop_size=10, crossover_rate=0.7, mutation_rate=0.1, max_gen=5,
+            seed=0, fitness_backend="batched",
+        )
+        self.assertEqual(result["fitness_backend"], "batched")
+        self.assertGreater(result["best_fitness"], 0.5)
+        self.assertEqual(len(result["best_chromosome"]), 10)
+
+
+def make_csv(n_samples=80, n_features=5, random_state=0):
+    """Build a small CSV string with an id column first and the target last"""
+    X, y = make_classification(
+        n_samples=n_samples, n_features=n_features, n_informative=3,
+        n_redundant=1, random_state=random_state
+    )
+    header = ["id"] + [f"f{i}" for i in range(n_features)] + ["label"]
+    lines = [",".join(header)]
+    for i, (row, label) in enumerate(zip(X, y)):
+        lines.append(",".join([str(i)] + [f"{v:.5f}" for v in row] + [str(label)]))
+    return "\n".join(lines)
+
+
+class TestSuccessiveHalving(unittest.TestCase):
+    """Tests for multi-fidelity racing evaluation"""
+
+    def test_stratified_order_prefixes(self):
+        """Test that every prefix of the order keeps the class balance"""
+        y = np.array([0] * 300 + [1] * 100)
+        order = stratified_order(y, np.random.default_rng(0))
+        self.assertEqual(sorted(order.tolist()), list(range(400)))
+        for size in (40, 100, 200):
+            self.assertAlmostEqual(y[order[:size]].mean(), 0.25, delta=0.02)
+
+    def test_ga_with_halving(self):
+        """Test that racing avoids full fits and the best is fully fitted"""
+        X, y = make_classification(n_samples=1500, n_features=12, n_informative=6, random_state=0)
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
+        result = run_ga_feature_selection(
+            X_train, X_test, y_train, y_test, [f"f{i}" for i in range(12)],
+            pop_size=12, crossover_rate=0.7, mutation_rate=0.1, max_gen=3, seed=0,
+            evaluation_strategy="halving", fidelity_levels=3, promotion_ratio=0.5,
+        )
+        stats = result["racing_stats"]
+        self.assertEqual(len(stats["subsampleRows"]), 2)
+        self.assertGreater(stats["fullFitsAvoided"], 0)
+        self.assertEqual(stats["fullFits"], result["cache_stats"]["misses"] - stats["fullFitsAvoided"])
+        full_fitness = evaluate_fitness(
+            result["best_chromosome"], X_train, X_test, y_train, y_test
+        )
+        self.assertAlmostEqual(result["best_fitness"], full_fitness)
+
+
+class TestIslandModel(unittest.TestCase):
+    """Tests for the island-model GA"""
+
+    def setUp(self):
+        X, y = make_classification(n_samples=200, n_features=10, n_informative=5, random_state=3)
+        self.split = train_test_split(X, y, test_size=0.3, random_state=42)
+        self.headers = [f"f{i}" for i in range(10)]
+
+    def run_islands(self, n_workers):
+        return run_island_ga(
+            *self.split, self.headers, pop_size=6, crossover_rate=0.7, mutation_rate=0.1,
+            max_gen=7, n_islands=3, migration_interval=3, migration_size=2,
+            topology="ring", n_workers=n_workers, seed=11,
+        )
+
+    def test_island_run_is_deterministic_across_workers(self):
+        """Test that islands migrate and give the same result inline or on a pool"""
+        inline = self.run_islands(n_workers=1)
+        self.assertEqual(len(inline["history"]), 7)
+        self.assertEqual(inline["island_stats"]["migrations"], 2)
+        self.assertEqual(inline["history"], sorted(inline["history"]))
+        self.assertEqual(inline["best_fitness"], inline["history"][-1])
+
+        # This sandbox may have a single core; force a real two-process pool.
+        with mock.patch("app.resolve_worker_count", return_value=2):
+            pooled = self.run_islands(n_workers=2)
+        self.assertEqual(pooled["n_workers"], 2)
+        self.assertEqual(pooled["history"], inline["history"])
+        self.assertEqual(pooled["best_chromosome"], inline["best_chromosome"])
+
+    def test_epochs_share_fingerprint_and_evaluator(self):
+        """Test that the split is fingerprinted and the evaluator built once per run, not per epoch"""
+        import app as app_module
+
+        init = BatchedLogisticFitness.__init__
+        with mock.patch("app.split_fingerprint", wraps=app_module.split_fingerprint) as fingerprint, \
+                mock.patch.object(BatchedLogisticFitness, "__init__", autospec=True, side_effect=init) as batched:
+            result = run_island_ga(
+                *self.split, self.headers, pop_size=6, crossover_rate=0.7, mutation_rate=0.1,
+                max_gen=7, n_islands=3, migration_interval=3, n_workers=1, seed=11, fitness_backend="batched",
+            )
+        self.assertEqual(len(result["history"]), 7)
+        self.assertEqual(fingerprint.call_count, 1)
+        self.assertEqual(batched.call_count, 1)
+
+
+class TestBenchmarkCompare(unittest.TestCase):
+    """Tests for regression flagging between benchmark runs"""
+
+    def test_flags_slower_and_lower_throughput(self):
+        """Test that only metrics worse than the tolerance are flagged"""
+        from bench import compare_results
+
+        def case(seconds, evals_per_sec):
+            return {
+                "rows": 1000, "features": 10, "popSize": 10, "peakRssMb": 100.0,
+                "run_ga_feature_selection": {"seconds": seconds, "evalsPerSec": evals_per_sec},
+            }
+
+        baseline = {"cases": [case(1.0, 100.0)]}
+        self.assertEqual(compare_results(baseline, {"cases": [case(1.05, 98.0)]}, 0.1), [])
+        regressions = compare_results(baseline, {"cases": [case(1.5, 60.0)]}, 0.1)
+        self.assertEqual(
+            sorted(r["metric"] for r in regressions),
+            ["run_ga_feature_selection.evalsPerSec", "run_ga_feature_selection.seconds"],
+        )
+
+
+class TestDatasetRegistry(unittest.TestCase):
+    """Tests for uploading a dataset once and running methods by ID"""
+
+    def setUp(self):
+        use_temp_result_cache(self)
+        self.client = app.test_client()
+        self.csv = make_csv()
+
+    def test_upload_then_run_by_id(self):
+        """Test that run endpoints accept the ID returned by /datasets"""
+        upload = self.client.post(
+            "/datasets", json={"csvData": self.csv, "targetColumn": 6, "idColumn": 0}
+        ).get_json()
+        self.assertEqual(upload["featuresCount"], 5)
+        self.assertEqual(upload["idColumn"], "id")
+
+        result = self.client.post(
+            "/run_variance_threshold", json={"datasetId": upload["datasetId"], "threshold": 0.0}
+        ).get_json()
+        self.assertNotIn("error", result)
+        self.assertEqual(result["datasetId"], upload["datasetId"])
+        self.assertEqual(result["rows"], 80)
+        self.assertEqual(result["numFeaturesSelected"], 5)
+
+        missing = self.client.post(
+            "/run_variance_threshold", json={"datasetId": "nope"}
+        ).get_json()
+        self.assertIn("error", missing)
+
+    def test_prepared_layout_and_validation(self):
+        """Test that features are validated column-major float32 and labels are integer codes"""
+        dataset, error = prepare_dataset(self.csv, 6, 0)
+        self.assertIsNone(error)
+        self.assertTrue(dataset.X_train.flags.f_contiguous)
+        self.assertEqual(dataset.X_train.dtype, np.float32)
+        self.assertEqual(dataset.y_train.dtype.kind, "i")
+        np.testing.assert_allclose(dataset.column_stats["var"], dataset.X_train.var(axis=0), rtol=1e-5)
+        X_train, _ = dataset.columns([1, 2, 3])
+        self.assertTrue(np.shares_memory(X_train, dataset.X_train))
+
+        X = np.array([[1.0, np.inf], [2.0, 3.0]])
+        with self.assertRaises(ValueError):
+            PreparedDataset(X, X, np.zeros(2), np.zeros(2), ["a", "b"], "t", 4)
+
+        # Non-numeric feature columns are rejected rather than scored 0.
+        text = "id,a,b,label\n" + "\n".join(f"{i},{i % 3},{'xy'[i % 2]},{i % 2}" for i in range(20))
+        dataset, error = prepare_dataset(text, 3, 0)
+        self.assertIsNone(dataset)
+        self.assertIn("must be numeric", error)
+        upload = self.client.post("/datasets", json={"csvData": text, "targetColumn": 3, "idColumn": 0})
+        self.assertIn("must be numeric", upload.get_json()["error"])
+
+    def test_store_evicts_by_size(self):
+        """Test that the least recently used dataset is evicted past the byte cap"""
+        def dataset():
+            X = np.zeros((10, 10))
+            y = np.zeros(10)
+            return PreparedDataset(X, X, y, y, [], "t", 20)
+
+        size = dataset().nbytes
+        store = DatasetStore(max_bytes=2 * size)
+        store.put("a", dataset())
+        store.put("b", dataset())
+        store.get("a")
+        store.put("c", dataset())
+        self.assertIsNotNone(store.get("a"))
+        self.assertIsNone(store.get("b"))
+        self.assertEqual(store.stats()["datasets"], 2)
+        # Putting the same dataset again does not count it twice.
+        store.put("a", store.get("a"))
+        self.assertEqual(store.stats()["bytes"], 2 * size)
+
+    def test_store_evicts_memory_mapped_by_disk_size(self):
+        """Test that memory-mapped datasets count against the disk budget and their files are deleted"""
+        with tempfile.TemporaryDirectory() as storage_dir:
+            def dataset(seed):
+                ds, _ = ingest_csv_stream(io.BytesIO(make_csv(random_state=seed).encode()), 6, 0, storage_dir=storage_dir)
+                return ds
+
+            first = dataset(0)
+            self.assertGreater(first.disk_bytes, 0)
+            store = DatasetStore(max_disk_bytes=first.disk_bytes)
+            store.put("a", first)
+            store.put("a", first)
+            self.assertEqual(store.stats()["diskBytes"], first.disk_bytes)
+            store.put("b", dataset(1))
+            self.assertIsNone(store.get("a"))
+            self.assertEqual(store.stats()["diskBytes"], store.get("b").disk_bytes)
+            self.assertEqual(len(os.listdir(storage_dir)), 2)
+            store.get("b").release()
+
+
+class TestStreamingIngest(unittest.TestCase):
+    """Tests for chunked CSV ingestion into memory-mapped float32 arrays"""
+
+    def test_matches_in_memory_loader(self):
+        """Test that chunked ingestion reproduces the in-memory split"""
+        csv = make_csv(n_samples=300)
+        expected, _ = prepare_dataset(csv, 6, 0)
+        with tempfile.TemporaryDirectory() as storage_dir:
+            dataset, error = ingest_csv_stream(
+                io.BytesIO(csv.encode()), 6, 0, chunk_rows=37, storage_dir=storage_dir
+            )
+            self.assertIsNone(error)
+            self.assertIsInstance(dataset.X_train, np.memmap)
+            self.assertEqual(dataset.X_train.dtype, np.float32)
+            self.assertEqual(dataset.rows, expected.rows)
+            self.assertEqual(dataset.feature_headers, expected.feature_headers)
+            np.testing.assert_allclose(dataset.X_train, expected.X_train.astype(float), atol=1e-4)
+            np.testing.assert_array_equal(dataset.y_test, expected.y_test)
+            # Statistics gathered while copying the chunks, and over tiny row blocks.
+            for name in ("mean", "var", "min", "max"):
+                np.testing.assert_allclose(dataset.column_stats[name], expected.column_stats[name], atol=1e-4)
+            with mock.patch("app.STATS_CHUNK_BYTES", 64):
+                blocked = column_statistics(dataset.X_train)
+            np.testing.assert_allclose(blocked["var"], np.var(dataset.X_train, axis=0, dtype=np.float64), rtol=1e-9)
+            dataset.release()
+            self.assertEqual(os.listdir(storage_dir), [])
+
+    def test_cleaning_matches_in_memory_loader(self):
+        """Test that both loaders drop rows with missing values and reject non-numeric features"""
+        lines = make_csv(n_samples=60).splitlines()
+        lines[5] = ",".join("" if i == 2 else cell for i, cell in enumerate(lines[5].split(",")))
+        missing = "\n".join(lines)
+        lines[9] = ",".join("n/a?" if i == 3 else cell for i, cell in enumerate(lines[9].split(",")))
+        non_numeric = "\n".join(lines)
+        with tempfile.TemporaryDirectory() as storage_dir:
+            expected, _ = prepare_dataset(missing, 6, 0)
+            dataset, error = ingest_csv_stream(
+                io.BytesIO(missing.encode()), 6, 0, chunk_rows=7, storage_dir=storage_dir
+            )
+            self.assertIsNone(error)
+            self.assertEqual(len(dataset.y_train) + len(dataset.y_test), 59)
+            np.testing.assert_allclose(dataset.X_test, expected.X_test, atol=1e-4)
+            dataset.release()
+
+            inline_error = prepare_dataset(non_numeric, 6, 0)[1]
+            self.assertIn("must be numeric", inline_error)
+            self.assertEqual(
+                ingest_csv_stream(io.BytesIO(non_numeric.encode()), 6, 0, chunk_rows=7, storage_dir=storage_dir),
+                (None, inline_error),
+            )
+
+    def test_multipart_upload(self):
+        """Test that /datasets accepts a multipart file upload"""
+        client = app.test_client()
+        response = client.post(
+            "/datasets",
+            data={"file": (io.BytesIO(make_csv().encode()), "data.csv"), "targetColumn": "6", "idColumn": "0"},
+            content_type="multipart/form-data",
+        ).get_json()
+        self.assertEqual(response["featuresCount"], 5)
+        self.assertEqual(response["rows"], 80)
+
+        result = client.post(
+            "/run_ga", json={"datasetId": response["datasetId"], "popSize": 6, "maxGen": 2}
+        ).get_json()
+        self.assertNotIn("error", result)
+        self.assertEqual(result["generations"], 2)
+
+
+class TestGAJobs(unittest.TestCase):
+    """Tests for background GA jobs, progress streaming and cancellation"""
+
+    def setUp(self):
+        self.client = app.test_client()
+        self.body = {"csvData": make_csv(), "targetColumn": 6, "idColumn": 0, "popSize": 6}
+
+    def wait_until_finished(self, job_id, timeout=60):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            status = self.client.get(f"/jobs/{job_id}").get_json()
+            if status["status"] in ("done", "cancelled", "failed"):
+                return status
+            time.sleep(0.05)
+        self.fail("job did not finish")
+
+    def test_events_stream_progress_and_result(self):
+        """Test that the event stream reports every generation and ends with the result"""
+        job = self.client.post("/jobs", json={**self.body, "kind": "ga", "maxGen": 4}).get_json()
+        stream = self.client.get(f"/jobs/{job['jobId']}/events").get_data(as_text=True)
+
+        events = [block for block in stream.split("\n\n") if block.startswith("event:")]
+        generations = [e for e in events if e.startswith("event: generation")]
+        self.assertEqual(len(generations), 4)
+        done = json.loads(events[-1].split("data: ", 1)[1])
+        self.assertEqual(done["status"], "done")
+        self.assertEqual(done["result"]["generations"], 4)
+
+    def test_cancel_returns_best_so_far(self):
+        """Test that cancelling stops the GA between generations"""
+        job = self.client.post("/jobs", json={**self.body, "kind": "ga", "maxGen": 1000}).get_json()
+        deadline = time.time() + 30
+        while job_manager.get(job["jobId"]).summary()["generations"] == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        self.client.post(f"/jobs/{job['jobId']}/cancel")
+
+        status = self.wait_until_finished(job["jobId"])
+        self.assertEqual(status["status"], "cancelled")
+        self.assertTrue(status["result"]["cancelled"])
+        self.assertLess(status["result"]["generations"], 1000)
+        self.assertGreater(status["result"]["bestFitness"], 0.0)
+
+
+class TestSparseDatasets(unittest.TestCase):
+    """Tests for CSC sparse datasets in the fitness and selection paths"""
+
+    def setUp(self):
+        use_temp_result_cache(self)
+
+    def test_svmlight_upload_runs_on_sparse_split(self):
+        """Test that svmlight uploads stay sparse and pool workers see the same data"""
+        X, y = make_classification(n_samples=120, n_features=300, n_informative=8, random_state=0)
+        X[np.abs(X) < 1.5] = 0
+        buf = io.BytesIO()
+        dump_svmlight_file(X, y, buf)
+        buf.seek(0)
+
+        client = app.test_client()
+        upload = client.post(
+            "/datasets", data={"file": (buf, "data.svm"), "format": "svmlight"},
+            content_type="multipart/form-data",
+        ).get_json()
+        self.assertTrue(upload["sparse"])
+        self.assertEqual(upload["featuresCount"], 300)
+
+        dataset = dataset_store.get(upload["datasetId"])
+        self.assertTrue(sp.isspmatrix_csc(dataset.X_train))
+        population = init_population_array(4, 300, rng=np.random.default_rng(0))
+        serial = evaluate_population(population, *dataset.split)
+        with ParallelEvaluator(*dataset.split, n_workers=2) as evaluator:
+            self.assertEqual(evaluator.map(population), serial)
+
+        vt = client.post(
+            "/run_variance_threshold", json={"datasetId": upload["datasetId"], "threshold": 0.5}
+        ).get_json()
+        self.assertNotIn("error", vt)
+        self.assertLess(vt["numFeaturesSelected"], 300)
+
+
+class TestCheckpointing(unittest.TestCase):
+    """Tests for checkpointing and resuming GA runs"""
+
+    def setUp(self):
+        X, y = make_classification(n_samples=200, n_features=10, n_informative=4, random_state=0)
+        self.split = train_test_split(X, y, test_size=0.3, random_state=42)
+        self.headers = [f"f{i}" for i in range(10)]
+        self.dir = temp_dir(self)
+
+    def test_resume_continues_bit_for_bit(self):
+        """Test that stopping at a checkpoint and resuming matches an uninterrupted run"""
+        params = dict(pop_size=8, crossover_rate=0.7, mutation_rate=0.1, seed=3)
+        full = run_ga_feature_selection(*self.split, self.headers, max_gen=6, **params)
+
+        path = os.path.join(self.dir, "run.npz")
+        run_ga_feature_selection(
+            *self.split, self.headers, max_gen=3, checkpoint_path=path, checkpoint_interval=2, **params
+        )
+        state = load_checkpoint(path)
+        self.assertEqual(state["generation"], 3)
+        resumed = run_ga_feature_selection(*self.split, self.headers, max_gen=6, resume_state=state, **params)
+
+        self.assertEqual(resumed["history"], full["history"])
+        self.assertEqual(resumed["best_chromosome"], full["best_chromosome"])
+        np.testing.assert_array_equal(resumed["final_population"], full["final_population"])
+
+    def test_resume_endpoint(self):
+        """Test that /run_ga can resume a run from its checkpoint ID"""
+        client = app.test_client()
+        body = {"csvData": make_csv(), "targetColumn": 6, "idColumn": 0, "popSize": 6}
+        with mock.patch("app.CHECKPOINT_DIR", self.dir):
+            first = client.post("/run_ga", json={**body, "maxGen": 2, "checkpointInterval": 1}).get_json()
+            self.assertIn("checkpointId", first)
+            status = client.get(f"/checkpoints/{first['checkpointId']}").get_json()
+            self.assertEqual(status["generation"], 2)
+
+            resumed = client.post(
+                "/run_ga", json={"resumeFrom": first["checkpointId"], "maxGen": 4}
+            ).get_json()
+        self.assertEqual(resumed["resumedFromGeneration"], 2)
+        self.assertEqual(resumed["history"][:2], first["history"])
+        self.assertEqual(resumed["generations"], 4)
+
+
+class TestResultCache(unittest.TestCase):
+    """Tests for seeded runs and the on-disk result cache"""
+
+    def setUp(self):
+        self.dir = temp_dir(self)
+
+    def test_seeded_requests_are_served_from_cache(self):
+        """Test that a repeated seeded request is a cache hit and unseeded ones are not cached"""
+        client = app.test_client()
+        body = {"csvData": make_csv(), "targetColumn": 6, "idColumn": 0, "popSize": 6, "maxGen": 2, "seed": 4}
+        with mock.patch.object(result_cache, "directory", self.dir):
+            first = client.post("/run_ga", json=body).get_json()
+            second = client.post("/run_ga", json=body).get_json()
+            unseeded = client.post("/run_ga", json={**body, "seed": None}).get_json()
+        self.assertFalse(first["cached"])
+        self.assertTrue(second["cached"])
+        self.assertEqual(second["bestChromosome"], first["bestChromosome"])
+        self.assertFalse(unseeded["cached"])
+        self.assertEqual(len(os.listdir(self.dir)), 1)
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest result file goes first once the size cap is exceeded"""
+        cache = ResultCache(self.dir, max_bytes=250)
+        payload = {"value": "x" * 100}
+        for i, key in enumerate(("a", "b")):
+            cache.put(key, payload)
+            os.utime(os.path.join(self.dir, f"{key}.json"), (i, i))
+        cache.get("a")
+        cache.put("c", payload)
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats()["results"], 2)
+
+
+class TestScreening(unittest.TestCase):
+    """Tests for univariate pre-screening before the GA"""
+
+    def test_screen_features_keeps_informative_columns(self):
+        """Test that top-k screening keeps the informative features"""
+        rng = np.random.default_rng(0)
+        y = rng.integers(0, 2, 300)
+        X = rng.normal(size=(300, 20))
+        X[:, [4, 9, 15]] += 2 * y[:, None]
+        kept, scores = screen_features(X, y, "f_classif", top_k=3)
+        self.assertEqual(kept.tolist(), [4, 9, 15])
+        self.assertEqual(len(scores), 20)
+        kept, _ = screen_features(X, y, "variance", threshold=1e9)
+        self.assertEqual(len(kept), 1)
+
+    def test_ga_runs_on_screened_features(self):
+        """Test that results are mapped back to the full feature list"""
+        client = app.test_client()
+        body = {"csvData": make_csv(), "targetColumn": 6, "idColumn": 0, "popSize": 6, "maxGen": 2}
+        result = client.post("/run_ga", json={**body, "screening": {"method": "f_classif", "topK": 2}}).get_json()
+        self.assertEqual(result["screening"]["featuresAfter"], 2)
+        self.assertEqual(len(result["bestChromosome"]), 5)
+        kept = set(result["screening"]["keptFeatures"])
+        self.assertTrue(set(result["selectedFeatures"]) <= kept)
+        headers = ["f0", "f1", "f2", "f3", "f4"]
+        self.assertEqual(
+            [h for h, g in zip(headers, result["bestChromosome"]) if g], result["selectedFeatures"]
+        )
+
+        biased = client.post("/run_ga", json={**body, "screening": {"method": "variance", "bias": True}}).get_json()
+        self.assertNotIn("error", biased)
+        self.assertTrue(biased["screening"]["biasedInitialPopulation"])
+
+
+class TestBatchRunner(unittest.TestCase):
+    """Tests for the headless manifest batch runner"""
+
+    def test_runs_manifest_and_writes_jsonl(self):
+        """Test that every dataset x run pair produces one JSON line"""
+        from batch import main
+
+        use_temp_result_cache(self)
+        directory = temp_dir(self)
+        with open(os.path.join(directory, "data.csv"), "w") as f:
+            f.write(make_csv())
+        manifest = {
+            "datasets": [{"name": "demo", "path": "data.csv", "targetColumn": 6, "idColumn": 0}],
+            "runs": [
+                {"method": "ga", "params": {"popSize": 6, "maxGen": 2, "seed": 1}},
+                {"method": "variance_threshold", "params": {"threshold": 0.0}},
+            ],
+        }
+        manifest_path = os.path.join(directory, "manifest.json")
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f)
+        output = os.path.join(directory, "results.jsonl")
+
+        self.assertEqual(main([manifest_path, "--output", output, "--workers", "2"]), 0)
+        with open(output) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(sorted(r["method"] for r in records), ["ga", "variance_threshold"])
+        self.assertTrue(all(r["status"] == "ok" and r["dataset"] == "demo" for r in records))
+
+        manifest["runs"] = [{"method": "lasso"}]
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f)
+        self.assertEqual(main([manifest_path, "--output", output]), 2)
+
+    def test_runs_default_to_one_worker(self):
+        """Test that runs inside the batch pool do not start a process pool per core"""
+        from batch import run_task
+
+        use_temp_result_cache(self)
+        path = os.path.join(temp_dir(self), "data.csv")
+        with open(path, "w") as f:
+            f.write(make_csv())
+        dataset = {"name": "demo", "path": path, "format": "csv", "targetColumn": 6, "idColumn": 0}
+        run = {"name": "islands", "method": "ga", "params": {"popSize": 6, "maxGen": 2, "islands": 2}}
+        with mock.patch("app.os.cpu_count", return_value=8):
+            record = run_task({"dataset": dataset, "run": run})
+        self.assertEqual(record["status"], "ok")
+        self.assertEqual(record["result"]["workers"], 1)
+        self.assertNotIn("workers", record["params"])
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Tests for per-phase timings and the /metrics endpoint"""
+
+    def setUp(self):
+        self.client = app.test_client()
+
+    def test_timings_block_and_metrics(self):
+        """Test that timings are opt-in and that fits and requests are counted"""
+        body = {"csvData": make_csv(random_state=11), "targetColumn": 6, "idColumn": 0,
+                "popSize": 4, "maxGen": 2}
+        result = self.client.post("/run_ga", json={**body, "timings": True}).get_json()
+        for phase in ("csv_parse", "cleaning", "split", "fitness_evaluation", "breeding"):
+            self.assertIn(phase, result["timings"])
+        untimed = self.client.post("/run_ga", json=body).get_json()
+        self.assertNotIn("timings", untimed)
+
+        response = self.client.get("/metrics")
+        self.assertTrue(response.content_type.startswith("text/plain"))
+        text = response.get_data(as_text=True)
+        self.assertIn('ga_fitness_fits_total{mode="serial"}', text)
+        self.assertIn('http_requests_total{endpoint="/run_ga",method="POST",status="200"}', text)
+        self.assertIn('http_request_duration_seconds_count{endpoint="/run_ga",method="POST"}', text)
+        self.assertIn("dataset_rows_bucket", text)
+
+
+class TestBaselineComparison(unittest.TestCase):
+    """Tests for running baseline selectors alongside the GA"""
+
+    def setUp(self):
+        use_temp_result_cache(self)
+
+    def test_comparison_reports_every_baseline(self):
+        """Test that each registered baseline runs and is timed"""
+        client = app.test_client()
+        result = client.post("/run_comparison", json={
+            "csvData": make_csv(), "targetColumn": 6, "idColumn": 0,
+            "popSize": 4, "maxGen": 2, "k": 2,
+        }).get_json()
+        self.assertEqual(set(result["baselines"]), {"variance_threshold", "kbest_f_classif", "mutual_info"})
+        self.assertEqual(result["baselines"]["kbest_f_classif"]["numFeaturesSelected"], 2)
+        self.assertEqual(result["varianceThreshold"]["numFeaturesSelected"], 5)
+        for baseline in result["baselines"].values():
+            self.assertLessEqual(baseline["execTimeSeconds"], result["wallTimeSeconds"])
+
+        unknown = client.post("/run_comparison", json={
+            "csvData": make_csv(), "targetColumn": 6, "baselines": ["lasso"],
+        }).get_json()
+        self.assertIn("error", unknown)
+
+    def test_invalid_ga_parameters_return_error(self):
+        """Test that a GA parameter rejected mid-run is reported as a JSON error"""
+        response = app.test_client().post("/run_comparison", json={
+            "csvData": make_csv(), "targetColumn": 6, "idColumn": 0,
+            "popSize": -1, "maxGen": 2,
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("negative dimensions", response.get_json()["error"])
+
+
+class TestSweep(unittest.TestCase):
+    """Tests for the hyperparameter sweep endpoint"""
+
+    def setUp(self):
+        self.client = app.test_client()
+
+    def test_grid_sweep_ranks_and_shares_cache(self):
+        """Test that a grid sweep runs every combination on one fitness cache"""
+        result = self.client.post("/sweep", json={
+            "csvData": make_csv(), "targetColumn": 6, "idColumn": 0, "maxGen": 3, "workers": 2,
+            "grid": {"popSize": [6, 8], "mutRate": [0.05, 0.2]},
+        }).get_json()
+        self.assertEqual(result["configurations"], 4)
+        leaderboard = result["leaderboard"]
+        self.assertEqual([entry["rank"] for entry in leaderboard], [1, 2, 3, 4])
+        self.assertEqual(
+            sorted((e["params"]["popSize"], e["params"]["mutRate"]) for e in leaderboard),
+            [(6, 0.05), (6, 0.2), (8, 0.05), (8, 0.2)],
+        )
+        accuracies = [entry["accuracy"] for entry in leaderboard]
+        self.assertEqual(accuracies, sorted(accuracies, reverse=True))
+        self.assertGreater(result["fitnessCache"]["hits"], 0)
+
+    def test_random_sweep_and_validation(self):
+        """Test that a random sweep draws the requested samples within range"""
+        result = self.client.post("/sweep", json={
+            "csvData": make_csv(), "targetColumn": 6, "maxGen": 2,
+            "random": {"samples": 3, "seed": 0, "space": {"popSize": [4, 8], "crossRate": [0.5, 0.9]}},
+        }).get_json()
+        self.assertEqual(len(result["leaderboard"]), 3)
+        for entry in result["leaderboard"]:
+            self.assertTrue(4 <= entry["params"]["popSize"] <= 8)
+            self.assertTrue(0.5 <= entry["params"]["crossRate"] <= 0.9)
+
+        bad = self.client.post("/sweep", json={
+            "csvData": make_csv(), "targetColumn": 6, "grid": {"learningRate": [0.1]},
+        }).get_json()
+        self.assertIn("error", bad)
+
+    def test_default_workers_follow_backend(self):
+        """Test that sweeps only default to several threads for GIL-releasing backends"""
+        body = {"csvData": make_csv(), "targetColumn": 6, "idColumn": 0, "maxGen": 2,
+                "grid": {"popSize": [4, 6], "mutRate": [0.05, 0.2]}}
+        with mock.patch("app.os.cpu_count", return_value=8):
+            sgd = self.client.post("/sweep", json=body).get_json()
+            batched = self.client.post("/sweep", json={**body, "fitnessBackend": "batched"}).get_json()
+        self.assertEqual(sgd["workers"], 1)
+        self.assertEqual(batched["workers"], 4)
+        self.assertEqual(batched["completed"], 4)
+
+
+class TestStartup(unittest.TestCase):
+    """Tests for lazy imports and preloading"""
+
+    def test_import_is_lazy_and_warm_up_preloads(self):
+        """Test that importing the app skips heavy modules until warm_up loads them"""
+        import subprocess
+        import sys
+
+        directory = temp_dir(self)
+        path = os.path.join(directory, "data.csv")
+        with open(path, "w") as f:
+            f.write(make_csv())
+        probe = (
+            "import json, sys, app\n"
+            "before = [m for m in app.HEAVY_MODULES if m in sys.modules]\n"
+            "ids = app.warm_up([{'path': sys.argv[1], 'targetColumn': 6, 'idColumn': 0}])\n"
+            "after = [m for m in app.HEAVY_MODULES if m in sys.modules]\n"
+            "print(json.dumps([before, after, app.dataset_store.get(ids[0]).rows]))\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", probe, path], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout
+        before, after, rows = json.loads(out)
+        self.assertEqual(before, [])
+        self.assertEqual(len(after), 6)
+        self.assertGreater(rows, 0)
+
+
+class TestChunkedFitness(unittest.TestCase):
+    """Tests for the out-of-core partial_fit fitness backend"""
+
+    def test_chunked_fitness_on_memmap(self):
+        """Test that chunked training on a memory-mapped split scores like the full fit"""
+        with tempfile.TemporaryDirectory() as storage_dir:
+            dataset, error = ingest_csv_stream(
+                io.BytesIO(make_csv(n_samples=400).encode()), 6, 0, storage_dir=storage_dir
+            )
+            self.assertIsNone(error)
+            X_train, X_test, y_train, y_test = dataset.split
+            chromosome = [1, 1, 1, 1, 1]
+            full = evaluate_fitness(chromosome, X_train, X_test, y_train, y_test)
+            chunked = evaluate_fitness_chunked(
+                chromosome, X_train, X_test, y_train, y_test, chunk_rows=32, epochs=5
+            )
+            self.assertGreater(chunked, 0.5)
+            self.assertLess(abs(chunked - full), 0.15)
+            with ChunkedFitness(X_train, X_test, y_train, y_test, 32, 5, n_workers=2) as backend:
+                self.assertEqual(backend.map([chromosome, [0] * 5]), [chunked, 0.0])
+            dataset.release()
+
+    def test_chunked_backend_request(self):
+        """Test that /run_ga accepts the chunked backend and validates its options"""
+        client = app.test_client()
+        body = {
+            "csvData": make_csv(), "targetColumn": 6, "idColumn": 0, "popSize": 6, "maxGen": 2,
+            "fitnessBackend": "chunked", "chunkRows": 16, "epochs": 2,
+        }
+        result = client.post("/run_ga", json=body).get_json()
+        self.assertEqual(result["fitnessBackend"], "chunked")
+        self.assertGreater(result["bestFitness"], 0)
+        bad = client.post("/run_ga", json={**body, "chunkRows": 0}).get_json()
+        self.assertIn("error", bad)
+
+
+class TestCompactResponses(unittest.TestCase):
+    """Tests for the opt-in bit-packed, gzipped response encoding"""
+
+    def setUp(self):
+        use_temp_result_cache(self)
+
+    def test_compact_ga_response(self):
+        """Test that a compact GA response decodes to the plain one"""
+        import gzip
+
+        client = app.test_client()
+        body = {
+            "csvData": make_csv(n_features=300), "targetColumn": 301, "idColumn": 0,
+            "popSize": 4, "maxGen": 2, "seed": 5,
+        }
+        plain = client.post("/run_ga", json=body).get_json()
+        response = client.post("/run_ga", json={**body, "compact": True}, headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        compact = json.loads(gzip.decompress(response.data))
+
+        headers = compact["featureHeaders"]
+        chromosome = unpack_chromosome(compact["bestChromosome"], len(headers))
+        self.assertEqual(chromosome, plain["bestChromosome"])
+        self.assertEqual([h for h, gene in zip(headers, chromosome) if gene], plain["selectedFeatures"])
+
+        again = client.post("/run_ga", json={
+            **body, "compact": True, "featureHeadersDigest": compact["featureHeadersDigest"],
+        }).get_json()
+        self.assertNotIn("featureHeaders", again)
+        self.assertEqual(again["bestChromosome"], compact["bestChromosome"])
+
+    def test_compact_comparison_uses_indices(self):
+        """Test that comparison selections become indices into the header list"""
+        client = app.test_client()
+        body = {"csvData": make_csv(), "targetColumn": 6, "idColumn": 0, "popSize": 4, "maxGen": 2, "k": 2}
+        compact = client.post("/run_comparison", json={**body, "compact": True}).get_json()
+        self.assertNotIn("varianceThreshold", compact)
+        headers = compact["featureHeaders"]
+        kbest = compact["baselines"]["kbest_f_classif"]
+        self.assertNotIn("removedFeatures", kbest)
+        self.assertEqual(len(kbest["selectedFeatures"]), 2)
+        self.assertTrue(all(0 <= i < len(headers) for i in compact["ga"]["selectedFeatures"]))
+
+
+class TestRunBudgetsAndAdmission(unittest.TestCase):
+    """Tests for per-run budgets and the bounded GA run queue"""
+
+    def setUp(self):
+        use_temp_result_cache(self)
+
+    def test_budgets_return_best_so_far(self):
+        """Test that time and evaluation budgets stop a long run early"""
+        client = app.test_client()
+        body = {"csvData": make_csv(), "targetColumn": 6, "idColumn": 0, "popSize": 6, "maxGen": 100000}
+        timed = client.post("/run_ga", json={**body, "timeBudgetSeconds": 0.5}).get_json()
+        self.assertEqual(timed["budget"]["exhaustedBy"], "time")
+        self.assertLess(timed["generations"], 100000)
+        self.assertGreater(timed["bestFitness"], 0)
+
+        counted = client.post("/run_ga", json={**body, "evaluationBudget": 10, "seed": 2}).get_json()
+        self.assertEqual(counted["budget"]["exhaustedBy"], "evaluations")
+        self.assertGreaterEqual(counted["budget"]["evaluationsUsed"], 10)
+        self.assertIn("error", client.post("/run_ga", json={**body, "timeBudgetSeconds": 0}).get_json())
+
+    def test_evaluation_budget_counts_full_fits_under_halving(self):
+        """Test that subsample scores under halving do not use up an evaluation budget"""
+        X, y = make_classification(n_samples=1500, n_features=12, n_informative=6, random_state=0)
+        split = train_test_split(X, y, test_size=0.3, random_state=42)
+        headers = [f"f{i}" for i in range(12)]
+        kwargs = dict(
+            pop_size=12, crossover_rate=0.7, mutation_rate=0.1, max_gen=1000, seed=0,
+            evaluation_strategy="halving", fidelity_levels=3, promotion_ratio=0.5,
+        )
+        result = run_ga_feature_selection(*split, headers, budget=RunBudget(evaluations=30), **kwargs)
+        budget = result["budget_stats"]
+        self.assertEqual(budget["exhaustedBy"], "evaluations")
+        self.assertEqual(budget["evaluationsUsed"], result["racing_stats"]["fullFits"])
+        self.assertGreaterEqual(budget["evaluationsUsed"], 30)
+        self.assertLess(budget["evaluationsUsed"], result["cache_stats"]["misses"])
+
+        islands = run_island_ga(
+            *split, headers, n_islands=2, migration_interval=2, n_workers=1,
+            budget=RunBudget(evaluations=30), **kwargs,
+        )
+        budget = islands["budget_stats"]
+        self.assertEqual(budget["exhaustedBy"], "evaluations")
+        self.assertEqual(budget["evaluationsUsed"], islands["racing_stats"]["fullFits"])
+        self.assertLess(budget["evaluationsUsed"], islands["cache_stats"]["misses"])
+
+    def test_queue_is_bounded(self):
+        """Test that runs beyond the slots queue in order and overflow is rejected"""
+        admission = RunAdmission(max_running=1, max_queued=1)
+        first = admission.enter()
+        second = admission.enter()
+        self.assertEqual((first.position(), second.position()), (0, 1))
+        with self.assertRaises(QueueFull) as caught:
+            admission.enter()
+        self.assertEqual(caught.exception.info["queuePosition"], 2)
+        admission.leave(first)
+        self.assertTrue(admission.wait(second))
+        admission.leave(second)
+        self.assertEqual(admission.stats()["running"], 0)
+
+        client = app.test_client()
+        with mock.patch.object(run_admission, "max_running", 0), mock.patch.object(run_admission, "max_queued", 0):
+            response = client.post("/run_ga", json={"csvData": make_csv(), "targetColumn": 6})
+            self.assertEqual(response.status_code, 429)
+            self.assertIn("Retry-After", response.headers)
+            self.assertEqual(client.post("/jobs", json={"kind": "ga"}).status_code, 429)
+
+    def test_cancelled_queued_job_summary(self):
+        """Test that a queued job can be read after it is cancelled and leaves the queue"""
+        admission = RunAdmission(max_running=0, max_queued=1)
+        ticket = admission.enter()
+        self.assertFalse(admission.wait(ticket, should_stop=lambda: True))
+        # The job is still "queued" until the runner finishes it.
+        self.assertIsNone(ticket.position())
+
+        client = app.test_client()
+        with mock.patch.object(run_admission, "max_running", 0):
+            job = client.post("/jobs", json={"kind": "ga", "csvData": make_csv(), "targetColumn": 6}).get_json()
+            self.assertEqual(job["queuePosition"], 1)
+            client.post(f"/jobs/{job['jobId']}/cancel")
+            for _ in range(100):
+                response = client.get(f"/jobs/{job['jobId']}")
+                self.assertEqual(response.status_code, 200)
+                if response.get_json()["status"] == "cancelled":
+                    break
+                time.sleep(0.05)
+        self.assertEqual(response.get_json()["status"], "cancelled")
+        self.assertEqual(run_admission.stats()["queued"], 0)
+
+
+class TestVarianceThresholdSweep(unittest.TestCase):
+    """Tests for sweeping VarianceThreshold over many thresholds"""
+
+    def setUp(self):
+        use_temp_result_cache(self)
+        self.client = app.test_client()
+        upload = self.client.post("/datasets", json={
+            "csvData": make_csv(n_samples=120, n_features=8), "targetColumn": 9, "idColumn": 0,
+        }).get_json()
+        self.dataset_id = upload["datasetId"]
+
+    def test_sweep_matches_single_thresholds(self):
+        """Test that each curve point matches a single-threshold run and masks are fitted once"""
+        thresholds = [0.0, 0.5, 0.5, 1.0, 2.0, 100.0]
+        result = self.client.post("/run_variance_threshold", json={
+            "datasetId": self.dataset_id, "thresholds": thresholds, "workers": 2,
+        }).get_json()
+        curve = result["curve"]
+        self.assertEqual([point["threshold"] for point in curve], thresholds)
+        self.assertLess(result["distinctMasks"], len(thresholds))
+        self.assertEqual(curve[-1], {"threshold": 100.0, "accuracy": 0.0, "numFeaturesSelected": 0})
+        for point in curve[:4]:
+            single = self.client.post("/run_variance_threshold", json={
+                "datasetId": self.dataset_id, "threshold": point["threshold"],
+            }).get_json()
+            self.assertEqual(point["accuracy"], single["accuracy"])
+            self.assertEqual(point["numFeaturesSelected"], single["numFeaturesSelected"])
+        self.assertEqual(result["accuracy"], max(point["accuracy"] for point in curve))
+        self.assertEqual(len(result["selectedFeatures"]), result["numFeaturesSelected"])
+
+    def test_threshold_range_and_validation(self):
+        """Test that a thresholdRange expands to evenly spaced thresholds and bad specs are rejected"""
+        result = self.client.post("/run_variance_threshold", json={
+            "datasetId": self.dataset_id, "thresholdRange": {"stop": 2.0, "num": 5},
+        }).get_json()
+        self.assertEqual([point["threshold"] for point in result["curve"]], [0.0, 0.5, 1.0, 1.5, 2.0])
+        counts = [point["numFeaturesSelected"] for point in result["curve"]]
+        self.assertEqual(counts, sorted(counts, reverse=True))
+
+        for body in ({"thresholds": []}, {"thresholds": [-1.0]}, {"thresholdRange": {"start": 0}}):
+            response = self.client.post("/run_variance_threshold", json={"datasetId": self.dataset_id, **body})
+            self.assertIn("error", response.get_json())
+
+
 if __name__ == '__main__':
     # Run tests with verbose output
     unittest.main(verbosity=2)